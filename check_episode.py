@@ -3,11 +3,13 @@
 
 import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.config_loader import load_config
 from utils.api_clients import SonarrAPI
+from utils.http_cache import SHORT_TTL, LONG_TTL
 
 # Load configuration
 config = load_config('config.yaml')
@@ -16,15 +18,16 @@ config = load_config('config.yaml')
 sonarr = SonarrAPI(config['sonarr']['url'], config['sonarr']['api_key'])
 
 print("Searching for My Hero Academia in Sonarr...")
+print("(API responses are cached for up to 10 minutes in ~/.cache/cc-media-automation)")
 print("=" * 80)
 
-# Get all series
-series_list = sonarr._request('GET', '/api/v3/series')
+# Look up series by name (returns only matching series, not the whole library)
+series_list = sonarr._request('GET', '/api/v3/series/lookup', params={'term': 'My Hero Academia'}, ttl=LONG_TTL)
 
-# Find My Hero Academia
+# Find My Hero Academia (lookup also returns shows not in the library; those have no ID)
 mha_series = None
 for series in series_list:
-    if 'My Hero Academia' in series.get('title', ''):
+    if series.get('id') and 'My Hero Academia' in series.get('title', ''):
         mha_series = series
         print(f"Found series: {series['title']}")
         print(f"Series ID: {series['id']}")
@@ -40,20 +43,28 @@ if not mha_series:
 print("Fetching episodes...")
 print("=" * 80)
 
-episodes = sonarr._request('GET', f"/api/v3/episode?seriesId={mha_series['id']}")
+# Fetch episodes and all episode files for the series in parallel
+# (independent requests), then index files by ID
+with ThreadPoolExecutor(max_workers=2) as executor:
+    episodes_future = executor.submit(
+        sonarr._request, 'GET', '/api/v3/episode', params={'seriesId': mha_series['id']}, ttl=SHORT_TTL
+    )
+    files_future = executor.submit(
+        sonarr._request, 'GET', '/api/v3/episodefile', params={'seriesId': mha_series['id']}, ttl=SHORT_TTL
+    )
+    episodes = episodes_future.result()
+    episode_files = files_future.result()
 
-# Find Season 8
-season_8_episodes = [ep for ep in episodes if ep.get('seasonNumber') == 8]
+files_by_id = {f['id']: f for f in episode_files}
 
-print(f"Found {len(season_8_episodes)} episodes in Season 8")
+# Index Season 8 episodes by episode number
+season_8_by_num = {ep.get('episodeNumber'): ep for ep in episodes if ep.get('seasonNumber') == 8}
+
+print(f"Found {len(season_8_by_num)} episodes in Season 8")
 print()
 
 # Check S08E08 specifically
-s08e08 = None
-for ep in season_8_episodes:
-    if ep.get('episodeNumber') == 8:
-        s08e08 = ep
-        break
+s08e08 = season_8_by_num.get(8)
 
 if s08e08:
     print("✓ S08E08 FOUND IN SONARR!")
@@ -68,8 +79,8 @@ if s08e08:
             file_id = s08e08['episodeFileId']
             print(f"Episode File ID: {file_id}")
 
-            # Fetch full file details
-            episode_file = sonarr._request('GET', f"/api/v3/episodefile/{file_id}")
+            # Look up file details from the series file index
+            episode_file = files_by_id.get(file_id)
             if episode_file:
                 print(f"File Path: {episode_file.get('path', 'N/A')}")
                 print(f"File Size: {episode_file.get('size', 0) / (1024**3):.2f} GB")
@@ -82,7 +93,7 @@ if s08e08:
 else:
     print("✗ S08E08 NOT FOUND")
     print("Available episodes in Season 8:")
-    for ep in sorted(season_8_episodes, key=lambda x: x.get('episodeNumber', 0)):
+    for ep in sorted(season_8_by_num.values(), key=lambda x: x.get('episodeNumber', 0)):
         ep_num = ep.get('episodeNumber')
         has_file = "✓" if ep.get('hasFile') else "✗"
         print(f"  {has_file} E{ep_num:02d}: {ep.get('title', 'N/A')}")
@@ -9,6 +9,9 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from utils.config_loader import load_config
 from utils.api_clients import SonarrAPI
+from utils.http_cache import SHORT_TTL, LONG_TTL
+
+PAGE_SIZE = 500
 
 # Load configuration
 config = load_config('config.yaml')
@@ -20,46 +23,88 @@ sonarr = SonarrAPI(
 )
 
 print("Fetching Sonarr import history...")
+print("(API responses are cached for up to 10 minutes in ~/.cache/cc-media-automation)")
 print("=" * 80)
 
-# Get history
-history = sonarr._request('GET', '/api/v3/history', params={'eventType': 3, 'pageSize': 10000})
+# Resolve series ID so history can be filtered server-side
+# (lookup also returns shows not in the library; those have no ID)
+mha_series = None
+for series in sonarr._request('GET', '/api/v3/series/lookup', params={'term': 'My Hero Academia'}, ttl=LONG_TTL):
+    if series.get('id') and 'My Hero Academia' in series.get('title', ''):
+        mha_series = series
+        break
+
+params = {'eventType': 3, 'pageSize': PAGE_SIZE}
+if mha_series:
+    print(f"Filtering history by series: {mha_series['title']} (ID: {mha_series['id']})")
+    params['seriesIds'] = mha_series['id']
+else:
+    print("Series not found in Sonarr, scanning full import history")
 
-if history and 'records' in history:
-    print(f"Total import records: {len(history['records'])}")
-    print()
+print()
+print("Searching for 'My Hero Academia' entries...")
+print("=" * 80)
 
-    # Search for My Hero Academia
-    print("Searching for 'My Hero Academia' entries...")
-    print("=" * 80)
+# Stream history page by page: only the current page and the matches are
+# kept in memory, instead of the whole import history at once
+needle = 'My Hero Academia'
+total_records = 0
+found = 0
+s08e08_records = []
+page = 1
+
+while True:
+    history = sonarr._request('GET', '/api/v3/history', params={**params, 'page': page}, ttl=SHORT_TTL)
+    records = history.get('records', []) if history else []
+    total_records += len(records)
 
-    found = 0
-    for record in history['records']:
+    for record in records:
         series_title = record.get('series', {}).get('title', '')
         source_title = record.get('sourceTitle', '')
         dropped_path = record.get('data', {}).get('droppedPath', '')
 
-        if 'My Hero Academia' in series_title or 'My Hero Academia' in source_title or 'My Hero Academia' in dropped_path:
+        # Series title first: when history is filtered by series ID it
+        # matches on every record, so the other fields are never joined.
+        # Otherwise one substring test over the remaining fields (NUL can't
+        # appear in titles or paths, so a match never spans two fields).
+        if needle in series_title or needle in f"{source_title}\x00{dropped_path}":
             found += 1
-            print(f"\n--- Import #{found} ---")
-            print(f"Series: {series_title}")
-            print(f"Source Title: {source_title}")
-            print(f"Dropped Path: {dropped_path}")
 
-            # Extract filename from droppedPath
+            # Build the whole block and print it in one call
+            lines = [
+                f"\n--- Import #{found} ---",
+                f"Series: {series_title}",
+                f"Source Title: {source_title}",
+                f"Dropped Path: {dropped_path}",
+            ]
+
+            # Extract filename from droppedPath (plain string split; no Path
+            # object needed just to take the last component)
             if dropped_path:
-                filename = Path(dropped_path).name
-                print(f"Extracted Filename: {filename}")
+                filename = dropped_path.rpartition('/')[2]
+                lines.append(f"Extracted Filename: {filename}")
 
             # Show episode info
             episode = record.get('episode', {})
             if episode:
                 season = episode.get('seasonNumber', 'N/A')
                 ep_num = episode.get('episodeNumber', 'N/A')
-                print(f"Episode: S{season:02d}E{ep_num:02d}")
+                lines.append(f"Episode: S{season:02d}E{ep_num:02d}")
+
+                # Keep S08E08 records for the specific check below
+                if season == 8 and ep_num == 8 and needle in series_title:
+                    s08e08_records.append(record)
+
+            print('\n'.join(lines))
 
+    if len(records) < PAGE_SIZE:
+        break
+    page += 1
+
+if total_records:
     print()
     print("=" * 80)
+    print(f"Total import records scanned: {total_records}")
     print(f"Found {found} 'My Hero Academia' import records")
 
     # Check specifically for S08E08
@@ -67,29 +112,26 @@ if history and 'records' in history:
     print("Checking specifically for S08E08...")
     print("=" * 80)
 
-    for record in history['records']:
-        episode = record.get('episode', {})
-        if episode and episode.get('seasonNumber') == 8 and episode.get('episodeNumber') == 8:
-            series_title = record.get('series', {}).get('title', '')
-            if 'My Hero Academia' in series_title:
-                print(f"\n✓ FOUND S08E08:")
-                print(f"  Series: {series_title}")
-                print(f"  Source Title: {record.get('sourceTitle', '')}")
-                print(f"  Dropped Path: {record.get('data', {}).get('droppedPath', '')}")
-
-                dropped_path = record.get('data', {}).get('droppedPath', '')
-                if dropped_path:
-                    filename = Path(dropped_path).name
-                    print(f"  Filename: {filename}")
-
-                    # Check if it matches the file in _done
-                    target_file = "My Hero Academia S08E08 VOSTFR 1080p WEB x264 AAC -Tsundere-Raws (CR).mkv"
-                    if filename == target_file:
-                        print(f"  ✓✓✓ EXACT MATCH with file in _done!")
-                    else:
-                        print(f"  ✗✗✗ NO MATCH with file in _done")
-                        print(f"      Expected: {target_file}")
-                        print(f"      Got:      {filename}")
+    for record in s08e08_records:
+        series_title = record.get('series', {}).get('title', '')
+        dropped_path = record.get('data', {}).get('droppedPath', '')
+        print(f"\n✓ FOUND S08E08:")
+        print(f"  Series: {series_title}")
+        print(f"  Source Title: {record.get('sourceTitle', '')}")
+        print(f"  Dropped Path: {dropped_path}")
+
+        if dropped_path:
+            filename = dropped_path.rpartition('/')[2]
+            print(f"  Filename: {filename}")
+
+            # Check if it matches the file in _done
+            target_file = "My Hero Academia S08E08 VOSTFR 1080p WEB x264 AAC -Tsundere-Raws (CR).mkv"
+            if filename == target_file:
+                print(f"  ✓✓✓ EXACT MATCH with file in _done!")
+            else:
+                print(f"  ✗✗✗ NO MATCH with file in _done")
+                print(f"      Expected: {target_file}")
+                print(f"      Got:      {filename}")
 
 else:
     print("No history records found!")
@@ -29,20 +29,28 @@ import sys
 import argparse
 import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config_loader import load_config
 from utils.logger import setup_logging
-from utils.ntfy_notifier import create_notifier
 from utils.validators import acquire_lock
-from utils.api_clients import RadarrAPI, SonarrAPI, JellyfinAPI, APIError
+
+# utils.api_clients and utils.ntfy_notifier (and with them requests) are
+# imported inside the functions that need them, so a cron run that exits
+# early doesn't pay for loading them
 
 
 CHECKPOINT_FILE = 'jellyfin_notify_checkpoint.json'
+HISTORY_PAGE_SIZE = 100
+MIN_CHECK_INTERVAL = timedelta(minutes=1)
 
 
 def load_checkpoint(checkpoint_path: str) -> datetime:
@@ -54,34 +62,126 @@ def load_checkpoint(checkpoint_path: str) -> datetime:
     Returns:
         Last check time, or 1 hour ago if no checkpoint exists
     """
-    if os.path.exists(checkpoint_path):
-        try:
-            with open(checkpoint_path, 'r') as f:
-                data = json.load(f)
-                return datetime.fromisoformat(data['last_check'])
-        except (json.JSONDecodeError, KeyError, ValueError):
-            pass
-
-    # Default to 1 hour ago if no checkpoint
-    return datetime.now() - timedelta(hours=1)
+    try:
+        with open(checkpoint_path, 'r') as f:
+            data = json.load(f)
+            return datetime.fromisoformat(data['last_check'])
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, ValueError):
+        # Default to 1 hour ago if no (valid) checkpoint
+        return datetime.now() - timedelta(hours=1)
 
 
-def save_checkpoint(checkpoint_path: str, check_time: datetime) -> None:
+def save_checkpoint(checkpoint_path: str, check_time: datetime,
+                    last_saved: Optional[datetime] = None) -> bool:
     """Save checkpoint with last check time.
 
+    The file is written to a temporary path and moved into place, so a
+    crash mid-write never leaves a truncated checkpoint behind (which
+    would silently fall back to a 1 hour rescan).
+
     Args:
         checkpoint_path: Path to checkpoint file
         check_time: Time to save
+        last_saved: Previously saved time; the write is skipped if
+            check_time is within a second of it
+
+    Returns:
+        True if the checkpoint was written, False if skipped
     """
-    with open(checkpoint_path, 'w') as f:
+    if last_saved and abs((check_time - last_saved).total_seconds()) < 1:
+        return False
+
+    tmp_path = checkpoint_path + '.tmp'
+    with open(tmp_path, 'w') as f:
         json.dump({
             'last_check': check_time.isoformat(),
             'last_check_formatted': check_time.strftime('%Y-%m-%d %H:%M:%S')
         }, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, checkpoint_path)
+    return True
+
+
+@lru_cache(maxsize=None)
+def _get_client(service: str, url: str, api_key: str):
+    """Return a shared API client for a service.
+
+    Clients are cached per (service, url, api_key), so repeated calls in
+    the same process reuse one instance and its pooled HTTP session.
+
+    Args:
+        service: 'radarr', 'sonarr' or 'jellyfin'
+        url: Service base URL
+        api_key: Service API key
+
+    Returns:
+        RadarrAPI, SonarrAPI or JellyfinAPI instance
+    """
+    from utils.api_clients import RadarrAPI, SonarrAPI, JellyfinAPI
+
+    client_classes = {'radarr': RadarrAPI, 'sonarr': SonarrAPI, 'jellyfin': JellyfinAPI}
+    return client_classes[service](url, api_key)
+
+
+def _any_new_since(api, since: datetime) -> bool:
+    """Check whether the newest import event is after a given time.
+
+    Requests a single record, so the common "nothing new" case costs one
+    tiny request instead of a full history page.
+
+    Args:
+        api: RadarrAPI or SonarrAPI client
+        since: Reference time
+
+    Returns:
+        True if at least one import event is newer than ``since``
+    """
+    records = api.get_history(event_type=3, page=1, page_size=1)
+    if not records:
+        return False
+
+    return records[0]['date'][:19] > since.strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _iter_history(api, since: datetime, page_size: int = HISTORY_PAGE_SIZE):
+    """Yield import events newer than a given time, newest first.
+
+    Pages through history sorted by date (descending) and stops at the
+    first record at or before ``since``, so a quiet period costs a single
+    small request instead of a full history pull.
+
+    Args:
+        api: RadarrAPI or SonarrAPI client
+        since: Only yield events after this time
+        page_size: Records requested per page
+
+    Yields:
+        History event dictionaries (eventType 3 = DownloadFolderImported)
+    """
+    # *arr dates are ISO-8601 ('2024-01-15T10:30:00Z' or with milliseconds),
+    # so comparing the first 19 characters as strings orders them correctly
+    # without building a datetime for every record
+    since_iso = since.strftime('%Y-%m-%dT%H:%M:%S')
+
+    page = 1
+    while True:
+        # Movie/series/episode objects are needed for the notification text
+        records = api.get_history(event_type=3, page=page, page_size=page_size, include_details=True)
+
+        for record in records:
+            if record['date'][:19] <= since_iso:
+                return
+            yield record
+
+        if len(records) < page_size:
+            return
+        page += 1
 
 
 def check_recent_imports(config: dict, since: datetime, logger) -> bool:
-    """Check if there are recent imports in Radarr or Sonarr.
+    """Check if there are recent imports in Radarr or Sonarr (parallelized).
 
     Args:
         config: Configuration dictionary
@@ -91,75 +191,74 @@ def check_recent_imports(config: dict, since: datetime, logger) -> bool:
     Returns:
         True if recent imports found, False otherwise
     """
-    has_imports = False
+    from utils.api_clients import APIError
+
+    def check_radarr() -> bool:
+        """Check Radarr history for recent imports."""
+        try:
+            logger.info("Checking Radarr for recent imports...")
+            radarr = _get_client('radarr', config['radarr']['url'], config['radarr']['api_key'])
+
+            # Cheap probe first; only page through history if something is new
+            if not _any_new_since(radarr, since):
+                logger.info("No recent Radarr imports")
+                return False
+
+            # Import events since last check (stops paging at the checkpoint)
+            recent_events = list(_iter_history(radarr, since))
+
+            if recent_events:
+                logger.info(f"Found {len(recent_events)} recent Radarr imports")
+                for event in recent_events[:5]:  # Show first 5
+                    movie_title = event.get('movie', {}).get('title', 'Unknown')
+                    logger.info(f"  - {movie_title}")
+                return True
 
-    # Check Radarr
-    try:
-        logger.info("Checking Radarr for recent imports...")
-        radarr = RadarrAPI(config['radarr']['url'], config['radarr']['api_key'])
-
-        # Get all recent history events (no filter, will filter client-side)
-        # Note: Radarr v3 API has changed eventType filtering
-        history = radarr.get_history()
-
-        # Filter for import events since last check
-        # eventType: 3 = DownloadFolderImported
-        recent_events = []
-        for event in history:
-            # Filter by event type (3 = DownloadFolderImported)
-            if event.get('eventType') != 'downloadFolderImported':
-                continue
-
-            event_date = datetime.fromisoformat(event['date'].replace('Z', '+00:00'))
-            if event_date.replace(tzinfo=None) > since:
-                recent_events.append(event)
-
-        if recent_events:
-            logger.info(f"Found {len(recent_events)} recent Radarr imports")
-            for event in recent_events[:5]:  # Show first 5
-                movie_title = event.get('movie', {}).get('title', 'Unknown')
-                logger.info(f"  - {movie_title}")
-            has_imports = True
-        else:
             logger.info("No recent Radarr imports")
+            return False
 
-    except APIError as e:
-        logger.warning(f"Failed to check Radarr history: {e}")
+        except APIError as e:
+            logger.warning(f"Failed to check Radarr history: {e}")
+            return False
+
+    def check_sonarr() -> bool:
+        """Check Sonarr history for recent imports."""
+        try:
+            logger.info("Checking Sonarr for recent imports...")
+            sonarr = _get_client('sonarr', config['sonarr']['url'], config['sonarr']['api_key'])
+
+            # Cheap probe first; only page through history if something is new
+            if not _any_new_since(sonarr, since):
+                logger.info("No recent Sonarr imports")
+                return False
+
+            # Import events since last check (stops paging at the checkpoint)
+            recent_events = list(_iter_history(sonarr, since))
+
+            if recent_events:
+                logger.info(f"Found {len(recent_events)} recent Sonarr imports")
+                for event in recent_events[:5]:  # Show first 5
+                    series_title = event.get('series', {}).get('title', 'Unknown')
+                    episode_title = event.get('episode', {}).get('title', '')
+                    logger.info(f"  - {series_title}: {episode_title}")
+                return True
 
-    # Check Sonarr
-    try:
-        logger.info("Checking Sonarr for recent imports...")
-        sonarr = SonarrAPI(config['sonarr']['url'], config['sonarr']['api_key'])
-
-        # Get all recent history events (no filter, will filter client-side)
-        # Note: Sonarr v3 API has changed eventType filtering
-        history = sonarr.get_history()
-
-        # Filter for import events since last check
-        recent_events = []
-        for event in history:
-            # Filter by event type (downloadFolderImported)
-            if event.get('eventType') != 'downloadFolderImported':
-                continue
-
-            event_date = datetime.fromisoformat(event['date'].replace('Z', '+00:00'))
-            if event_date.replace(tzinfo=None) > since:
-                recent_events.append(event)
-
-        if recent_events:
-            logger.info(f"Found {len(recent_events)} recent Sonarr imports")
-            for event in recent_events[:5]:  # Show first 5
-                series_title = event.get('series', {}).get('title', 'Unknown')
-                episode_title = event.get('episode', {}).get('title', '')
-                logger.info(f"  - {series_title}: {episode_title}")
-            has_imports = True
-        else:
             logger.info("No recent Sonarr imports")
+            return False
 
-    except APIError as e:
-        logger.warning(f"Failed to check Sonarr history: {e}")
+        except APIError as e:
+            logger.warning(f"Failed to check Sonarr history: {e}")
+            return False
 
-    return has_imports
+    # Query Radarr and Sonarr in parallel (independent I/O-bound requests)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(check_radarr),
+            executor.submit(check_sonarr)
+        ]
+        results = [future.result() for future in futures]
+
+    return any(results)
 
 
 def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) -> bool:
@@ -174,7 +273,6 @@ def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) ->
         True if successful, False otherwise
     """
     logger = setup_logging('jellyfin_notify.log', level=config['logging']['level'])
-    notifier = create_notifier(config)
 
     logger.info("="*60)
     logger.info("JELLYFIN NOTIFY STARTED")
@@ -188,13 +286,32 @@ def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) ->
     if force:
         logger.info("FORCE MODE: Will refresh regardless of recent imports")
 
+    # Skip runs that follow the previous check too closely, e.g. an
+    # overlapping cron run that starts just after another one finished.
+    # The checkpoint mtime is checked before taking the lock or loading the
+    # API clients, so the duplicate run does no API traffic at all.
+    checkpoint_path = os.path.join(config['paths']['scripts'], CHECKPOINT_FILE)
+    if not force:
+        try:
+            checkpoint_age = time.time() - os.path.getmtime(checkpoint_path)
+        except FileNotFoundError:
+            checkpoint_age = None
+
+        if checkpoint_age is not None and checkpoint_age < MIN_CHECK_INTERVAL.total_seconds():
+            logger.info(f"Checkpoint updated {checkpoint_age:.0f}s ago by a recent run, skipping")
+            return True
+
+    from utils.ntfy_notifier import create_notifier
+    notifier = create_notifier(config)
+
     try:
+        from utils.api_clients import APIError
+
         # Acquire lock
         with acquire_lock('jellyfin_notify'):
             logger.info("Lock acquired, proceeding with check")
 
-            # Load checkpoint
-            checkpoint_path = os.path.join(config['paths']['scripts'], CHECKPOINT_FILE)
+            # Load checkpoint (re-read under the lock)
             last_check = load_checkpoint(checkpoint_path)
             logger.info(f"Last check: {last_check.strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -213,7 +330,8 @@ def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) ->
                     logger.info("[DRY-RUN] Would trigger Jellyfin library refresh")
                 else:
                     try:
-                        jellyfin = JellyfinAPI(
+                        jellyfin = _get_client(
+                            'jellyfin',
                             config['jellyfin']['url'],
                             config['jellyfin']['api_key']
                         )
@@ -223,8 +341,8 @@ def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) ->
 
                         # Update checkpoint
                         now = datetime.now()
-                        save_checkpoint(checkpoint_path, now)
-                        logger.info(f"Checkpoint updated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+                        if save_checkpoint(checkpoint_path, now, last_saved=last_check):
+                            logger.info(f"Checkpoint updated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
 
                     except APIError as e:
                         error_msg = f"Failed to trigger Jellyfin refresh: {e}"
@@ -238,8 +356,8 @@ def notify_jellyfin(config: dict, dry_run: bool = False, force: bool = False) ->
                 # Still update checkpoint
                 if not dry_run:
                     now = datetime.now()
-                    save_checkpoint(checkpoint_path, now)
-                    logger.info(f"Checkpoint updated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
+                    if save_checkpoint(checkpoint_path, now, last_saved=last_check):
+                        logger.info(f"Checkpoint updated: {now.strftime('%Y-%m-%d %H:%M:%S')}")
 
             logger.info("="*60)
             logger.info("JELLYFIN NOTIFY COMPLETED SUCCESSFULLY")
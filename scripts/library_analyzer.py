@@ -38,10 +38,15 @@ import sys
 import argparse
 import os
 import csv
+import json
 import time
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from operator import itemgetter
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -51,11 +56,76 @@ from utils.logger import setup_logging
 from utils.ntfy_notifier import create_notifier
 from utils.validators import acquire_lock
 from utils.api_clients import RadarrAPI, SonarrAPI, JellyfinAPI, ProwlarrAPI, APIError
+from utils.http_cache import CACHE_DIR, write_atomic
 
 
+# Unit conversions
+BYTES_PER_GB = 1024 ** 3
+BYTES_PER_MINUTE_TO_KBPS = 8 / (60 * 1000)   # bytes/minute -> kbit/s
+
+# Quality criterion points (qualities not listed score 0)
+QUALITY_POINTS = {'720p': 15, '480p': 25, 'unknown': 25}
+
+# Qualities scaled by thresholds.quality_weights (1080p+ protection)
+PROTECTED_QUALITIES = ('2160p', '1080p')
+
+# Prowlarr availability check
+PROWLARR_CONCURRENCY = 4        # Parallel searches (analyzer.prowlarr_concurrency)
+PROWLARR_MAX_RATE = 4           # Max searches started per second, 0 = unlimited (analyzer.prowlarr_max_rate)
+PROWLARR_CACHE_DAYS = 7         # Reuse indexer counts (analyzer.prowlarr_cache_days)
+PROWLARR_CACHE_FILE = CACHE_DIR / 'prowlarr_availability.json'
+
+# Parallel per-series episode file fetches (Sonarr)
+EPISODE_FETCH_WORKERS = 8
+
+# CSV report write buffer (bytes)
+REPORT_BUFFER_SIZE = 1 << 20
+
+# CSV report header (read back by library_reducer.py)
+REPORT_COLUMNS = (
+    'Title', 'Type', 'Quality', 'Size_GB', 'Score', 'Reason',
+    'Last_Watched', 'IMDB_Rating', 'Age_Days', 'Indexer_Count', 'ID', 'Path'
+)
+
+
+def parse_api_date(date_str: str) -> datetime:
+    """Parse an *arr/Jellyfin ISO-8601 timestamp into a naive datetime.
+
+    Only the 'YYYY-MM-DDTHH:MM:SS' prefix is parsed: the timezone suffix
+    ('Z') was stripped by the callers anyway, and the fractional part
+    (up to 7 digits from .NET) is irrelevant for day-based ages.
+
+    Args:
+        date_str: Timestamp such as '2024-01-15T10:30:00Z' or
+            '2024-01-15T10:30:00.0000000Z'
+
+    Returns:
+        Naive datetime (second precision)
+    """
+    return datetime.fromisoformat(date_str[:19])
+
+
+def quality_name(file_info: Dict[str, Any]) -> str:
+    """Get the quality name of a Radarr movie file or Sonarr episode file.
+
+    Args:
+        file_info: movieFile / episodefile dictionary
+
+    Returns:
+        Quality name (e.g., 'WEBDL-1080p'), or 'unknown'
+    """
+    if (quality := file_info.get('quality')) and (inner := quality.get('quality')):
+        return inner.get('name', 'unknown')
+    return 'unknown'
+
+
+@lru_cache(maxsize=64)
 def parse_quality(quality_str: str) -> str:
     """Extract resolution from quality string.
 
+    Memoized: Radarr/Sonarr only have a few dozen quality names, so each
+    distinct name is parsed once per run.
+
     Args:
         quality_str: Quality string from Radarr/Sonarr
 
@@ -76,23 +146,64 @@ def parse_quality(quality_str: str) -> str:
         return 'unknown'
 
 
-def calculate_deletion_score(item: Dict[str, Any], config: Dict) -> tuple[int, str]:
+def get_scoring_params(config: Dict) -> Dict[str, Any]:
+    """Collect the loop-invariant inputs of calculate_deletion_score.
+
+    Computed once per analysis run instead of once per item.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Keyword arguments for calculate_deletion_score
+
+    Example:
+        >>> scoring = get_scoring_params(config)
+        >>> score, reason = calculate_deletion_score(item, **scoring)
+    """
+    protected = config['analyzer']['protected']
+    quality_weights = config['thresholds']['quality_weights']
+
+    return {
+        'now': datetime.now(),
+        'criteria': config['analyzer']['criteria'],
+        'quality_factors': {q: quality_weights.get(q, 1.0) for q in PROTECTED_QUALITIES},
+        'recently_added_days': protected['recently_added_days'],
+        'protected_tags': frozenset(protected['tags']),
+    }
+
+
+def calculate_deletion_score(
+    item: Dict[str, Any],
+    *,
+    now: datetime,
+    criteria: Dict,
+    quality_factors: Dict[str, float],
+    recently_added_days: int,
+    protected_tags: frozenset
+) -> tuple[int, str]:
     """Calculate deletion score for an item (0-100).
 
     Higher score = better candidate for deletion.
 
     Args:
         item: Item dictionary with all metadata
-        config: Configuration dictionary
+        now: Reference time for "last watched" ages
+        criteria: config['analyzer']['criteria']
+        quality_factors: Score multiplier per high quality (1080p+)
+        recently_added_days: Items added fewer days ago get half score
+        protected_tags: Set of protected tags
 
     Returns:
         Tuple of (score, reason_summary)
     """
+    # Protected tags override everything else, so skip the scoring work
+    if not protected_tags.isdisjoint(item.get('tags', [])):
+        return 0, "protected by tag"
+
     score = 0.0
     reasons = []
 
-    criteria = config['analyzer']['criteria']
-
     # CRITERION 1: Watch History (35% weight)
     watch_weight = criteria['watch_history_weight']
     never_watched = not item.get('played', False)
@@ -105,7 +216,7 @@ def calculate_deletion_score(item: Dict[str, Any], config: Dict) -> tuple[int, s
         score += watch_score
         reasons.append(f"never watched ({age_months}mo old)")
     elif last_played:
-        days_since = (datetime.now() - last_played).days
+        days_since = (now - last_played).days
         if days_since > 730:  # 2 years
             score += 20
             reasons.append(f"last watched {days_since}d ago")
@@ -115,13 +226,10 @@ def calculate_deletion_score(item: Dict[str, Any], config: Dict) -> tuple[int, s
 
     # CRITERION 2: Quality (25% weight)
     quality = item.get('quality', 'unknown')
-    quality_weights = config['thresholds']['quality_weights']
 
-    if quality == '720p':
-        score += 15
-        reasons.append("720p quality")
-    elif quality in ['480p', 'unknown']:
-        score += 25
+    quality_points = QUALITY_POINTS.get(quality)
+    if quality_points:
+        score += quality_points
         reasons.append(f"{quality} quality")
 
     # Bonus for low bitrate
@@ -162,26 +270,18 @@ def calculate_deletion_score(item: Dict[str, Any], config: Dict) -> tuple[int, s
         reasons.append("large unwatched file")
 
     # Protection adjustments
-    protected = config['analyzer']['protected']
-
     # Recently added (< 30 days) - reduce score
-    if item.get('age_days', 999) < protected['recently_added_days']:
+    if item.get('age_days', 999) < recently_added_days:
         score *= 0.5
         reasons.append("recently added (protected)")
 
     # High quality protection (1080p+)
-    if quality in ['2160p', '1080p']:
-        protection_factor = quality_weights.get(quality, 1.0)
+    protection_factor = quality_factors.get(quality)
+    if protection_factor is not None:
         score *= protection_factor
         if protection_factor < 1.0:
             reasons.append(f"{quality} protected")
 
-    # Protected tags
-    item_tags = item.get('tags', [])
-    if any(tag in protected['tags'] for tag in item_tags):
-        score = 0
-        reasons = ["protected by tag"]
-
     # Cap at 100
     final_score = min(int(score), 100)
     reason_summary = "; ".join(reasons[:3])  # Top 3 reasons
@@ -189,6 +289,107 @@ def calculate_deletion_score(item: Dict[str, Any], config: Dict) -> tuple[int, s
     return final_score, reason_summary
 
 
+def get_jellyfin_watch_status(config: Dict, item_type: str, logger) -> Dict[str, tuple]:
+    """Get Jellyfin watch status of one item type indexed by path.
+
+    Only the fields the analyzer reads are kept, and only the Path field
+    is requested, instead of holding full Jellyfin item objects.
+
+    Args:
+        config: Configuration dictionary
+        item_type: Jellyfin item type ('Movie' or 'Series')
+        logger: Logger instance
+
+    Returns:
+        Dictionary mapping path to (played, last_played_date_str) tuples
+        (empty if Jellyfin is unavailable)
+    """
+    try:
+        jellyfin = JellyfinAPI(config['jellyfin']['url'], config['jellyfin']['api_key'])
+        jellyfin_items = jellyfin.get_items(include_item_types=item_type, fields='Path')
+
+        watch_status = {}
+        for jellyfin_item in jellyfin_items:
+            user_data = jellyfin_item.get('UserData', {})
+            watch_status[jellyfin_item['Path']] = (
+                user_data.get('Played', False),
+                user_data.get('LastPlayedDate')
+            )
+        return watch_status
+
+    except APIError as e:
+        logger.warning(f"Could not get Jellyfin data: {e}")
+        return {}
+
+
+def build_item(
+    media: Dict[str, Any],
+    item_type: str,
+    id_key: str,
+    quality: str,
+    size_gb: float,
+    watch_status: Optional[tuple],
+    now: datetime,
+    bitrate_kbps: float = 0
+) -> Dict[str, Any]:
+    """Build an analyzer item from a Radarr movie or Sonarr series.
+
+    All fields are set in a single dict literal, so every item has the
+    same keys and is allocated once at its final size.
+
+    Args:
+        media: Radarr movie or Sonarr series dictionary
+        item_type: 'movie' or 'series'
+        id_key: 'radarr_id' or 'sonarr_id'
+        quality: Parsed resolution (see parse_quality)
+        size_gb: Size on disk in GB
+        watch_status: (played, last_played_date_str) from Jellyfin, or None
+        now: Reference time for ages
+        bitrate_kbps: Approximate bitrate (0 if unknown)
+
+    Returns:
+        Item dictionary (score/reason still to be calculated)
+    """
+    # Ratings (IMDB preferred, then TMDB)
+    ratings = media.get('ratings', {})
+    rating_source = ratings['imdb'] if 'imdb' in ratings else ratings.get('tmdb', {})
+
+    # Age
+    added_date = media.get('added')
+    if added_date:
+        age_days = (now - parse_api_date(added_date)).days
+        age_months = age_days / 30
+    else:
+        age_days = 999
+        age_months = 99
+
+    # Watch status (from Jellyfin if available)
+    played, last_played = watch_status or (False, None)
+
+    path = media.get('path', '')
+
+    return {
+        'title': media['title'],
+        'type': item_type,
+        'year': media.get('year', ''),
+        'path': path,
+        id_key: media['id'],
+        'tags': media.get('tags', []),
+        'quality': quality,
+        'size_gb': size_gb,
+        'bitrate_kbps': bitrate_kbps,
+        'rating': rating_source.get('value', 0.0),
+        'vote_count': rating_source.get('votes', 0),
+        'age_days': age_days,
+        'age_months': age_months,
+        'played': played,
+        'last_played_date': parse_api_date(last_played) if last_played else None,
+        'in_kids_library': 'kids' in path.lower(),
+        'score': 0,
+        'reason': '',
+    }
+
+
 def analyze_movies(config: Dict, logger) -> List[Dict[str, Any]]:
     """Analyze all movies and calculate deletion scores.
 
@@ -202,95 +403,44 @@ def analyze_movies(config: Dict, logger) -> List[Dict[str, Any]]:
     logger.info("Analyzing movies...")
 
     results = []
+    scoring = get_scoring_params(config)
 
     try:
-        # Get Radarr movies
+        # Get Radarr movies and Jellyfin items (basic info only, no user ID
+        # needed) in parallel
         radarr = RadarrAPI(config['radarr']['url'], config['radarr']['api_key'])
-        movies = radarr.get_movies()
-        logger.info(f"Found {len(movies)} movies in Radarr")
 
-        # Get Jellyfin items (basic info only, no user ID needed)
-        try:
-            jellyfin = JellyfinAPI(config['jellyfin']['url'], config['jellyfin']['api_key'])
-            jellyfin_items = jellyfin.get_items(include_item_types='Movie')
-            jellyfin_dict = {item['Path']: item for item in jellyfin_items}
-        except APIError as e:
-            logger.warning(f"Could not get Jellyfin data: {e}")
-            jellyfin_dict = {}
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            movies_future = executor.submit(radarr.get_movies)
+            jellyfin_future = executor.submit(get_jellyfin_watch_status, config, 'Movie', logger)
+            movies = movies_future.result()
+            jellyfin_dict = jellyfin_future.result()
+
+        logger.info(f"Found {len(movies)} movies in Radarr")
 
         # Process each movie
         for movie in movies:
-            # Basic info
-            item = {
-                'title': movie['title'],
-                'type': 'movie',
-                'year': movie.get('year', ''),
-                'path': movie.get('path', ''),
-                'radarr_id': movie['id'],
-                'tags': [t for t in movie.get('tags', [])],
-            }
-
-            # Quality
-            quality_profile = movie.get('qualityProfileId')
-            if movie.get('movieFile'):
-                quality_str = movie['movieFile'].get('quality', {}).get('quality', {}).get('name', 'unknown')
-                item['quality'] = parse_quality(quality_str)
-
-                # File size
-                size_bytes = movie['movieFile'].get('size', 0)
-                item['size_gb'] = size_bytes / (1024**3)
+            movie_file = movie.get('movieFile')
+            if movie_file:
+                quality = parse_quality(quality_name(movie_file))
+                size_bytes = movie_file.get('size', 0)
 
                 # Bitrate (approximate)
                 runtime_minutes = movie.get('runtime', 0)
-                if runtime_minutes > 0:
-                    bitrate_kbps = (size_bytes * 8) / (runtime_minutes * 60 * 1000)
-                    item['bitrate_kbps'] = bitrate_kbps
+                bitrate_kbps = size_bytes * BYTES_PER_MINUTE_TO_KBPS / runtime_minutes if runtime_minutes > 0 else 0
             else:
-                item['quality'] = 'unknown'
-                item['size_gb'] = 0
-
-            # Ratings
-            ratings = movie.get('ratings', {})
-            if 'imdb' in ratings:
-                item['rating'] = ratings['imdb'].get('value', 0.0)
-                item['vote_count'] = ratings['imdb'].get('votes', 0)
-            elif 'tmdb' in ratings:
-                item['rating'] = ratings['tmdb'].get('value', 0.0)
-                item['vote_count'] = ratings['tmdb'].get('votes', 0)
-            else:
-                item['rating'] = 0.0
-                item['vote_count'] = 0
-
-            # Age
-            added_date = movie.get('added')
-            if added_date:
-                added_dt = datetime.fromisoformat(added_date.replace('Z', '+00:00'))
-                age_days = (datetime.now() - added_dt.replace(tzinfo=None)).days
-                item['age_days'] = age_days
-                item['age_months'] = age_days / 30
-            else:
-                item['age_days'] = 999
-                item['age_months'] = 99
-
-            # Watch status (from Jellyfin if available)
-            jellyfin_item = jellyfin_dict.get(movie.get('path', ''))
-            if jellyfin_item:
-                item['played'] = jellyfin_item.get('UserData', {}).get('Played', False)
-                last_played = jellyfin_item.get('UserData', {}).get('LastPlayedDate')
-                if last_played:
-                    item['last_played_date'] = datetime.fromisoformat(last_played.replace('Z', '+00:00')).replace(tzinfo=None)
-            else:
-                item['played'] = False
-                item['last_played_date'] = None
+                quality = 'unknown'
+                size_bytes = 0
+                bitrate_kbps = 0
 
-            # Library context
-            item['in_kids_library'] = 'kids' in movie.get('path', '').lower()
+            item = build_item(
+                movie, 'movie', 'radarr_id', quality, size_bytes / BYTES_PER_GB,
+                jellyfin_dict.get(movie.get('path', '')), scoring['now'],
+                bitrate_kbps=bitrate_kbps
+            )
 
             # Calculate score
-            score, reason = calculate_deletion_score(item, config)
-            item['score'] = score
-            item['reason'] = reason
-
+            item['score'], item['reason'] = calculate_deletion_score(item, **scoring)
             results.append(item)
 
     except APIError as e:
@@ -312,99 +462,53 @@ def analyze_series(config: Dict, logger) -> List[Dict[str, Any]]:
     logger.info("Analyzing series...")
 
     results = []
+    scoring = get_scoring_params(config)
 
     try:
-        # Get Sonarr series
-        sonarr = SonarrAPI(config['sonarr']['url'], config['sonarr']['api_key'])
-        all_series = sonarr.get_series()
+        # Get Sonarr series and Jellyfin items in parallel
+        sonarr = SonarrAPI(
+            config['sonarr']['url'],
+            config['sonarr']['api_key'],
+            pool_maxsize=EPISODE_FETCH_WORKERS
+        )
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            series_future = executor.submit(sonarr.get_series)
+            jellyfin_future = executor.submit(get_jellyfin_watch_status, config, 'Series', logger)
+            all_series = series_future.result()
+            jellyfin_dict = jellyfin_future.result()
+
         logger.info(f"Found {len(all_series)} series in Sonarr")
 
-        # Get Jellyfin items
-        try:
-            jellyfin = JellyfinAPI(config['jellyfin']['url'], config['jellyfin']['api_key'])
-            jellyfin_items = jellyfin.get_items(include_item_types='Series')
-            jellyfin_dict = {item['Path']: item for item in jellyfin_items}
-        except APIError as e:
-            logger.warning(f"Could not get Jellyfin data: {e}")
-            jellyfin_dict = {}
+        # Fetch episode files (for quality/size) of every series with files
+        # in parallel instead of one request per series inside the loop
+        series_ids = [
+            series['id'] for series in all_series
+            if series.get('statistics', {}).get('episodeFileCount', 0) > 0
+        ]
+        files_by_series = {}
+        if series_ids:
+            with ThreadPoolExecutor(max_workers=min(EPISODE_FETCH_WORKERS, len(series_ids))) as executor:
+                files_by_series = dict(zip(series_ids, executor.map(sonarr.get_episode_files, series_ids)))
 
         # Process each series
         for series in all_series:
-            # Basic info
-            item = {
-                'title': series['title'],
-                'type': 'series',
-                'year': series.get('year', ''),
-                'path': series.get('path', ''),
-                'sonarr_id': series['id'],
-                'tags': [t for t in series.get('tags', [])],
-            }
-
-            # Quality (from first episode file if available)
-            if series.get('statistics', {}).get('episodeFileCount', 0) > 0:
-                # Get episode to check quality
-                episodes = sonarr.get_episodes(series['id'])
-                if episodes:
-                    first_ep = next((e for e in episodes if e.get('hasFile')), None)
-                    if first_ep and first_ep.get('episodeFile'):
-                        quality_str = first_ep['episodeFile'].get('quality', {}).get('quality', {}).get('name', 'unknown')
-                        item['quality'] = parse_quality(quality_str)
-
-                        # Total size
-                        size_bytes = first_ep['episodeFile'].get('size', 0) * series['statistics'].get('episodeFileCount', 1)
-                        item['size_gb'] = size_bytes / (1024**3)
-                    else:
-                        item['quality'] = 'unknown'
-                        item['size_gb'] = 0
-                else:
-                    item['quality'] = 'unknown'
-                    item['size_gb'] = 0
-            else:
-                item['quality'] = 'unknown'
-                item['size_gb'] = 0
-
-            # Ratings
-            ratings = series.get('ratings', {})
-            if 'imdb' in ratings:
-                item['rating'] = ratings['imdb'].get('value', 0.0)
-                item['vote_count'] = ratings['imdb'].get('votes', 0)
-            elif 'tmdb' in ratings:
-                item['rating'] = ratings['tmdb'].get('value', 0.0)
-                item['vote_count'] = ratings['tmdb'].get('votes', 0)
-            else:
-                item['rating'] = 0.0
-                item['vote_count'] = 0
-
-            # Age
-            added_date = series.get('added')
-            if added_date:
-                added_dt = datetime.fromisoformat(added_date.replace('Z', '+00:00'))
-                age_days = (datetime.now() - added_dt.replace(tzinfo=None)).days
-                item['age_days'] = age_days
-                item['age_months'] = age_days / 30
-            else:
-                item['age_days'] = 999
-                item['age_months'] = 99
-
-            # Watch status
-            jellyfin_item = jellyfin_dict.get(series.get('path', ''))
-            if jellyfin_item:
-                item['played'] = jellyfin_item.get('UserData', {}).get('Played', False)
-                last_played = jellyfin_item.get('UserData', {}).get('LastPlayedDate')
-                if last_played:
-                    item['last_played_date'] = datetime.fromisoformat(last_played.replace('Z', '+00:00')).replace(tzinfo=None)
+            # Quality (from first episode file) and total size of all files
+            episode_files = files_by_series.get(series['id'])
+            if episode_files:
+                quality = parse_quality(quality_name(episode_files[0]))
+                size_gb = sum(f.get('size', 0) for f in episode_files) / BYTES_PER_GB
             else:
-                item['played'] = False
-                item['last_played_date'] = None
+                quality = 'unknown'
+                size_gb = 0
 
-            # Library context
-            item['in_kids_library'] = 'kids' in series.get('path', '').lower()
+            item = build_item(
+                series, 'series', 'sonarr_id', quality, size_gb,
+                jellyfin_dict.get(series.get('path', '')), scoring['now']
+            )
 
             # Calculate score
-            score, reason = calculate_deletion_score(item, config)
-            item['score'] = score
-            item['reason'] = reason
-
+            item['score'], item['reason'] = calculate_deletion_score(item, **scoring)
             results.append(item)
 
     except APIError as e:
@@ -413,9 +517,46 @@ def analyze_series(config: Dict, logger) -> List[Dict[str, Any]]:
     return results
 
 
+def _prowlarr_cache_key(item: Dict) -> str:
+    """Build the availability cache key for an item (normalized title + year)."""
+    return f"{item['title'].strip().lower()}|{item.get('year', '')}"
+
+
+def load_prowlarr_cache(cache_path: Path) -> Dict[str, Dict]:
+    """Load cached Prowlarr indexer counts.
+
+    Args:
+        cache_path: Path to cache file
+
+    Returns:
+        Dictionary mapping cache key to {'indexer_count', 'fetched_at'}
+        (empty if no valid cache exists)
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_prowlarr_cache(cache_path: Path, cache: Dict[str, Dict]) -> None:
+    """Save Prowlarr indexer counts (atomically).
+
+    Args:
+        cache_path: Path to cache file
+        cache: Dictionary mapping cache key to {'indexer_count', 'fetched_at'}
+    """
+    write_atomic(cache_path, (json.dumps(cache).encode('utf-8'),))
+
+
 def check_prowlarr_availability(items: List[Dict], config: Dict, logger) -> List[Dict]:
     """Check Prowlarr for item availability (re-acquisition difficulty).
 
+    Only deletion candidates (score >= thresholds.deletion_score_threshold)
+    are checked; other items get indexer_count 0. Indexer counts are
+    cached on disk (analyzer.prowlarr_cache_days, default 7), so re-runs
+    only search titles that are new or stale.
+
     Args:
         items: List of items to check
         config: Configuration dictionary
@@ -430,48 +571,103 @@ def check_prowlarr_availability(items: List[Dict], config: Dict, logger) -> List
             item['indexer_count'] = 0
         return items
 
+    concurrency = max(1, config['analyzer'].get('prowlarr_concurrency', PROWLARR_CONCURRENCY))
+    cache_ttl = config['analyzer'].get('prowlarr_cache_days', PROWLARR_CACHE_DAYS) * 86400
+    max_rate = config['analyzer'].get('prowlarr_max_rate', PROWLARR_MAX_RATE)
+    min_interval = 1.0 / max_rate if max_rate > 0 else 0
+    min_count = config['thresholds']['min_indexer_count']
+
+    def apply_indexer_count(item: Dict, indexer_count: int) -> None:
+        """Store indexer count and adjust score if rare (< 2 indexers)."""
+        item['indexer_count'] = indexer_count
+        if indexer_count < min_count and item['score'] > 0:
+            item['score'] = int(item['score'] * 0.7)  # Reduce score by 30%
+            item['reason'] += f" (rare: {indexer_count} indexers)"
+            logger.debug(f"  → Rare content: {indexer_count} indexers, score reduced")
+
+    # The rarity adjustment only ever lowers a score, so it can only
+    # change the outcome for items that are currently candidates
+    threshold = config['thresholds']['deletion_score_threshold']
+    candidates = []
+    for item in items:
+        if item['score'] >= threshold:
+            candidates.append(item)
+        else:
+            item['indexer_count'] = 0
+
+    logger.info(f"Prowlarr: checking {len(candidates)} candidates (score >= {threshold}), "
+                f"skipping {len(items) - len(candidates)} items below threshold")
+
+    # Use cached counts where still fresh
+    cache = load_prowlarr_cache(PROWLARR_CACHE_FILE)
+    now = time.time()
+    to_search = []
+
+    for item in candidates:
+        entry = cache.get(_prowlarr_cache_key(item))
+        if entry and now - entry['fetched_at'] < cache_ttl:
+            apply_indexer_count(item, entry['indexer_count'])
+        else:
+            to_search.append(item)
+
+    logger.info(f"Prowlarr: {len(candidates) - len(to_search)} items cached, {len(to_search)} to search")
+
+    if not to_search:
+        return items
+
     try:
-        # Prowlarr searches can be slow, use longer timeout
+        # Prowlarr searches can be slow, use longer timeout; one pooled
+        # connection per parallel search
         prowlarr = ProwlarrAPI(
             config['prowlarr']['url'],
             config['prowlarr']['api_key'],
-            timeout=120  # 2 minutes for search operations
+            timeout=120,  # 2 minutes for search operations
+            pool_maxsize=concurrency
         )
         logger.info(f"Connecting to Prowlarr at {config['prowlarr']['url']}...")
         indexers = prowlarr.get_indexers()
         logger.info(f"Prowlarr: {len(indexers)} indexers available")
 
-        logger.info(f"Checking {len(items)} items against Prowlarr (this may take a while)...")
-
-        for idx, item in enumerate(items, 1):
-            # Search for item
+        logger.info(f"Checking {len(to_search)} items against Prowlarr "
+                    f"({concurrency} parallel searches, this may take a while)...")
+
+        lock = threading.Lock()
+        next_start = [0.0]
+        checked = [0]
+
+        def wait_for_slot():
+            """Space search starts min_interval apart across all workers."""
+            if not min_interval:
+                return
+            with lock:
+                now = time.monotonic()
+                wait = next_start[0] - now
+                next_start[0] = max(now, next_start[0]) + min_interval
+            if wait > 0:
+                time.sleep(wait)
+
+        def check_item(idx: int, item: Dict) -> None:
+            """Search Prowlarr for one item and adjust its score."""
             try:
                 query = item['title']
-                logger.debug(f"[{idx}/{len(items)}] Searching Prowlarr for: '{query}'")
+                wait_for_slot()
+                logger.debug(f"[{idx}/{len(to_search)}] Searching Prowlarr for: '{query}'")
 
                 start_time = time.time()
                 results = prowlarr.search(query)
                 elapsed = time.time() - start_time
 
-                logger.debug(f"  → Search completed in {elapsed:.2f}s, found {len(results)} results")
+                logger.debug(f"  → '{query}' completed in {elapsed:.2f}s, found {len(results)} results")
 
                 # Count unique indexers with results
                 indexer_ids = set(r.get('indexerId') for r in results if r.get('indexerId'))
-                item['indexer_count'] = len(indexer_ids)
+                apply_indexer_count(item, len(indexer_ids))
 
-                # Adjust score if rare (< 2 indexers)
-                min_count = config['thresholds']['min_indexer_count']
-                if item['indexer_count'] < min_count and item['score'] > 0:
-                    item['score'] = int(item['score'] * 0.7)  # Reduce score by 30%
-                    item['reason'] += f" (rare: {item['indexer_count']} indexers)"
-                    logger.debug(f"  → Rare content: {item['indexer_count']} indexers, score reduced")
-
-                # Progress logging
-                if idx % 5 == 0:
-                    logger.info(f"  Checked {idx}/{len(items)} items...")
-
-                # Rate limiting: wait 0.5 seconds between requests
-                time.sleep(0.5)
+                with lock:
+                    cache[_prowlarr_cache_key(item)] = {
+                        'indexer_count': len(indexer_ids),
+                        'fetched_at': time.time()
+                    }
 
             except APIError as e:
                 logger.error(f"APIError searching '{item['title']}': {e}")
@@ -486,16 +682,36 @@ def check_prowlarr_availability(items: List[Dict], config: Dict, logger) -> List
                 logger.error(f"  Traceback: {traceback.format_exc()}")
                 item['indexer_count'] = 0
 
-        logger.info(f"Prowlarr check completed for {len(items)} items")
+            # Progress logging
+            with lock:
+                checked[0] += 1
+                done = checked[0]
+            if done % 5 == 0:
+                logger.info(f"  Checked {done}/{len(to_search)} items...")
+
+        # Searches are I/O-bound (Prowlarr fans out to the indexers), so run
+        # several at once; each item is only touched by its own worker
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(check_item, idx, item) for idx, item in enumerate(to_search, 1)]
+
+            for future in as_completed(futures):
+                future.result()  # Wait for completion (errors already logged)
+
+        logger.info(f"Prowlarr check completed for {len(to_search)} items")
+
+        try:
+            save_prowlarr_cache(PROWLARR_CACHE_FILE, cache)
+        except OSError as e:
+            logger.warning(f"Could not save Prowlarr cache: {e}")
 
     except APIError as e:
         logger.warning(f"Could not connect to Prowlarr: {e}")
         logger.warning("Skipping Prowlarr availability check")
-        for item in items:
+        for item in to_search:
             item['indexer_count'] = 0
     except Exception as e:
         logger.error(f"Unexpected Prowlarr error: {e}")
-        for item in items:
+        for item in to_search:
             item['indexer_count'] = 0
 
     return items
@@ -504,6 +720,8 @@ def check_prowlarr_availability(items: List[Dict], config: Dict, logger) -> List
 def export_report(items: List[Dict], output_path: str, logger) -> None:
     """Export analysis results to CSV.
 
+    Sorts ``items`` in place by score (descending).
+
     Args:
         items: List of analyzed items
         output_path: Path to output CSV file
@@ -511,40 +729,43 @@ def export_report(items: List[Dict], output_path: str, logger) -> None:
     """
     logger.info(f"Exporting report to {output_path}")
 
-    # Sort by score (descending)
-    items_sorted = sorted(items, key=lambda x: x['score'], reverse=True)
-
-    with open(output_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'Title', 'Type', 'Quality', 'Size_GB', 'Score', 'Reason',
-            'Last_Watched', 'IMDB_Rating', 'Age_Days', 'Indexer_Count', 'ID', 'Path'
-        ])
-
-        writer.writeheader()
-
-        for item in items_sorted:
-            last_watched = 'Never'
-            if item.get('played') and item.get('last_played_date'):
-                last_watched = item['last_played_date'].strftime('%Y-%m-%d')
-            elif item.get('played'):
-                last_watched = 'Yes'
-
-            writer.writerow({
-                'Title': item['title'],
-                'Type': item['type'],
-                'Quality': item.get('quality', 'unknown'),
-                'Size_GB': f"{item.get('size_gb', 0):.2f}",
-                'Score': item['score'],
-                'Reason': item['reason'],
-                'Last_Watched': last_watched,
-                'IMDB_Rating': f"{item.get('rating', 0):.1f}",
-                'Age_Days': item.get('age_days', 0),
-                'Indexer_Count': item.get('indexer_count', 0),
-                'ID': item.get('radarr_id') or item.get('sonarr_id', ''),
-                'Path': item.get('path', '')
-            })
-
-    logger.info(f"Report exported: {len(items_sorted)} items")
+    # Sort by score (descending), in place to avoid a second list
+    items.sort(key=itemgetter('score'), reverse=True)
+
+    def last_watched(item: Dict) -> str:
+        """Format the Last_Watched column."""
+        if item.get('played') and item.get('last_played_date'):
+            return item['last_played_date'].strftime('%Y-%m-%d')
+        elif item.get('played'):
+            return 'Yes'
+        return 'Never'
+
+    rows = (
+        (
+            item['title'],
+            item['type'],
+            item.get('quality', 'unknown'),
+            f"{item.get('size_gb', 0):.2f}",
+            item['score'],
+            item['reason'],
+            last_watched(item),
+            f"{item.get('rating', 0):.1f}",
+            item.get('age_days', 0),
+            item.get('indexer_count', 0),
+            item.get('radarr_id') or item.get('sonarr_id', ''),
+            item.get('path', '')
+        )
+        for item in items
+    )
+
+    # Large write buffer: the report is written in one go, so flush it in
+    # few big writes instead of one per 8 KB
+    with open(output_path, 'w', newline='', encoding='utf-8', buffering=REPORT_BUFFER_SIZE) as f:
+        writer = csv.writer(f)
+        writer.writerow(REPORT_COLUMNS)
+        writer.writerows(rows)
+
+    logger.info(f"Report exported: {len(items)} items")
 
 
 def analyze_library(config: Dict, media_type: Optional[str] = None, output_path: Optional[str] = None) -> bool:
@@ -571,17 +792,26 @@ def analyze_library(config: Dict, media_type: Optional[str] = None, output_path:
 
             all_items = []
 
-            # Analyze movies
-            if media_type is None or media_type == 'movies':
-                movies = analyze_movies(config, logger)
-                all_items.extend(movies)
-                logger.info(f"Analyzed {len(movies)} movies")
-
-            # Analyze series
-            if media_type is None or media_type == 'series':
-                series = analyze_series(config, logger)
-                all_items.extend(series)
-                logger.info(f"Analyzed {len(series)} series")
+            # Analyze movies and series in parallel (Radarr and Sonarr are
+            # independent services)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                movies_future = None
+                series_future = None
+
+                if media_type is None or media_type == 'movies':
+                    movies_future = executor.submit(analyze_movies, config, logger)
+                if media_type is None or media_type == 'series':
+                    series_future = executor.submit(analyze_series, config, logger)
+
+                if movies_future:
+                    movies = movies_future.result()
+                    all_items.extend(movies)
+                    logger.info(f"Analyzed {len(movies)} movies")
+
+                if series_future:
+                    series = series_future.result()
+                    all_items.extend(series)
+                    logger.info(f"Analyzed {len(series)} series")
 
             # Check Prowlarr availability
             if all_items:
@@ -32,184 +32,445 @@ Usage:
 
 import sys
 import argparse
+import posixpath
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Callable, FrozenSet, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from utils.config_loader import load_config
-from utils.logger import setup_logging
-from utils.ntfy_notifier import create_notifier
+from utils.logger import setup_logging, PrefixAdapter
 from utils.validators import acquire_lock
 from utils.api_clients import RadarrAPI, SonarrAPI
 from utils.tmdb_client import create_tmdb_client
+from utils.http_cache import CATALOG_TTL, invalidate
 
+# utils.ntfy_notifier is imported where a notification is actually sent:
+# most runs (dry-runs, nothing misplaced) never need it
 
-def is_kids_rating(certification: str, kids_ratings: List[str]) -> bool:
+# Parallel path updates against Radarr/Sonarr (concurrency.arr_workers).
+# Kept small: the *arr task queue only runs a handful of moves at once.
+ARR_WORKERS = 8
+
+# Parallel TMDB certification lookups (concurrency.tmdb_workers)
+TMDB_WORKERS = 8
+
+
+def is_kids_rating(certification: str, kids_ratings: FrozenSet[str]) -> bool:
     """Check if a certification is considered kids content.
 
     Args:
         certification: Age rating (e.g., 'G', 'PG', 'R', 'TV-Y7')
-        kids_ratings: List of certifications considered safe for kids
+        kids_ratings: Upper-cased certifications considered safe for kids
+            (see normalize_ratings)
 
     Returns:
-        True if certification is in kids list
+        True if certification is in kids set
     """
-    if not certification:
-        return False
+    return bool(certification) and certification.upper() in kids_ratings
 
-    return certification.upper() in [r.upper() for r in kids_ratings]
 
+def normalize_ratings(ratings: List[str]) -> FrozenSet[str]:
+    """Upper-case a list of certifications once for repeated lookups.
 
-def resort_movies(
-    config: dict,
-    logger,
-    dry_run: bool = False
-) -> Tuple[int, int]:
-    """Resort movies between movies and kids_movies libraries.
+    Args:
+        ratings: Certifications from config (e.g., ['G', 'pg'])
+
+    Returns:
+        Frozen set of upper-cased certifications
+    """
+    return frozenset(r.upper() for r in ratings)
+
+
+def classify_item(
+    entry: Dict,
+    certification: str,
+    in_kids: bool,
+    in_adult: bool,
+    kids_ratings: FrozenSet[str],
+    to_kids: Dict[int, Dict],
+    to_adult: Dict[int, Dict]
+) -> None:
+    """Queue an item for a move if its rating doesn't match its library.
 
     Args:
-        config: Configuration dictionary
+        entry: Item dictionary (id, title, year, current_path)
+        certification: Age rating ('' if unknown)
+        in_kids: Item is currently in the kids library
+        in_adult: Item is currently in the adult library
+        kids_ratings: Upper-cased kids certifications
+        to_kids: Items to move to the kids library, by ID (added to)
+        to_adult: Items to move to the adult library, by ID (added to)
+    """
+    # Unrated items belong in the adult library: nothing to do there
+    if in_adult and not certification:
+        return
+
+    # Check if rating matches library
+    should_be_kids = is_kids_rating(certification, kids_ratings)
+
+    # Misplaced in adult library?
+    if in_adult and should_be_kids:
+        to_kids[entry['id']] = {**entry, 'certification': certification}
+
+    # Misplaced in kids library?
+    elif in_kids and not should_be_kids:
+        to_adult[entry['id']] = {**entry, 'certification': certification or 'UNRATED'}
+
+
+def fetch_missing_certifications(
+    pending: List[Tuple[Dict, bool, bool]],
+    lookup_fn: Optional[Callable],
+    update_fn: Callable,
+    dry_run: bool,
+    workers: int,
+    logger
+) -> List[Tuple[Dict, str, bool, bool]]:
+    """Look up missing certifications on TMDB in parallel.
+
+    Each lookup (and the follow-up Radarr/Sonarr update) is an independent
+    HTTPS round-trip, so they are spread over a bounded thread pool rather
+    than done one at a time inside the catalog loop.
+
+    Args:
+        pending: (entry, in_kids, in_adult) for items without certification
+        lookup_fn: TMDB lookup (e.g., tmdb.get_movie_certification), or
+            None if TMDB is not configured
+        update_fn: Client update method to store found certifications
+        dry_run: If True, don't store found certifications
+        workers: Maximum parallel lookups
         logger: Logger instance
-        dry_run: If True, don't actually move items
 
     Returns:
-        Tuple of (to_kids_count, to_adult_count)
+        List of (entry, certification, in_kids, in_adult); certification is
+        '' when none was found
     """
-    logger.info("\n" + "="*60)
-    logger.info("RESORTING MOVIES")
-    logger.info("="*60)
+    if not pending:
+        return []
+
+    if lookup_fn is None:
+        logger.warning(f"TMDB not configured, {len(pending)} items keep no certification")
+        return [(entry, '', in_kids, in_adult) for entry, in_kids, in_adult in pending]
+
+    def fetch_one(entry: Dict) -> str:
+        title = entry['title']
+        logger.info(f"Fetching certification from TMDB: {title} ({entry['year']})")
+
+        tmdb_cert = lookup_fn(title, entry['year'])
+        if tmdb_cert:
+            # Update in Radarr/Sonarr if not in dry-run
+            if not dry_run:
+                update_fn(entry['id'], {'certification': tmdb_cert})
+                logger.info(f"Updated certification: {title} → {tmdb_cert}")
+            else:
+                logger.info(f"[DRY-RUN] Would update: {title} → {tmdb_cert}")
+
+        return tmdb_cert or ''
+
+    results = []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+        futures = {
+            executor.submit(fetch_one, entry): (entry, in_kids, in_adult)
+            for entry, in_kids, in_adult in pending
+        }
+
+        for future in as_completed(futures):
+            entry, in_kids, in_adult = futures[future]
+            try:
+                certification = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to fetch certification for {entry['title']}: {e}")
+                certification = ''
+            results.append((entry, certification, in_kids, in_adult))
 
-    radarr = RadarrAPI(
-        config['radarr']['url'],
-        config['radarr']['api_key']
+    return results
+
+
+def root_prefix(path: str) -> str:
+    """Build a lower-cased root folder prefix for startswith() checks.
+
+    Args:
+        path: Root folder path (e.g., '/data/media/movies')
+
+    Returns:
+        Lower-cased path with exactly one trailing slash
+    """
+    return path.rstrip('/').lower() + '/'
+
+
+def detect_library(path_lower: str, kids_prefix: str, adult_prefix: str, kids_folder: str, adult_folder: str) -> Tuple[bool, bool]:
+    """Determine which library an item currently lives in.
+
+    Items under a configured root folder are matched with a prefix test,
+    kids root first since it is the more specific one. Paths outside both
+    roots (e.g., a different mount point) fall back to matching the library
+    folder name anywhere in the path.
+
+    Args:
+        path_lower: Lower-cased item path
+        kids_prefix: Kids root prefix (see root_prefix)
+        adult_prefix: Adult root prefix (see root_prefix)
+        kids_folder: Kids library folder name (e.g., 'kids_movies')
+        adult_folder: Adult library folder name (e.g., 'movies')
+
+    Returns:
+        Tuple of (in_kids, in_adult)
+    """
+    if path_lower.startswith(kids_prefix):
+        return True, False
+    if path_lower.startswith(adult_prefix):
+        return False, True
+
+    in_kids = f'/{kids_folder}/' in path_lower or path_lower.endswith(f'/{kids_folder}')
+    in_adult = (f'/{adult_folder}/' in path_lower or path_lower.endswith(f'/{adult_folder}')) and not in_kids
+    return in_kids, in_adult
+
+
+def build_new_path(current_path: str, src_root: str, dest_root: str) -> str:
+    """Rebase an item path from one root folder onto another.
+
+    Radarr/Sonarr paths are POSIX regardless of where this script runs, so
+    posixpath is used rather than pathlib. Items under ``src_root`` keep
+    their relative path; items found by folder name elsewhere keep only
+    their own folder name.
+
+    Args:
+        current_path: Current item path
+        src_root: Root folder the item is moving out of
+        dest_root: Root folder the item is moving into
+
+    Returns:
+        New item path
+
+    Example:
+        >>> build_new_path('/data/movies/Up (2009)', '/data/movies', '/data/kids_movies')
+        '/data/kids_movies/Up (2009)'
+    """
+    current_path = current_path.rstrip('/')
+    src_root = src_root.rstrip('/')
+
+    if current_path.startswith(src_root + '/'):
+        return posixpath.join(dest_root, posixpath.relpath(current_path, src_root))
+
+    return posixpath.join(dest_root, posixpath.basename(current_path))
+
+
+def format_move_report(heading: str, items: Dict[int, Dict]) -> str:
+    """Format a list of planned moves as one multi-line log message.
+
+    Args:
+        heading: Section heading (e.g., 'Movies to move to KIDS library')
+        items: Items to move, by ID
+
+    Returns:
+        Heading with count, followed by one line per item
+    """
+    lines = [f"\n{heading}: {len(items)}"]
+    lines.extend(
+        f"  → {item['title']} ({item['year']}) [{item['certification']}]" for item in items.values()
     )
+    return '\n'.join(lines)
 
-    # Create TMDB client for fetching missing certifications
-    tmdb = create_tmdb_client(config)
 
-    kids_ratings = config['thresholds']['kids_age_ratings']['movies']
-    movies_path = config['paths']['movies']
-    kids_movies_path = config['paths']['kids_movies']
+def _move_one(item: Dict, src_root: str, dest_root: str, update_fn: Callable, move_fn: Callable) -> str:
+    """Point one item at a new root folder and trigger its file move.
 
-    # Get all movies
-    all_movies = radarr.get_movies()
-    logger.info(f"Found {len(all_movies)} total movies")
+    Args:
+        item: Misplaced item dictionary (id, title, current_path)
+        src_root: Root folder the item is moving out of
+        dest_root: Destination root folder path
+        update_fn: Client update method (e.g., radarr.update_movie)
+        move_fn: Client move command (e.g., radarr.move_movie)
 
-    to_kids = []      # Adult movies that should be in kids
-    to_adult = []     # Kids movies that should be in adult
+    Returns:
+        New item path
+    """
+    new_path = build_new_path(item['current_path'], src_root, dest_root)
 
-    # Analyze each movie
-    for movie in all_movies:
-        title = movie.get('title', 'Unknown')
-        year = movie.get('year', 0)
-        movie_id = movie.get('id')
-        current_path = movie.get('path', '')
-        certification = movie.get('certification', '')
+    update_fn(item['id'], {'path': new_path, 'rootFolderPath': dest_root})
+    move_fn(item['id'])
 
-        # Check for missing certification and fetch from TMDB if needed
-        if not certification:
-            logger.info(f"Fetching certification from TMDB: {title} ({year})")
+    return new_path
+
+
+def execute_moves(
+    items: Dict[int, Dict],
+    src_root: str,
+    dest_root: str,
+    label: str,
+    bulk_fn: Callable,
+    update_fn: Callable,
+    move_fn: Callable,
+    workers: int,
+    logger
+) -> None:
+    """Move items to a library.
+
+    All items share one destination root folder, so they are sent in a
+    single bulk editor request. If the bulk request fails, each item is
+    updated individually over a bounded thread pool instead.
+
+    Args:
+        items: Misplaced item dictionaries, by ID
+        src_root: Root folder the items are moving out of
+        dest_root: Destination root folder path
+        label: Library label for log messages (e.g., 'kids')
+        bulk_fn: Client bulk editor method (e.g., radarr.bulk_edit_movies)
+        update_fn: Client update method
+        move_fn: Client move command
+        workers: Maximum parallel requests for the per-item fallback
+        logger: Logger instance
+    """
+    if not items:
+        return
+
+    try:
+        bulk_fn(list(items), dest_root, move_files=True)
+        logger.info('\n'.join(
+            f"MOVED to {label}: {item['title']} ({item['year']})" for item in items.values()
+        ))
+        return
+    except Exception as e:
+        logger.warning(f"Bulk move to {label} failed ({e}), moving items one by one")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_move_one, item, src_root, dest_root, update_fn, move_fn): item
+            for item in items.values()
+        }
+
+        for future in as_completed(futures):
+            item = futures[future]
             try:
-                tmdb_cert = tmdb.get_movie_certification(title, year)
-                if tmdb_cert:
-                    certification = tmdb_cert
-                    # Update in Radarr if not in dry-run
-                    if not dry_run:
-                        radarr.update_movie(movie_id, {'certification': tmdb_cert})
-                        logger.info(f"Updated certification: {title} → {tmdb_cert}")
-                    else:
-                        logger.info(f"[DRY-RUN] Would update: {title} → {tmdb_cert}")
+                new_path = future.result()
+                logger.info(
+                    f"Updated path: {item['title']} → {new_path}\n"
+                    f"MOVED to {label}: {item['title']} ({item['year']})"
+                )
             except Exception as e:
-                logger.warning(f"Failed to fetch certification for {title}: {e}")
+                logger.error(f"Failed to move {item['title']}: {e}")
+
+
+def _resort_library(
+    kind: str,
+    adult_folder: str,
+    kids_folder: str,
+    adult_path: str,
+    kids_path: str,
+    kids_ratings: FrozenSet[str],
+    iter_items: Callable,
+    update_fn: Callable,
+    move_fn: Callable,
+    bulk_fn: Callable,
+    lookup_fn: Optional[Callable],
+    catalog_endpoint: str,
+    client,
+    config: dict,
+    logger,
+    dry_run: bool = False
+) -> Tuple[int, int]:
+    """Resort one media type between its adult and kids libraries.
+
+    Shared analyze / report / execute pass behind resort_movies() and
+    resort_series(); the service-specific parts are passed in.
+
+    Args:
+        kind: Media type label for log messages ('movies' or 'series')
+        adult_folder: Adult library folder name (e.g., 'movies')
+        kids_folder: Kids library folder name (e.g., 'kids_movies')
+        adult_path: Adult library root folder
+        kids_path: Kids library root folder
+        kids_ratings: Upper-cased kids certifications
+        iter_items: Catalog iterator (e.g., radarr.iter_movies)
+        update_fn: Client update method (e.g., radarr.update_movie)
+        move_fn: Client move command (e.g., radarr.move_movie)
+        bulk_fn: Client bulk editor method (e.g., radarr.bulk_edit_movies)
+        lookup_fn: TMDB certification lookup, or None without TMDB
+        catalog_endpoint: Catalog endpoint, invalidated after moves
+        client: Radarr/Sonarr client (for cache invalidation)
+        config: Configuration dictionary
+        logger: Logger instance
+        dry_run: If True, don't actually move items
 
-        # Determine current library by checking folder names
-        # More flexible than exact path matching
-        path_lower = current_path.lower()
-        in_kids = '/kids_movies/' in path_lower or path_lower.endswith('/kids_movies')
-        in_adult = ('/movies/' in path_lower or path_lower.endswith('/movies')) and not in_kids
+    Returns:
+        Tuple of (to_kids_count, to_adult_count)
+    """
+    title_kind = kind.capitalize()
+    kids_prefix = root_prefix(kids_path)
+    adult_prefix = root_prefix(adult_path)
+
+    # Stream the catalog: each record is analyzed as it is decoded and only
+    # misplaced items are kept (reused from the cache if another script
+    # fetched the catalog moments ago; single-item lookups are only done
+    # for items that actually change)
+    total_count = 0
+
+    to_kids = {}      # Adult items that should be in kids, by ID
+    to_adult = {}     # Kids items that should be in adult, by ID
+    pending = []      # (entry, in_kids, in_adult) awaiting a TMDB certification
+
+    # Analyze each item
+    for media in iter_items(ttl=CATALOG_TTL):
+        total_count += 1
+        title = media.get('title', 'Unknown')
+        year = media.get('year', 0)
+        current_path = media.get('path', '')
+
+        # Determine current library first (root prefix, then folder names)
+        # so items outside both libraries skip the rating work entirely
+        in_kids, in_adult = detect_library(
+            current_path.lower(), kids_prefix, adult_prefix, kids_folder, adult_folder
+        )
 
         # Skip if not in either library
         if not in_kids and not in_adult:
-            logger.warning(f"SKIP: {title} ({year}) - not in movies or kids_movies: {current_path}")
+            logger.warning(f"SKIP: {title} ({year}) - not in {adult_folder} or {kids_folder}: {current_path}")
             continue
 
-        # Check if rating matches library
-        should_be_kids = is_kids_rating(certification, kids_ratings)
-
-        # Misplaced in adult library?
-        if in_adult and should_be_kids:
-            to_kids.append({
-                'id': movie_id,
-                'title': title,
-                'year': year,
-                'certification': certification,
-                'current_path': current_path
-            })
-
-        # Misplaced in kids library?
-        elif in_kids and not should_be_kids:
-            to_adult.append({
-                'id': movie_id,
-                'title': title,
-                'year': year,
-                'certification': certification or 'UNRATED',
-                'current_path': current_path
-            })
-
-    # Report findings
-    logger.info(f"\nMovies to move to KIDS library: {len(to_kids)}")
-    for item in to_kids:
-        logger.info(f"  → {item['title']} ({item['year']}) [{item['certification']}]")
-
-    logger.info(f"\nMovies to move to ADULT library: {len(to_adult)}")
-    for item in to_adult:
-        logger.info(f"  → {item['title']} ({item['year']}) [{item['certification']}]")
+        entry = {
+            'id': media.get('id'),
+            'title': title,
+            'year': year,
+            'current_path': current_path
+        }
+        certification = media.get('certification', '')
 
-    # Execute moves
-    if not dry_run:
-        logger.info("\nExecuting moves...")
+        # Missing certification: look it up on TMDB after the catalog pass
+        if not certification:
+            pending.append((entry, in_kids, in_adult))
+            continue
 
-        # Move to kids
-        for item in to_kids:
-            # Extract just the movie folder name
-            folder_name = Path(item['current_path']).name
-            new_path = str(Path(kids_movies_path) / folder_name)
+        classify_item(entry, certification, in_kids, in_adult, kids_ratings, to_kids, to_adult)
 
-            try:
-                # Update metadata
-                radarr.update_movie(
-                    item['id'],
-                    {'path': new_path, 'rootFolderPath': kids_movies_path}
-                )
-                logger.info(f"Updated path: {item['title']} → {new_path}")
+    # Fetch missing certifications from TMDB in parallel, then classify
+    tmdb_workers = max(1, config.get('concurrency', {}).get('tmdb_workers', TMDB_WORKERS))
+    resolved = fetch_missing_certifications(
+        pending, lookup_fn, update_fn, dry_run, tmdb_workers, logger
+    )
+    for entry, certification, in_kids, in_adult in resolved:
+        classify_item(entry, certification, in_kids, in_adult, kids_ratings, to_kids, to_adult)
 
-                # Trigger file move operation
-                radarr.move_movie(item['id'])
-                logger.info(f"MOVED to kids: {item['title']} ({item['year']})")
-            except Exception as e:
-                logger.error(f"Failed to move {item['title']}: {e}")
+    logger.info(f"Found {total_count} total {kind}")
 
-        # Move to adult
-        for item in to_adult:
-            # Extract just the movie folder name
-            folder_name = Path(item['current_path']).name
-            new_path = str(Path(movies_path) / folder_name)
+    # Report findings (one log record per section)
+    logger.info(format_move_report(f"{title_kind} to move to KIDS library", to_kids))
+    logger.info(format_move_report(f"{title_kind} to move to ADULT library", to_adult))
 
-            try:
-                # Update metadata
-                radarr.update_movie(
-                    item['id'],
-                    {'path': new_path, 'rootFolderPath': movies_path}
-                )
-                logger.info(f"Updated path: {item['title']} → {new_path}")
+    # Execute moves
+    if not dry_run:
+        logger.info("\nExecuting moves...")
 
-                # Trigger file move operation
-                radarr.move_movie(item['id'])
-                logger.info(f"MOVED to adult: {item['title']} ({item['year']})")
-            except Exception as e:
-                logger.error(f"Failed to move {item['title']}: {e}")
+        workers = max(1, config.get('concurrency', {}).get('arr_workers', ARR_WORKERS))
+        execute_moves(to_kids, adult_path, kids_path, 'kids',
+                      bulk_fn, update_fn, move_fn, workers, logger)
+        execute_moves(to_adult, kids_path, adult_path, 'adult',
+                      bulk_fn, update_fn, move_fn, workers, logger)
+
+        # Paths changed: don't let the next run reuse the cached catalog
+        invalidate(client, catalog_endpoint)
 
     else:
         logger.info("\n[DRY-RUN] No changes made")
@@ -217,12 +478,12 @@ def resort_movies(
     return len(to_kids), len(to_adult)
 
 
-def resort_series(
+def resort_movies(
     config: dict,
     logger,
     dry_run: bool = False
 ) -> Tuple[int, int]:
-    """Resort series between series and kids_series libraries.
+    """Resort movies between movies and kids_movies libraries.
 
     Args:
         config: Configuration dictionary
@@ -233,142 +494,88 @@ def resort_series(
         Tuple of (to_kids_count, to_adult_count)
     """
     logger.info("\n" + "="*60)
-    logger.info("RESORTING SERIES")
+    logger.info("RESORTING MOVIES")
     logger.info("="*60)
 
-    sonarr = SonarrAPI(
-        config['sonarr']['url'],
-        config['sonarr']['api_key']
+    # One keep-alive connection per parallel move worker
+    workers = max(1, config.get('concurrency', {}).get('arr_workers', ARR_WORKERS))
+    radarr = RadarrAPI(
+        config['radarr']['url'],
+        config['radarr']['api_key'],
+        pool_maxsize=workers
     )
 
     # Create TMDB client for fetching missing certifications
     tmdb = create_tmdb_client(config)
 
-    kids_ratings = config['thresholds']['kids_age_ratings']['series']
-    series_path = config['paths']['series']
-    kids_series_path = config['paths']['kids_series']
-
-    # Get all series
-    all_series = sonarr.get_series()
-    logger.info(f"Found {len(all_series)} total series")
-
-    to_kids = []      # Adult series that should be in kids
-    to_adult = []     # Kids series that should be in adult
-
-    # Analyze each series
-    for show in all_series:
-        title = show.get('title', 'Unknown')
-        year = show.get('year', 0)
-        series_id = show.get('id')
-        current_path = show.get('path', '')
-        certification = show.get('certification', '')
-
-        # Check for missing certification and fetch from TMDB if needed
-        if not certification:
-            logger.info(f"Fetching certification from TMDB: {title} ({year})")
-            try:
-                tmdb_cert = tmdb.get_tv_certification(title, year)
-                if tmdb_cert:
-                    certification = tmdb_cert
-                    # Update in Sonarr if not in dry-run
-                    if not dry_run:
-                        sonarr.update_series(series_id, {'certification': tmdb_cert})
-                        logger.info(f"Updated certification: {title} → {tmdb_cert}")
-                    else:
-                        logger.info(f"[DRY-RUN] Would update: {title} → {tmdb_cert}")
-            except Exception as e:
-                logger.warning(f"Failed to fetch certification for {title}: {e}")
-
-        # Determine current library by checking folder names
-        path_lower = current_path.lower()
-        in_kids = '/kids_series/' in path_lower or path_lower.endswith('/kids_series')
-        in_adult = ('/series/' in path_lower or path_lower.endswith('/series')) and not in_kids
-
-        # Skip if not in either library
-        if not in_kids and not in_adult:
-            logger.warning(f"SKIP: {title} ({year}) - not in series or kids_series: {current_path}")
-            continue
-
-        # Check if rating matches library
-        should_be_kids = is_kids_rating(certification, kids_ratings)
-
-        # Misplaced in adult library?
-        if in_adult and should_be_kids:
-            to_kids.append({
-                'id': series_id,
-                'title': title,
-                'year': year,
-                'certification': certification,
-                'current_path': current_path
-            })
-
-        # Misplaced in kids library?
-        elif in_kids and not should_be_kids:
-            to_adult.append({
-                'id': series_id,
-                'title': title,
-                'year': year,
-                'certification': certification or 'UNRATED',
-                'current_path': current_path
-            })
-
-    # Report findings
-    logger.info(f"\nSeries to move to KIDS library: {len(to_kids)}")
-    for item in to_kids:
-        logger.info(f"  → {item['title']} ({item['year']}) [{item['certification']}]")
-
-    logger.info(f"\nSeries to move to ADULT library: {len(to_adult)}")
-    for item in to_adult:
-        logger.info(f"  → {item['title']} ({item['year']}) [{item['certification']}]")
-
-    # Execute moves
-    if not dry_run:
-        logger.info("\nExecuting moves...")
-
-        # Move to kids
-        for item in to_kids:
-            # Extract just the series folder name
-            folder_name = Path(item['current_path']).name
-            new_path = str(Path(kids_series_path) / folder_name)
+    return _resort_library(
+        kind='movies',
+        adult_folder='movies',
+        kids_folder='kids_movies',
+        adult_path=config['paths']['movies'],
+        kids_path=config['paths']['kids_movies'],
+        kids_ratings=normalize_ratings(config['thresholds']['kids_age_ratings']['movies']),
+        iter_items=radarr.iter_movies,
+        update_fn=radarr.update_movie,
+        move_fn=radarr.move_movie,
+        bulk_fn=radarr.bulk_edit_movies,
+        lookup_fn=tmdb.get_movie_certification if tmdb else None,
+        catalog_endpoint='/api/v3/movie',
+        client=radarr,
+        config=config,
+        logger=logger,
+        dry_run=dry_run
+    )
 
-            try:
-                # Update metadata
-                sonarr.update_series(
-                    item['id'],
-                    {'path': new_path, 'rootFolderPath': kids_series_path}
-                )
-                logger.info(f"Updated path: {item['title']} → {new_path}")
 
-                # Trigger file move operation
-                sonarr.move_series(item['id'])
-                logger.info(f"MOVED to kids: {item['title']} ({item['year']})")
-            except Exception as e:
-                logger.error(f"Failed to move {item['title']}: {e}")
+def resort_series(
+    config: dict,
+    logger,
+    dry_run: bool = False
+) -> Tuple[int, int]:
+    """Resort series between series and kids_series libraries.
 
-        # Move to adult
-        for item in to_adult:
-            # Extract just the series folder name
-            folder_name = Path(item['current_path']).name
-            new_path = str(Path(series_path) / folder_name)
+    Args:
+        config: Configuration dictionary
+        logger: Logger instance
+        dry_run: If True, don't actually move items
 
-            try:
-                # Update metadata
-                sonarr.update_series(
-                    item['id'],
-                    {'path': new_path, 'rootFolderPath': series_path}
-                )
-                logger.info(f"Updated path: {item['title']} → {new_path}")
+    Returns:
+        Tuple of (to_kids_count, to_adult_count)
+    """
+    logger.info("\n" + "="*60)
+    logger.info("RESORTING SERIES")
+    logger.info("="*60)
 
-                # Trigger file move operation
-                sonarr.move_series(item['id'])
-                logger.info(f"MOVED to adult: {item['title']} ({item['year']})")
-            except Exception as e:
-                logger.error(f"Failed to move {item['title']}: {e}")
+    # One keep-alive connection per parallel move worker
+    workers = max(1, config.get('concurrency', {}).get('arr_workers', ARR_WORKERS))
+    sonarr = SonarrAPI(
+        config['sonarr']['url'],
+        config['sonarr']['api_key'],
+        pool_maxsize=workers
+    )
 
-    else:
-        logger.info("\n[DRY-RUN] No changes made")
+    # Create TMDB client for fetching missing certifications
+    tmdb = create_tmdb_client(config)
 
-    return len(to_kids), len(to_adult)
+    return _resort_library(
+        kind='series',
+        adult_folder='series',
+        kids_folder='kids_series',
+        adult_path=config['paths']['series'],
+        kids_path=config['paths']['kids_series'],
+        kids_ratings=normalize_ratings(config['thresholds']['kids_age_ratings']['series']),
+        iter_items=sonarr.iter_series,
+        update_fn=sonarr.update_series,
+        move_fn=sonarr.move_series,
+        bulk_fn=sonarr.bulk_edit_series,
+        lookup_fn=tmdb.get_tv_certification if tmdb else None,
+        catalog_endpoint='/api/v3/series',
+        client=sonarr,
+        config=config,
+        logger=logger,
+        dry_run=dry_run
+    )
 
 
 def resort_libraries(
@@ -389,7 +596,7 @@ def resort_libraries(
         True if successful, False otherwise
     """
     logger = setup_logging('library_resort.log', level=config['logging']['level'])
-    notifier = create_notifier(config)
+    ntfy_config = config['notifications']['ntfy']
 
     logger.info("="*60)
     logger.info("LIBRARY RESORT STARTED")
@@ -412,25 +619,38 @@ def resort_libraries(
                 'series_to_adult': 0
             }
 
-            # Process movies
-            if not series_only:
-                try:
-                    movies_to_kids, movies_to_adult = resort_movies(config, logger, dry_run)
-                    total_stats['movies_to_kids'] = movies_to_kids
-                    total_stats['movies_to_adult'] = movies_to_adult
-                except Exception as e:
-                    logger.error(f"Failed to resort movies: {e}")
-                    logger.exception(e)
-
-            # Process series
-            if not movies_only:
-                try:
-                    series_to_kids, series_to_adult = resort_series(config, logger, dry_run)
-                    total_stats['series_to_kids'] = series_to_kids
-                    total_stats['series_to_adult'] = series_to_adult
-                except Exception as e:
-                    logger.error(f"Failed to resort series: {e}")
-                    logger.exception(e)
+            # Resort movies and series in parallel (Radarr and Sonarr are
+            # independent services); tag log lines so they stay readable
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                movies_future = None
+                series_future = None
+
+                if not series_only:
+                    movies_future = executor.submit(
+                        resort_movies, config, PrefixAdapter(logger, {'prefix': 'movies'}), dry_run
+                    )
+                if not movies_only:
+                    series_future = executor.submit(
+                        resort_series, config, PrefixAdapter(logger, {'prefix': 'series'}), dry_run
+                    )
+
+                if movies_future:
+                    try:
+                        movies_to_kids, movies_to_adult = movies_future.result()
+                        total_stats['movies_to_kids'] = movies_to_kids
+                        total_stats['movies_to_adult'] = movies_to_adult
+                    except Exception as e:
+                        logger.error(f"Failed to resort movies: {e}")
+                        logger.exception(e)
+
+                if series_future:
+                    try:
+                        series_to_kids, series_to_adult = series_future.result()
+                        total_stats['series_to_kids'] = series_to_kids
+                        total_stats['series_to_adult'] = series_to_adult
+                    except Exception as e:
+                        logger.error(f"Failed to resort series: {e}")
+                        logger.exception(e)
 
             # Summary
             logger.info("\n" + "="*60)
@@ -444,9 +664,11 @@ def resort_libraries(
             total_moved = sum(total_stats.values())
             logger.info(f"Total items moved: {total_moved}")
 
-            # Success notification (if items were moved)
-            if total_moved > 0 and config['notifications']['ntfy']['send_on_success']:
-                notifier.notify_success(
+            # Success notification (if items were actually moved)
+            if (not dry_run and total_moved > 0 and ntfy_config.get('enabled', True)
+                    and ntfy_config['send_on_success']):
+                from utils.ntfy_notifier import create_notifier
+                create_notifier(config).notify_success(
                     'library_resort',
                     f'Resorted {total_moved} items',
                     stats=total_stats
@@ -461,7 +683,9 @@ def resort_libraries(
     except Exception as e:
         error_msg = f"Unexpected error during resort: {e}"
         logger.exception(error_msg)
-        notifier.notify_error('library_resort', error_msg, details=str(e))
+        if ntfy_config.get('enabled', True):
+            from utils.ntfy_notifier import create_notifier
+            create_notifier(config).notify_error('library_resort', error_msg, details=str(e))
         return False
 
 
@@ -60,9 +60,9 @@ from utils.logger import setup_logging
 from utils.ntfy_notifier import create_notifier
 from utils.validators import (
     acquire_lock,
-    verify_file_exists,
-    verify_file_size_match,
-    is_protected_folder
+    index_local_files,
+    sizes_match,
+    compile_protected_folders
 )
 from utils.seedbox_ssh import SeedboxSSH, SeedboxError
 
@@ -106,8 +106,15 @@ def purge_seedbox(config: dict, dry_run: bool = False) -> bool:
             ) as ssh:
                 logger.info("SSH connection established")
 
-                # Check disk usage
-                usage = ssh.get_disk_usage()
+                # List old files and check disk usage in one remote command
+                age_days = config['thresholds']['seedbox_age_days']
+                logger.info(f"Finding files older than {age_days} days...")
+
+                remote_files, usage = ssh.list_files_and_usage(
+                    sb['remote_downloads'],
+                    older_than_days=age_days
+                )
+
                 logger.info(
                     f"Disk usage: {usage['used_gb']:.1f} GB / {usage['total_gb']:.1f} GB "
                     f"({usage['percent_used']:.1f}%)"
@@ -127,50 +134,45 @@ def purge_seedbox(config: dict, dry_run: bool = False) -> bool:
                         recommendation='Run purge immediately or check for large files'
                     )
 
-                # List old files
-                age_days = config['thresholds']['seedbox_age_days']
-                logger.info(f"Finding files older than {age_days} days...")
-
-                remote_files = ssh.list_files(
-                    sb['remote_downloads'],
-                    older_than_days=age_days
-                )
-
                 logger.info(f"Found {len(remote_files)} files older than {age_days} days")
 
                 # Process each file
                 deleted_count = 0
                 skipped_count = 0
                 total_size_deleted = 0
-                protected_folders = config['safety']['protected_folders']
+                to_delete = []  # (remote_path, remote_size) verified for deletion
+                # Compile protected folder patterns once for the whole loop
+                is_protected = compile_protected_folders(config['safety']['protected_folders'])
+                size_tolerance = config['safety']['size_tolerance']
+
+                # Index local copies once (one directory walk instead of two
+                # stat calls per remote file)
+                local_index = index_local_files(config['paths']['downloads_done'])
+                logger.info(f"Indexed {len(local_index)} local files")
 
                 for remote_file in remote_files:
                     remote_path = remote_file['path']
                     remote_size = remote_file['size']
 
                     # Check if in protected folder
-                    if is_protected_folder(remote_path, protected_folders):
+                    if is_protected(remote_path):
                         logger.info(f"PROTECTED: {remote_path}")
                         skipped_count += 1
                         continue
 
-                    # Build local path
+                    # Look up local copy in the index
                     # Remote: /downloads/file.mkv -> Local: /mnt/media/downloads/_done/file.mkv
                     remote_rel = remote_path.replace(sb['remote_downloads'], '').lstrip('/')
-                    local_path = os.path.join(config['paths']['downloads_done'], remote_rel)
+                    local_size = local_index.get(os.path.normpath(remote_rel))
 
                     # Verify local file exists
-                    if not verify_file_exists(local_path):
+                    if local_size is None:
                         logger.warning(f"SKIP (not local): {remote_path}")
                         skipped_count += 1
                         continue
 
                     # Verify size matches
-                    if not verify_file_size_match(
-                        local_path,
-                        remote_size,
-                        tolerance=config['safety']['size_tolerance']
-                    ):
+                    if not sizes_match(local_size, remote_size, tolerance=size_tolerance):
                         logger.warning(f"SKIP (size mismatch): {remote_path}")
                         skipped_count += 1
                         continue
@@ -181,14 +183,21 @@ def purge_seedbox(config: dict, dry_run: bool = False) -> bool:
                     if dry_run:
                         logger.info(f"[DRY-RUN] Would delete: {remote_path} ({size_gb:.2f} GB)")
                     else:
-                        try:
-                            ssh.delete_file(remote_path)
-                            logger.info(f"DELETED: {remote_path} ({size_gb:.2f} GB)")
+                        to_delete.append((remote_path, remote_size))
+
+                # Delete verified files with batched rm commands instead of
+                # one remote command per file
+                if to_delete:
+                    failed = ssh.delete_files([path for path, _ in to_delete])
+
+                    for remote_path, remote_size in to_delete:
+                        if remote_path in failed:
+                            logger.error(f"Failed to delete {remote_path}: {failed[remote_path]}")
+                            skipped_count += 1
+                        else:
+                            logger.info(f"DELETED: {remote_path} ({remote_size / (1024 ** 3):.2f} GB)")
                             deleted_count += 1
                             total_size_deleted += remote_size
-                        except SeedboxError as e:
-                            logger.error(f"Failed to delete {remote_path}: {e}")
-                            skipped_count += 1
 
                 # Clean up empty directories (respecting protected folders)
                 if not dry_run and deleted_count > 0:
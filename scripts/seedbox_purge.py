@@ -61,10 +61,13 @@ import sys
 import argparse
 import time
 import os
+import json
 from pathlib import Path
 from typing import Dict, Set, Tuple, List, Optional, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import threading
+from collections import Counter
+from datetime import datetime, timezone
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -72,19 +75,69 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.config_loader import load_config
 from utils.logger import setup_logging
 from utils.ntfy_notifier import create_notifier
-from utils.validators import acquire_lock
+from utils.validators import acquire_lock, scan_files
 from utils.rtorrent_client import RTorrentClient
 from utils.api_clients import RadarrAPI, SonarrAPI
 from utils.seedbox_ssh import SeedboxSSH
 from utils.tmdb_client import create_tmdb_client
+from utils.http_cache import CACHE_DIR, write_atomic
 import re
 
 
-def classify_file(filepath: Path) -> str:
+# Auto-import concurrency (see auto_import_files). Workers default to
+# thresholds.auto_import_workers; TMDB matches the client's pool size,
+# Radarr/Sonarr adds (which trigger searches) stay low
+AUTO_IMPORT_WORKERS = 16
+TMDB_CONCURRENCY = 8
+ARR_ADD_CONCURRENCY = 4
+
+# Import history paging (see iter_import_history). Events are read back to
+# the oldest file in _done, minus a margin for clock skew between hosts
+HISTORY_PAGE_SIZE = 1000
+HISTORY_CUTOFF_MARGIN = 24 * 3600
+
+# Radarr/Sonarr state reused by runs started shortly after each other
+# (thresholds.arr_cache_ttl seconds, 0 disables; see load_arr_state_cache)
+ARR_STATE_TTL = 300
+ARR_STATE_CACHE_FILE = CACHE_DIR / 'seedbox_purge_arr_state.json'
+
+# Concurrent per-series Sonarr requests (kept low to avoid 429s; matches
+# the clients' default keep-alive pool size)
+SERIES_FETCH_WORKERS = 8
+
+# Concurrent local unlinks in Phase 3 (overlaps filesystem latency on
+# network mounts; see purge_local_done)
+LOCAL_DELETE_WORKERS = 16
+
+# File classification (see classify_file)
+SUBTITLE_EXTENSIONS = frozenset({'.srt', '.sub', '.ass', '.ssa', '.vtt', '.idx', '.sup'})
+VIDEO_EXTENSIONS = frozenset({'.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mpg', '.mpeg', '.wmv', '.flv', '.mov'})
+
+# Extra video patterns (trailers, samples, behind the scenes, etc.), compiled
+# once into a single alternation so each filename is scanned in one pass
+EXTRA_VIDEO_PATTERNS = (
+    r'[-_\.\s](trailer|preview|teaser|clip)s?[-_\.\s]',
+    r'[-_\.\s](sample|rarbg)[-_\.\s]',
+    r'[-_\.\s](behind\.?the\.?scenes?|bts|making\.?of)[-_\.\s]',
+    r'[-_\.\s](deleted\.?scenes?|extras?|bonus)[-_\.\s]',
+    r'[-_\.\s](featurette|interview|promo)[-_\.\s]',
+    r'[-_\.\s](proof|screener)[-_\.\s]',
+    r'^sample[-_\.]',
+    r'[-_\.]sample$',
+)
+EXTRA_VIDEO_RE = re.compile('|'.join(f'(?:{p})' for p in EXTRA_VIDEO_PATTERNS), re.IGNORECASE)
+
+# Videos smaller than this are samples/extras
+MIN_VIDEO_SIZE = 100 * 1024 * 1024
+
+
+def classify_file(filepath: Path, size_bytes: Optional[int] = None) -> str:
     """Classify file as 'video', 'subtitle', or 'extra'.
 
     Args:
         filepath: Path to file
+        size_bytes: File size if already known (e.g., from a directory
+            scan); skips the exists/stat calls
 
     Returns:
         'video', 'subtitle', or 'extra'
@@ -99,44 +152,35 @@ def classify_file(filepath: Path) -> str:
         >>> classify_file(Path('movie-sample.mkv'))
         'extra'
     """
+    # Lowercase the name once and slice the extension from it, instead of
+    # going through Path.suffix (which re-splits the name)
     filename = filepath.name.lower()
-    stem = filepath.stem.lower()
+    dot = filename.rfind('.')
+    suffix = filename[dot:] if dot > 0 else ''
 
     # Subtitle extensions
-    subtitle_exts = {'.srt', '.sub', '.ass', '.ssa', '.vtt', '.idx', '.sup'}
-    if filepath.suffix.lower() in subtitle_exts:
+    if suffix in SUBTITLE_EXTENSIONS:
         return 'subtitle'
 
     # Video extensions
-    video_exts = {'.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mpg', '.mpeg', '.wmv', '.flv', '.mov'}
-    if filepath.suffix.lower() not in video_exts:
+    if suffix not in VIDEO_EXTENSIONS:
         # Not a video file - classify as extra
         return 'extra'
 
     # Check for extra video patterns (trailers, samples, behind the scenes, etc.)
-    extra_patterns = [
-        r'[-_\.\s](trailer|preview|teaser|clip)s?[-_\.\s]',
-        r'[-_\.\s](sample|rarbg)[-_\.\s]',
-        r'[-_\.\s](behind\.?the\.?scenes?|bts|making\.?of)[-_\.\s]',
-        r'[-_\.\s](deleted\.?scenes?|extras?|bonus)[-_\.\s]',
-        r'[-_\.\s](featurette|interview|promo)[-_\.\s]',
-        r'[-_\.\s](proof|screener)[-_\.\s]',
-        r'^sample[-_\.]',
-        r'[-_\.]sample$',
-    ]
-
-    for pattern in extra_patterns:
-        if re.search(pattern, filename, re.IGNORECASE):
-            return 'extra'
+    if EXTRA_VIDEO_RE.search(filename):
+        return 'extra'
 
     # Check file size - videos under 100MB are likely samples/extras
-    try:
-        if filepath.exists():
-            size_mb = filepath.stat().st_size / (1024 * 1024)
-            if size_mb < 100:
-                return 'extra'
-    except:
-        pass
+    if size_bytes is None:
+        try:
+            if filepath.exists():
+                size_bytes = filepath.stat().st_size
+        except:
+            pass
+
+    if size_bytes is not None and size_bytes < MIN_VIDEO_SIZE:
+        return 'extra'
 
     return 'video'
 
@@ -166,6 +210,30 @@ def should_purge_file(filepath: Path) -> bool:
     return classify_file(filepath) == 'extra'
 
 
+# Filename parsing (see parse_media_filename), compiled once
+SERIES_PATTERNS = (
+    r'[Ss]\d{1,2}[Ee]\d{1,2}',  # S01E01
+    r'\d{1,2}x\d{1,2}',           # 1x01
+    r'Season\s*\d+',              # Season 1
+)
+SERIES_DETECT_RE = re.compile('|'.join(f'(?:{p})' for p in SERIES_PATTERNS))
+SERIES_STRIP_RE = re.compile('|'.join(f'(?:{p})' for p in SERIES_PATTERNS), re.IGNORECASE)
+QUALITY_TAGS_RE = re.compile(
+    r'(1080p|720p|480p|2160p|4K|BluRay|WEB-DL|HDTV|WEBRip|DVDRip|x264|x265|HEVC|AAC|AC3|DTS|'
+    r'PROPER|REPACK|EXTENDED|UNRATED|DC|Directors\.Cut|xvid|divx)',
+    re.IGNORECASE
+)
+BRACKET_TAG_RE = re.compile(r'\[.*?\]')
+RELEASE_GROUP_RE = re.compile(r'-[A-Z0-9]+$')
+YEAR_RE = re.compile(r'\b(19\d{2}|20\d{2})\b')
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Season/episode numbers (see check_episode_in_library). S01E02 anywhere in
+# the name takes priority over 1x02: the first branch must fail over the
+# whole name before the second is tried
+EPISODE_NUMBER_RE = re.compile(r'.*?[Ss](\d{1,2})[Ee](\d{1,2})|.*?(\d{1,2})x(\d{1,2})', re.DOTALL)
+
+
 def parse_media_filename(filename: str) -> Optional[Tuple[str, Optional[int], str]]:
     """Parse media filename to extract title, year, and content type.
 
@@ -186,40 +254,31 @@ def parse_media_filename(filename: str) -> Optional[Tuple[str, Optional[int], st
     name = Path(filename).stem
 
     # Detect series (S01E01, s01e01, 1x01 patterns)
-    series_patterns = [
-        r'[Ss]\d{1,2}[Ee]\d{1,2}',  # S01E01
-        r'\d{1,2}x\d{1,2}',           # 1x01
-        r'Season\s*\d+',              # Season 1
-    ]
-
-    is_series = any(re.search(pattern, name) for pattern in series_patterns)
+    is_series = SERIES_DETECT_RE.search(name) is not None
     content_type = 'series' if is_series else 'movie'
 
     # Remove quality tags
-    quality_tags = r'(1080p|720p|480p|2160p|4K|BluRay|WEB-DL|HDTV|WEBRip|DVDRip|x264|x265|HEVC|AAC|AC3|DTS|' \
-                   r'PROPER|REPACK|EXTENDED|UNRATED|DC|Directors\.Cut|xvid|divx)'
-    name = re.sub(quality_tags, ' ', name, flags=re.IGNORECASE)
+    name = QUALITY_TAGS_RE.sub(' ', name)
 
     # Remove release group tags (usually in brackets or after dash)
-    name = re.sub(r'\[.*?\]', ' ', name)  # [RELEASE]
-    name = re.sub(r'-[A-Z0-9]+$', ' ', name)  # -SPARKS
+    name = BRACKET_TAG_RE.sub(' ', name)  # [RELEASE]
+    name = RELEASE_GROUP_RE.sub(' ', name)  # -SPARKS
 
     # Extract year (4 digits)
-    year_match = re.search(r'\b(19\d{2}|20\d{2})\b', name)
+    year_match = YEAR_RE.search(name)
     year = int(year_match.group(1)) if year_match else None
 
     # Remove year from title
     if year:
         name = name.replace(str(year), ' ')
 
-    # For series, remove season/episode info
+    # For series, remove season/episode info (all patterns in one pass)
     if is_series:
-        for pattern in series_patterns:
-            name = re.sub(pattern, ' ', name, flags=re.IGNORECASE)
+        name = SERIES_STRIP_RE.sub(' ', name)
 
     # Clean up title
     title = name.replace('.', ' ').replace('_', ' ')
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = WHITESPACE_RE.sub(' ', title).strip()
 
     if not title:
         return None
@@ -274,9 +333,10 @@ def auto_import_files(
         logger.warning(f"Downloads directory not found: {downloads_done}")
         return (0, 0)
 
-    # Get existing movies and series
-    existing_movies = {m['title'].lower(): m for m in radarr.get_movies()}
-    existing_series = {s['title'].lower(): s for s in sonarr.get_series()}
+    # Get existing movie and series titles (casefolded; only the titles are
+    # needed, so catalogs are streamed instead of kept as whole dicts)
+    existing_movie_titles = frozenset(m['title'].casefold() for m in radarr.iter_movies())
+    existing_series_titles = frozenset(s['title'].casefold() for s in sonarr.iter_series())
 
     # Get quality profiles and root folders
     try:
@@ -299,448 +359,517 @@ def auto_import_files(
         logger.error(f"Failed to get Radarr/Sonarr configuration: {e}")
         return (0, 0)
 
-    # Scan for video files (excluding extras)
-    video_extensions = {'.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mpg', '.mpeg'}
-    all_video_files = []
+    # Work is mostly waiting on HTTP: run many files at once, but bound the
+    # TMDB lookups and the Radarr/Sonarr add calls separately
+    max_workers = config['thresholds'].get('auto_import_workers', AUTO_IMPORT_WORKERS)
+    tmdb_slots = threading.Semaphore(TMDB_CONCURRENCY)
+    arr_slots = threading.Semaphore(ARR_ADD_CONCURRENCY)
 
-    for ext in video_extensions:
-        all_video_files.extend(downloads_done.rglob(f'*{ext}'))
+    # (title, content_type) pairs already handled this run (only touched by
+    # the scanning thread)
+    claimed_titles = set()
 
-    # Filter out extras (trailers, samples, behind the scenes, etc.)
-    video_files = [f for f in all_video_files if classify_file(f) == 'video']
-    extras_found = len(all_video_files) - len(video_files)
+    def process_video_file(title, year, content_type):
+        """Import one title that passed the pre-checks (thread-safe).
 
-    logger.info(f"Found {len(all_video_files)} total video files in {downloads_done}")
-    logger.info(f"  Main videos: {len(video_files)}")
-    logger.info(f"  Extras (skipped): {extras_found}")
+        Returns:
+            Outcome: 'movie_imported', 'series_imported' or 'failed'
+        """
+        try:
+            # Determine if kids content
+            kids_ratings = config['thresholds']['kids_age_ratings']
+            rating_key = 'series' if content_type == 'series' else 'movies'
+            with tmdb_slots:
+                is_kids = tmdb.is_kids_content(
+                    title, year, content_type,
+                    kids_ratings[rating_key]
+                )
 
-    if len(video_files) == 0:
-        return (0, 0)
+            # Determine root folder
+            if content_type == 'movie':
+                root_folder = config['paths']['kids_movies'] if is_kids else config['paths']['movies']
+                quality_id = movie_quality_id
+            else:
+                root_folder = config['paths']['kids_series'] if is_kids else config['paths']['series']
+                quality_id = series_quality_id
 
-    logger.info(f"Processing {len(video_files)} files in parallel (max 5 workers)...")
+            category = "kids" if is_kids else "adult"
+            logger.info(f"📥 Importing {content_type}: {title} ({year}) [{category}] → {root_folder}")
 
-    movies_imported = 0
-    series_imported = 0
-    skipped = 0
-    failed = 0
+            if not dry_run:
+                # Search + add calls hit Radarr/Sonarr: only a few at a time
+                with arr_slots:
+                    try:
+                        if content_type == 'movie':
+                            # Use Radarr's search (returns proper TMDB metadata)
+                            search_results = radarr.search_movie(title, year)
+                            if search_results:
+                                tmdb_id = search_results[0].get('tmdbId')
+                                if not tmdb_id:
+                                    logger.warning(f"No TMDB ID in Radarr search results for: {title} ({year})")
+                                    return 'failed'
+
+                                radarr.add_movie(
+                                    tmdb_id=tmdb_id,
+                                    title=title,
+                                    year=year or search_results[0].get('year', 0),
+                                    quality_profile_id=quality_id,
+                                    root_folder_path=root_folder,
+                                    monitored=True,
+                                    search_on_add=True
+                                )
+                                return 'movie_imported'
+                            else:
+                                logger.warning(f"Movie not found in Radarr lookup: {title} ({year})")
+                                return 'failed'
+                        else:
+                            # Use Sonarr's search (returns proper TVDB metadata)
+                            search_results = sonarr.search_series(title, year)
+                            if search_results:
+                                tvdb_id = search_results[0].get('tvdbId')
+                                if not tvdb_id:
+                                    logger.warning(f"No TVDB ID in Sonarr search results for: {title}")
+                                    return 'failed'
+
+                                sonarr.add_series(
+                                    tvdb_id=tvdb_id,
+                                    title=title,
+                                    year=year or int(search_results[0].get('year', 0)),
+                                    quality_profile_id=quality_id,
+                                    root_folder_path=root_folder,
+                                    monitored=True,
+                                    search_on_add=True
+                                )
+                                return 'series_imported'
+                            else:
+                                logger.warning(f"Series not found in Sonarr lookup: {title}")
+                                return 'failed'
 
-    # Thread-safe counters
-    lock = threading.Lock()
+                    except Exception as e:
+                        logger.error(f"Failed to import {title}: {e}")
+                        return 'failed'
+            else:
+                # Dry run (counted as imported)
+                return 'movie_imported' if content_type == 'movie' else 'series_imported'
 
-    def process_video_file(video_file):
-        """Process a single video file (thread-safe)."""
-        nonlocal movies_imported, series_imported, skipped, failed
+        except Exception as e:
+            logger.error(f"Error processing {title}: {e}")
+            return 'failed'
 
-        try:
-            # Parse filename
-            parsed = parse_media_filename(video_file.name)
+    # Scan for video files in a single directory walk, feeding new titles
+    # to the pool as they are found: processing starts before the walk ends
+    # and only a bounded number of files is queued
+    video_extensions = {'.mkv', '.mp4', '.avi', '.m4v', '.ts', '.mpg', '.mpeg'}
+    max_pending = max_workers * 2
+    pending = set()
+    outcomes = Counter()
+    total_found = 0
+    extras_found = 0
+
+    logger.info(f"Scanning {downloads_done} and processing files in parallel (max {max_workers} workers)...")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for entry in scan_files(str(downloads_done), video_extensions):
+            total_found += 1
+            name = entry.name
+
+            # Cheapest checks first, so files that are extras or already
+            # handled cost no stat, TMDB or Arr call: extension (scan) →
+            # extra name patterns → parse → library/claimed sets → size →
+            # TMDB lookup (worker)
+            if EXTRA_VIDEO_RE.search(name.lower()):
+                extras_found += 1
+                continue
 
+            parsed = parse_media_filename(name)
             if not parsed:
                 if verbose:
-                    logger.debug(f"Could not parse: {video_file.name}")
-                with lock:
-                    skipped += 1
-                return 'skipped'
+                    logger.debug(f"Could not parse: {name}")
+                outcomes['skipped'] += 1
+                continue
 
             title, year, content_type = parsed
+            title_key = (title.casefold(), content_type)
 
             # Check if already in library
             if content_type == 'movie':
-                if title.lower() in existing_movies:
+                if title_key[0] in existing_movie_titles:
                     if verbose:
                         logger.debug(f"Already in Radarr: {title} ({year})")
-                    with lock:
-                        skipped += 1
-                    return 'skipped'
+                    outcomes['skipped'] += 1
+                    continue
             else:
-                if title.lower() in existing_series:
+                if title_key[0] in existing_series_titles:
                     if verbose:
                         logger.debug(f"Already in Sonarr: {title}")
-                    with lock:
-                        skipped += 1
-                    return 'skipped'
-
-            # Determine if kids content
-            kids_ratings = config['thresholds']['kids_age_ratings']
-            rating_key = 'series' if content_type == 'series' else 'movies'
-            is_kids = tmdb.is_kids_content(
-                title, year, content_type,
-                kids_ratings[rating_key]
-            )
+                    outcomes['skipped'] += 1
+                    continue
 
-            # Determine root folder
-            if content_type == 'movie':
-                root_folder = config['paths']['kids_movies'] if is_kids else config['paths']['movies']
-                quality_id = movie_quality_id
-            else:
-                root_folder = config['paths']['kids_series'] if is_kids else config['paths']['series']
-                quality_id = series_quality_id
+            # First file of a title claims it: further files of the same
+            # movie/series (e.g. other episodes) need no TMDB lookup or add
+            if title_key in claimed_titles:
+                if verbose:
+                    logger.debug(f"Already being imported: {title}")
+                outcomes['skipped'] += 1
+                continue
 
-            category = "kids" if is_kids else "adult"
-            logger.info(f"📥 Importing {content_type}: {title} ({year}) [{category}] → {root_folder}")
+            # Small videos are samples/extras (size comes from the scan; the
+            # extension and name patterns were checked above, so this is the
+            # only part of classify_file left to apply)
+            try:
+                size_bytes = entry.stat().st_size
+            except OSError as e:
+                # Moved out of _done since the scan (e.g. imported meanwhile)
+                logger.debug(f"Could not stat {entry.path}: {e}")
+                outcomes['skipped'] += 1
+                continue
 
-            if not dry_run:
-                try:
-                    if content_type == 'movie':
-                        # Use Radarr's search (returns proper TMDB metadata)
-                        search_results = radarr.search_movie(title, year)
-                        if search_results:
-                            tmdb_id = search_results[0].get('tmdbId')
-                            if not tmdb_id:
-                                logger.warning(f"No TMDB ID in Radarr search results for: {title} ({year})")
-                                with lock:
-                                    failed += 1
-                                return 'failed'
+            if size_bytes < MIN_VIDEO_SIZE:
+                extras_found += 1
+                continue
 
-                            radarr.add_movie(
-                                tmdb_id=tmdb_id,
-                                title=title,
-                                year=year or search_results[0].get('year', 0),
-                                quality_profile_id=quality_id,
-                                root_folder_path=root_folder,
-                                monitored=True,
-                                search_on_add=True
-                            )
-                            with lock:
-                                movies_imported += 1
-                            return 'imported'
-                        else:
-                            logger.warning(f"Movie not found in Radarr lookup: {title} ({year})")
-                            with lock:
-                                failed += 1
-                            return 'failed'
-                    else:
-                        # Use Sonarr's search (returns proper TVDB metadata)
-                        search_results = sonarr.search_series(title, year)
-                        if search_results:
-                            tvdb_id = search_results[0].get('tvdbId')
-                            if not tvdb_id:
-                                logger.warning(f"No TVDB ID in Sonarr search results for: {title}")
-                                with lock:
-                                    failed += 1
-                                return 'failed'
+            claimed_titles.add(title_key)
 
-                            sonarr.add_series(
-                                tvdb_id=tvdb_id,
-                                title=title,
-                                year=year or int(search_results[0].get('year', 0)),
-                                quality_profile_id=quality_id,
-                                root_folder_path=root_folder,
-                                monitored=True,
-                                search_on_add=True
-                            )
-                            with lock:
-                                series_imported += 1
-                            return 'imported'
-                        else:
-                            logger.warning(f"Series not found in Sonarr lookup: {title}")
-                            with lock:
-                                failed += 1
-                            return 'failed'
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                outcomes.update(future.result() for future in done)
 
-                except Exception as e:
-                    logger.error(f"Failed to import {title}: {e}")
-                    with lock:
-                        failed += 1
-                    return 'failed'
-            else:
-                # Dry run
-                with lock:
-                    if content_type == 'movie':
-                        movies_imported += 1
-                    else:
-                        series_imported += 1
-                return 'dry_run'
+            pending.add(executor.submit(process_video_file, title, year, content_type))
 
-        except Exception as e:
-            logger.error(f"Error processing {video_file.name}: {e}")
-            with lock:
-                failed += 1
-            return 'error'
+        # Tally the rest once all workers are done (errors already logged)
+        outcomes.update(future.result() for future in as_completed(pending))
 
-    # Process files in parallel
-    max_workers = min(5, len(video_files))  # Max 5 workers to avoid API rate limits
+    video_count = total_found - extras_found
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {executor.submit(process_video_file, vf): vf for vf in video_files}
+    logger.info(f"Found {total_found} total video files in {downloads_done}")
+    logger.info(f"  Main videos: {video_count}")
+    logger.info(f"  Extras (skipped): {extras_found}")
 
-        for future in as_completed(futures):
-            future.result()  # Wait for completion (errors already logged)
+    movies_imported = outcomes['movie_imported']
+    series_imported = outcomes['series_imported']
 
     # Summary
     logger.info("")
     logger.info(f"Movies imported: {movies_imported}")
     logger.info(f"Series imported: {series_imported}")
-    logger.info(f"Skipped (already in library): {skipped}")
-    logger.info(f"Failed: {failed}")
-    logger.info(f"Total processed: {len(video_files)}")
+    logger.info(f"Skipped (already in library or duplicate): {outcomes['skipped']}")
+    logger.info(f"Failed: {outcomes['failed']}")
+    logger.info(f"Total processed: {video_count}")
 
     return (movies_imported, series_imported)
 
 
-def get_imported_hashes(radarr: RadarrAPI, sonarr: SonarrAPI, logger) -> Set[str]:
-    """Get all imported torrent hashes from Radarr/Sonarr (parallelized).
+def fetch_imported_hashes(api, name: str, label: str, logger) -> Set[str]:
+    """Get imported torrent hashes from one service's import history.
 
     Args:
-        radarr: Radarr API client
-        sonarr: Sonarr API client
+        api: Radarr or Sonarr API client
+        name: Service name for log messages ('Radarr'/'Sonarr')
+        label: What the records are, for log messages ('movies'/'episodes')
         logger: Logger instance
 
     Returns:
-        Set of torrent hashes (lowercase for case-insensitive matching)
+        Set of torrent hashes (lowercase; empty if the request failed)
     """
-    imported = set()
-    lock = threading.Lock()
+    hashes = set()
+    try:
+        logger.info(f"Getting {name} import history...")
+        # Newest imports first, without embedded movie/series objects
+        # (only downloadId is read)
+        records = api.get_history(event_type=3, page_size=HISTORY_PAGE_SIZE)
 
-    def get_radarr_hashes():
-        """Get Radarr import history."""
-        try:
-            logger.info("Getting Radarr import history...")
-            radarr_history = radarr._request(
-                'GET',
-                '/api/v3/history',
-                params={'eventType': 3, 'pageSize': 1000}
-            )
+        count = 0
+        for record in records:
+            download_id = record.get('downloadId', '').lower()
+            if download_id:
+                hashes.add(download_id)
+                count += 1
 
-            count = 0
-            if radarr_history and 'records' in radarr_history:
-                for record in radarr_history['records']:
-                    download_id = record.get('downloadId', '').lower()
-                    if download_id:
-                        with lock:
-                            imported.add(download_id)
-                        count += 1
+        logger.info(f"Found {count} imported {label}")
 
-            logger.info(f"Found {count} imported movies")
+    except Exception as e:
+        logger.warning(f"Could not get {name} history: {e}")
 
-        except Exception as e:
-            logger.warning(f"Could not get Radarr history: {e}")
+    return hashes
 
-    def get_sonarr_hashes():
-        """Get Sonarr import history."""
-        try:
-            logger.info("Getting Sonarr import history...")
-            sonarr_history = sonarr._request(
-                'GET',
-                '/api/v3/history',
-                params={'eventType': 3, 'pageSize': 1000}
-            )
 
-            count = 0
-            if sonarr_history and 'records' in sonarr_history:
-                for record in sonarr_history['records']:
-                    download_id = record.get('downloadId', '').lower()
-                    if download_id:
-                        with lock:
-                            imported.add(download_id)
-                        count += 1
+def fetch_radarr_paths(radarr: RadarrAPI, logger) -> Set[str]:
+    """Get Radarr library file paths.
 
-            logger.info(f"Found {count} imported episodes")
+    Args:
+        radarr: Radarr API client
+        logger: Logger instance
 
-        except Exception as e:
-            logger.warning(f"Could not get Sonarr history: {e}")
+    Returns:
+        Set of movie file paths (empty if the request failed)
+    """
+    paths = set()
+    try:
+        logger.info("Getting Radarr library files...")
+        movies = radarr._request('GET', '/api/v3/movie')
+        movie_ids = [movie['id'] for movie in movies if movie.get('hasFile')]
 
-    # Fetch in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        futures = [
-            executor.submit(get_radarr_hashes),
-            executor.submit(get_sonarr_hashes)
-        ]
-        for future in as_completed(futures):
-            future.result()
+        # One batched request instead of one per movie
+        for movie_file in radarr.get_movie_files(movie_ids):
+            if 'path' in movie_file:
+                paths.add(movie_file['path'])
+
+        logger.info(f"Found {len(paths)} movie files in library")
+
+    except Exception as e:
+        logger.warning(f"Could not get Radarr library: {e}")
 
-    logger.info(f"Total unique imported hashes: {len(imported)}")
-    return imported
+    return paths
 
 
-def get_imported_paths(radarr: RadarrAPI, sonarr: SonarrAPI, logger) -> Set[str]:
-    """Get all imported media file paths from Radarr/Sonarr libraries (parallelized).
+def fetch_sonarr_paths(sonarr: SonarrAPI, logger) -> Set[str]:
+    """Get Sonarr library file paths.
 
     Args:
-        radarr: Radarr API client
         sonarr: Sonarr API client
         logger: Logger instance
 
     Returns:
-        Set of file paths in library (for checking if imports are complete)
+        Set of episode file paths (empty if the request failed)
     """
-    library_files = set()
-    lock = threading.Lock()
+    paths = set()
+    try:
+        logger.info("Getting Sonarr library files...")
+        series = sonarr._request('GET', '/api/v3/series')
+
+        def fetch_series_files(show):
+            # All files of the series in one request (a file shared by
+            # several episodes is listed once)
+            return [f['path'] for f in sonarr.get_episode_files(show['id']) if 'path' in f]
+
+        # Requests are latency-bound: run them concurrently
+        workers = min(SERIES_FETCH_WORKERS, len(series)) or 1
+        with ThreadPoolExecutor(max_workers=workers) as series_executor:
+            futures = [series_executor.submit(fetch_series_files, show) for show in series]
+            for future in as_completed(futures):
+                try:
+                    paths.update(future.result())
+                except Exception as e:
+                    logger.warning(f"Could not get Sonarr episode files: {e}")
 
-    def get_radarr_paths():
-        """Get Radarr library file paths."""
-        try:
-            logger.info("Getting Radarr library files...")
-            movies = radarr._request('GET', '/api/v3/movie')
-            count = 0
+        logger.info(f"Found {len(paths)} episode files in library")
 
-            for movie in movies:
-                if movie.get('hasFile'):
-                    movie_file = radarr._request('GET', f"/api/v3/moviefile/{movie['movieFile']['id']}")
-                    if movie_file:
-                        with lock:
-                            library_files.add(movie_file['path'])
-                        count += 1
+    except Exception as e:
+        logger.warning(f"Could not get Sonarr library: {e}")
 
-            logger.info(f"Found {count} movie files in library")
+    return paths
 
-        except Exception as e:
-            logger.warning(f"Could not get Radarr library: {e}")
 
-    def get_sonarr_paths():
-        """Get Sonarr library file paths."""
-        try:
-            logger.info("Getting Sonarr library files...")
-            series = sonarr._request('GET', '/api/v3/series')
-            count = 0
-            seen_file_ids = set()  # Track already processed file IDs
-
-            for show in series:
-                episodes = sonarr._request('GET', f"/api/v3/episode?seriesId={show['id']}")
-                for episode in episodes:
-                    # Check if episode has a file and get the file ID
-                    if episode.get('hasFile') and 'episodeFileId' in episode:
-                        file_id = episode['episodeFileId']
-
-                        # Skip if we already processed this file (multiple episodes can share a file)
-                        if file_id in seen_file_ids:
-                            continue
-                        seen_file_ids.add(file_id)
-
-                        # Fetch full episode file details (like Radarr does)
-                        episode_file = sonarr._request('GET', f"/api/v3/episodefile/{file_id}")
-                        if episode_file and 'path' in episode_file:
-                            with lock:
-                                library_files.add(episode_file['path'])
-                            count += 1
-
-            logger.info(f"Found {count} episode files in library")
+def iter_import_history(api, since: float, page_size: int = HISTORY_PAGE_SIZE):
+    """Yield import events newer than a timestamp, newest first.
 
-        except Exception as e:
-            logger.warning(f"Could not get Sonarr library: {e}")
+    History is requested sorted by date (descending) one page at a time,
+    and paging stops at the first event older than ``since`` instead of
+    pulling the whole history.
 
-    # Fetch in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        futures = [
-            executor.submit(get_radarr_paths),
-            executor.submit(get_sonarr_paths)
-        ]
-        for future in as_completed(futures):
-            future.result()
+    Args:
+        api: Radarr or Sonarr API client
+        since: Unix timestamp; older events are not returned
+        page_size: Records per history page
 
-    logger.info(f"Total files in libraries: {len(library_files)}")
-    return library_files
+    Yields:
+        History records (eventType 3, downloadFolderImported)
+    """
+    page = 1
+    while True:
+        records = api.get_history(event_type=3, page=page, page_size=page_size)
 
+        for record in records:
+            # Only the 'YYYY-MM-DDTHH:MM:SS' prefix is parsed (UTC): Python
+            # < 3.11 rejects the 7-digit .NET fractions in these dates
+            try:
+                event_ts = datetime.fromisoformat(record['date'][:19]).replace(tzinfo=timezone.utc).timestamp()
+            except (KeyError, TypeError, ValueError):
+                yield record  # Undated record: keep it, never stop on it
+                continue
+            if event_ts < since:
+                return
+            yield record
 
-def get_imported_done_files(radarr: RadarrAPI, sonarr: SonarrAPI, downloads_done: Path, logger) -> Set[str]:
-    """Get original filenames that were imported from the _done directory.
+        if len(records) < page_size:
+            return
+        page += 1
 
-    This function checks Radarr/Sonarr import history to find files that were
-    imported from the downloads_done directory, using the ORIGINAL filename
-    before Radarr/Sonarr renamed them.
+
+def done_history_cutoff(downloads_done: Path) -> Optional[float]:
+    """Timestamp before which import history cannot concern _done files.
+
+    Only imports newer than the oldest file still in _done can match one
+    of its files, so history is read newest first and paging stops there
+    (minus HISTORY_CUTOFF_MARGIN for clock skew).
 
     Args:
-        radarr: Radarr API client
-        sonarr: Sonarr API client
         downloads_done: Path to downloads_done directory
+
+    Returns:
+        Unix timestamp, or None if _done holds no files
+    """
+    oldest_mtime = None
+    if downloads_done.exists():
+        for entry in scan_files(str(downloads_done)):
+            try:
+                mtime = entry.stat().st_mtime
+            except OSError:
+                continue
+            if oldest_mtime is None or mtime < oldest_mtime:
+                oldest_mtime = mtime
+
+    if oldest_mtime is None:
+        return None
+    return oldest_mtime - HISTORY_CUTOFF_MARGIN
+
+
+def fetch_done_imports(api, name: str, downloads_done: Path, since: float, logger) -> Set[str]:
+    """Get original filenames one service imported from _done.
+
+    Args:
+        api: Radarr or Sonarr API client
+        name: Service name for log messages ('Radarr'/'Sonarr')
+        downloads_done: Path to downloads_done directory
+        since: Ignore imports older than this (see done_history_cutoff)
         logger: Logger instance
 
     Returns:
-        Set of original filenames that have been imported from _done
+        Set of original filenames (empty if the request failed)
     """
-    imported_files = set()
-    lock = threading.Lock()
+    # Convert downloads_done to string for path matching; the trailing
+    # separator keeps e.g. '_done_old/...' from matching '_done'
+    done_dir_prefix = str(downloads_done.resolve()).rstrip('/') + '/'
 
-    # Convert downloads_done to string for path matching
-    done_path_str = str(downloads_done.resolve())
+    filenames = set()
+    try:
+        logger.info(f"Getting {name} import history from _done...")
+        count = 0
+
+        for record in iter_import_history(api, since):
+            # Try droppedPath first (most reliable - full path)
+            dropped_path = record.get('data', {}).get('droppedPath', '')
+
+            # Check if this file came from _done directory (still a
+            # substring test: Radarr/Sonarr may see _done under another
+            # mount prefix)
+            if dropped_path and done_dir_prefix in dropped_path:
+                # Extract filename from dropped path (plain string split,
+                # no Path object per record)
+                filename = dropped_path.rpartition('/')[2]
+            else:
+                # Fallback to sourceTitle (may be just filename or release name)
+                source_path = record.get('sourceTitle', '')
+                if not source_path or source_path.startswith('/'):
+                    continue
+                # It's a filename, assume it came from _done
+                filename = source_path.rpartition('/')[2]
 
-    def get_radarr_imported():
-        """Get Radarr import history."""
-        try:
-            logger.info("Getting Radarr import history from _done...")
-            radarr_history = radarr._request(
-                'GET',
-                '/api/v3/history',
-                params={'eventType': 3, 'pageSize': 10000}
-            )
+            filenames.add(filename)
+            count += 1
 
-            count = 0
-            if radarr_history and 'records' in radarr_history:
-                for record in radarr_history['records']:
-                    # Try droppedPath first (most reliable - full path)
-                    dropped_path = record.get('data', {}).get('droppedPath', '')
-
-                    # Check if this file came from _done directory
-                    if dropped_path and done_path_str in dropped_path:
-                        # Extract filename from dropped path
-                        filename = Path(dropped_path).name
-                        with lock:
-                            imported_files.add(filename)
-                        count += 1
-                    else:
-                        # Fallback to sourceTitle (may be just filename or release name)
-                        source_path = record.get('sourceTitle', '')
-                        if source_path and not os.path.isabs(source_path):
-                            # It's a filename, assume it came from _done
-                            filename = Path(source_path).name
-                            with lock:
-                                imported_files.add(filename)
-                            count += 1
+        logger.info(f"Found {count} {name} imports from _done")
 
-            logger.info(f"Found {count} Radarr imports from _done")
+    except Exception as e:
+        logger.warning(f"Could not get {name} import history: {e}")
 
-        except Exception as e:
-            logger.warning(f"Could not get Radarr import history: {e}")
+    return filenames
 
-    def get_sonarr_imported():
-        """Get Sonarr import history."""
-        try:
-            logger.info("Getting Sonarr import history from _done...")
-            sonarr_history = sonarr._request(
-                'GET',
-                '/api/v3/history',
-                params={'eventType': 3, 'pageSize': 10000}
-            )
 
-            count = 0
-            if sonarr_history and 'records' in sonarr_history:
-                for record in sonarr_history['records']:
-                    # Try droppedPath first (most reliable - full path)
-                    dropped_path = record.get('data', {}).get('droppedPath', '')
-
-                    # Check if this file came from _done directory
-                    if dropped_path and done_path_str in dropped_path:
-                        # Extract filename from dropped path
-                        filename = Path(dropped_path).name
-                        with lock:
-                            imported_files.add(filename)
-                        count += 1
-                    else:
-                        # Fallback to sourceTitle (may be just filename or release name)
-                        source_path = record.get('sourceTitle', '')
-                        if source_path and not os.path.isabs(source_path):
-                            # It's a filename, assume it came from _done
-                            filename = Path(source_path).name
-                            with lock:
-                                imported_files.add(filename)
-                            count += 1
+def collect_arr_state(radarr: RadarrAPI, sonarr: SonarrAPI, downloads_done: Path, logger) -> Dict[str, Set[str]]:
+    """Fetch everything the purge phases need from Radarr/Sonarr at once.
 
-            logger.info(f"Found {count} Sonarr imports from _done")
+    All six fetches (import hashes, library files and _done imports, for
+    both services) are independent, so they share one pool and overlap;
+    each returns its own set and the sets are merged at the end.
 
-        except Exception as e:
-            logger.warning(f"Could not get Sonarr import history: {e}")
+    Args:
+        radarr: Radarr API client
+        sonarr: Sonarr API client
+        downloads_done: Path to downloads_done directory
+        logger: Logger instance
 
-    # Fetch in parallel
-    with ThreadPoolExecutor(max_workers=2) as executor:
-        futures = [
-            executor.submit(get_radarr_imported),
-            executor.submit(get_sonarr_imported)
-        ]
-        for future in as_completed(futures):
-            future.result()
+    Returns:
+        Dict with 'imported_hashes' (Phase 1), 'library_files' (Phase 2)
+        and 'imported_done_files' (Phase 3)
+    """
+    since = done_history_cutoff(downloads_done)
+    if since is None:
+        logger.info("No files in _done, skipping import history")
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        futures = {
+            'imported_hashes': [
+                executor.submit(fetch_imported_hashes, radarr, 'Radarr', 'movies', logger),
+                executor.submit(fetch_imported_hashes, sonarr, 'Sonarr', 'episodes', logger),
+            ],
+            'library_files': [
+                executor.submit(fetch_radarr_paths, radarr, logger),
+                executor.submit(fetch_sonarr_paths, sonarr, logger),
+            ],
+            'imported_done_files': [] if since is None else [
+                executor.submit(fetch_done_imports, radarr, 'Radarr', downloads_done, since, logger),
+                executor.submit(fetch_done_imports, sonarr, 'Sonarr', downloads_done, since, logger),
+            ],
+        }
+        state = {
+            key: set().union(*(future.result() for future in key_futures))
+            for key, key_futures in futures.items()
+        }
+
+    logger.info(f"Total unique imported hashes: {len(state['imported_hashes'])}")
+    logger.info(f"Total files in libraries: {len(state['library_files'])}")
+    logger.info(f"Total unique filenames imported from _done: {len(state['imported_done_files'])}")
+    return state
+
+
+def load_arr_state_cache(cache_path: Path, key: str, ttl: int, downloads_done: Path) -> Optional[Dict[str, Set[str]]]:
+    """Load Radarr/Sonarr state saved by a recent run.
+
+    The cache is ignored when it is older than ``ttl`` seconds, was saved
+    for other services/paths, or when downloads_done changed since (its
+    mtime moves whenever files are added or removed at the top level).
+    Within the TTL, cached state can lag the servers: imports made since
+    are missed (those files are kept), and library_files can still list
+    files removed from the library in the meantime (remote copies with
+    the same name may be purged as imported).
+
+    Args:
+        cache_path: Path to cache file
+        key: Identifies the services and paths the state belongs to
+        ttl: Maximum age in seconds
+        downloads_done: Path to downloads_done directory
 
-    logger.info(f"Total unique filenames imported from _done: {len(imported_files)}")
-    return imported_files
+    Returns:
+        State dict (as returned by collect_arr_state) or None
+    """
+    try:
+        with open(cache_path, 'r') as f:
+            cache = json.load(f)
+        fetched_at = cache['fetched_at']
+        if cache['key'] != key or time.time() - fetched_at >= ttl:
+            return None
+        if downloads_done.exists() and downloads_done.stat().st_mtime > fetched_at:
+            return None
+        return {name: set(values) for name, values in cache['state'].items()}
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def save_arr_state_cache(cache_path: Path, key: str, state: Dict[str, Set[str]]) -> None:
+    """Save Radarr/Sonarr state for the next run (atomically).
+
+    Args:
+        cache_path: Path to cache file
+        key: Identifies the services and paths the state belongs to
+        state: State dict (as returned by collect_arr_state)
+    """
+    cache = {
+        'key': key,
+        'fetched_at': time.time(),
+        'state': {name: sorted(values) for name, values in state.items()},
+    }
+    write_atomic(cache_path, (json.dumps(cache).encode('utf-8'),))
 
 
 def meets_policy(torrent: Dict, min_ratio: float, min_days: int) -> Tuple[bool, str]:
@@ -804,39 +933,35 @@ def purge_torrents(
     min_ratio = config['thresholds'].get('seedbox_min_ratio', 1.5)
     min_days = config['thresholds'].get('seedbox_age_days', 2)
 
-    deleted_count = 0
-    kept_count = 0
-    not_imported_count = 0
-    total_size_deleted = 0
-
-    # Thread-safe counters
-    lock = threading.Lock()
-
-    # Get seeding torrents
+    # Get seeding torrents with their details (one XMLRPC call for all)
     try:
-        seeding_hashes = rtorrent.get_seeding_torrents()
-        logger.info(f"Found {len(seeding_hashes)} seeding torrents")
+        seeding_torrents = rtorrent.get_all_torrents_info('seeding')
+        logger.info(f"Found {len(seeding_torrents)} seeding torrents")
     except Exception as e:
         logger.error(f"Failed to get seeding torrents: {e}")
         return 0, 0
 
     # Filter to only imported torrents
-    imported_seeding = [h for h in seeding_hashes if h.lower() in imported_hashes]
-    not_imported_count = len(seeding_hashes) - len(imported_seeding)
+    imported_seeding = [t for t in seeding_torrents if t['hash'].lower() in imported_hashes]
+    not_imported_count = len(seeding_torrents) - len(imported_seeding)
 
     if verbose:
         logger.info(f"Skipping {not_imported_count} torrents (not imported)")
 
     logger.info(f"Processing {len(imported_seeding)} imported torrents in parallel (max 10 workers)...")
 
-    def process_torrent(hash_id):
-        """Process a single torrent (thread-safe)."""
-        nonlocal deleted_count, kept_count, total_size_deleted
+    def process_torrent(torrent):
+        """Process a single torrent (thread-safe).
 
-        try:
-            # Get torrent info
-            torrent = rtorrent.get_torrent_info(hash_id)
+        Args:
+            torrent: Torrent info dict (from get_all_torrents_info)
 
+        Returns:
+            Tuple of (outcome, bytes_freed); outcome is 'deleted', 'kept'
+            or 'failed' (dry-run deletions count as 'deleted', 0 bytes)
+        """
+        hash_id = torrent['hash']
+        try:
             # Check policy
             should_delete, reason = meets_policy(torrent, min_ratio, min_days)
 
@@ -853,36 +978,39 @@ def purge_torrents(
                     try:
                         rtorrent.delete_torrent(hash_id, delete_files=True)
                         logger.info(f"    ✅ Deleted: {torrent['name']}")
-                        with lock:
-                            total_size_deleted += torrent['size_bytes']
+                        return 'deleted', torrent['size_bytes']
                     except Exception as e:
                         logger.error(f"    ❌ Failed to delete {torrent['name']}: {e}")
-                        return False
+                        return 'failed', 0
 
-                with lock:
-                    deleted_count += 1
-                return True
+                return 'deleted', 0
             else:
                 if verbose:
                     logger.info(f"✅ KEEP: {torrent['name']} ({reason})")
-                with lock:
-                    kept_count += 1
-                return False
+                return 'kept', 0
 
         except Exception as e:
             logger.warning(f"Could not process {hash_id[:8]}: {e}")
-            return False
+            return 'failed', 0
 
     # Process torrents in parallel
     max_workers = min(10, len(imported_seeding))  # Max 10 concurrent connections
 
+    outcomes = Counter()
+    total_size_deleted = 0
+
     if max_workers > 0:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(process_torrent, hash_id): hash_id
-                      for hash_id in imported_seeding}
+            futures = [executor.submit(process_torrent, torrent) for torrent in imported_seeding]
 
+            # Sum each worker's result once it completes (errors already logged)
             for future in as_completed(futures):
-                future.result()  # Wait for completion (errors already logged)
+                outcome, size_freed = future.result()
+                outcomes[outcome] += 1
+                total_size_deleted += size_freed
+
+    deleted_count = outcomes['deleted']
+    kept_count = outcomes['kept']
 
     logger.info("")
     logger.info(f"Phase 1 Summary:")
@@ -977,6 +1105,10 @@ def purge_remote_files(
         ) as ssh:
             logger.info(f"Connected to seedbox via SSH")
 
+            # Library filenames, for an O(1) lookup per remote file
+            library_names = {lib_path.rpartition('/')[2] for lib_path in library_files}
+            protected = config['safety'].get('protected_folders', [])
+
             # Process each directory
             for dir_info in directories_to_clean:
                 remote_path = dir_info['path']
@@ -994,13 +1126,15 @@ def purge_remote_files(
                 remote_files = ssh.list_files(remote_path)
                 logger.info(f"  Found {len(remote_files)} files")
 
+                # Files to delete once the listing is classified
+                to_delete = []
+
                 # Check each file in this directory
                 for file_info in remote_files:
                     file_path = file_info['path']
                     file_size = file_info['size']
 
                     # Skip if in protected folder
-                    protected = config['safety'].get('protected_folders', [])
                     if any(prot in file_path for prot in protected):
                         if verbose:
                             logger.info(f"  PROTECTED: {file_path}")
@@ -1012,7 +1146,7 @@ def purge_remote_files(
 
                     # Check if file exists in Radarr/Sonarr library
                     filename = file_pathobj.name
-                    in_library = any(filename in lib_path for lib_path in library_files)
+                    in_library = filename in library_names
 
                     # Decision logic:
                     # 1. If it's an extra file, always delete
@@ -1040,18 +1174,25 @@ def purge_remote_files(
                         logger.info(f"  🗑️  [DRY-RUN] Would delete remote: {file_path} ({size_gb:.2f} GB) - {reason}")
                     else:
                         logger.info(f"  🗑️  Deleting remote: {file_path} ({size_gb:.2f} GB) - {reason}")
-                        try:
-                            ssh.delete_file(file_path)
-                            logger.info("      ✅ Deleted successfully")
-                            total_size_deleted += file_size
-                            deleted_count += 1
-                        except Exception as e:
-                            logger.error(f"      ❌ Failed to delete: {e}")
+                        to_delete.append(file_info)
+
+                # Delete with batched rm commands (one round-trip per batch
+                # instead of one per file)
+                if to_delete:
+                    failed = ssh.delete_files([f['path'] for f in to_delete])
+                    dir_deleted = 0
+                    for file_info in to_delete:
+                        if file_info['path'] in failed:
+                            logger.error(f"      ❌ Failed to delete {file_info['path']}: {failed[file_info['path']]}")
+                        else:
+                            total_size_deleted += file_info['size']
+                            dir_deleted += 1
+                    deleted_count += dir_deleted
+                    logger.info(f"  ✅ Deleted {dir_deleted}/{len(to_delete)} files")
 
                 # Clean up empty directories in this path (respecting protected folders)
                 if not dry_run and deleted_count > 0:
                     logger.info(f"  Cleaning up empty directories in {remote_path}...")
-                    protected = config['safety'].get('protected_folders', [])
                     empty_dirs = ssh.delete_empty_directories(remote_path, exclude_paths=protected)
                     logger.info(f"  Removed {empty_dirs} empty directories (protected folders preserved)")
 
@@ -1069,7 +1210,116 @@ def purge_remote_files(
     return deleted_count, total_size_deleted
 
 
-def check_episode_in_library(radarr: RadarrAPI, sonarr: SonarrAPI, filepath: Path, logger) -> bool:
+def build_title_index(titles: List[str]) -> dict:
+    """Index lowercase titles for the fuzzy match in check_episode_in_library.
+
+    Args:
+        titles: Lowercase titles; positions are the IDs returned by match_titles
+
+    Returns:
+        Dict with 'titles', 'exact' (title -> positions), 'trigrams'
+        (3-character substring -> positions) and 'max_len'
+    """
+    exact = {}
+    trigrams = {}
+    for position, title in enumerate(titles):
+        exact.setdefault(title, []).append(position)
+        for i in range(len(title) - 2):
+            trigrams.setdefault(title[i:i + 3], set()).add(position)
+
+    return {
+        'titles': titles,
+        'exact': exact,
+        'trigrams': trigrams,
+        'max_len': max(map(len, titles), default=0),
+    }
+
+
+def match_titles(index: dict, query: str) -> List[int]:
+    """Find indexed titles that contain, or are contained in, the query.
+
+    Same result as testing ``query in title or title in query`` against
+    every title, without scanning the whole library:
+    - titles inside the query are found by looking up each substring of
+      the query (up to the longest title) in the exact-title map
+    - titles containing the query must contain all of its trigrams, so
+      only titles in every trigram's posting list are checked
+
+    Args:
+        index: Index from build_title_index
+        query: Lowercase title parsed from a filename
+
+    Returns:
+        Matching title positions in library order
+    """
+    titles = index['titles']
+    exact = index['exact']
+    matches = set(exact.get('', ()))
+
+    # title in query
+    for start in range(len(query)):
+        for end in range(start + 1, min(len(query), start + index['max_len']) + 1):
+            positions = exact.get(query[start:end])
+            if positions:
+                matches.update(positions)
+
+    # query in title
+    if len(query) < 3:
+        matches.update(i for i, title in enumerate(titles) if query in title)
+    else:
+        postings = [index['trigrams'].get(query[i:i + 3]) for i in range(len(query) - 2)]
+        if all(postings):
+            postings.sort(key=len)
+            candidates = set.intersection(*postings)
+            matches.update(i for i in candidates if query in titles[i])
+
+    return sorted(matches)
+
+
+def load_library_index(radarr: RadarrAPI, sonarr: SonarrAPI, logger) -> dict:
+    """Fetch the Radarr/Sonarr catalogs once for fallback library checks.
+
+    Args:
+        radarr: Radarr API client
+        sonarr: Sonarr API client
+        logger: Logger instance
+
+    Returns:
+        Dict with:
+        - 'movies': (lowercase title, year, title) of movies with a file,
+          or None if Radarr could not be queried
+        - 'series': (lowercase title, series ID, title) of all series,
+          or None if Sonarr could not be queried
+        - 'movie_titles' / 'series_titles': build_title_index over the
+          lowercase titles of 'movies' / 'series'
+        - 'episodes': Per-series cache of (season, episode) pairs with a
+          file, filled on demand by check_episode_in_library
+    """
+    index = {'movies': None, 'series': None, 'episodes': {}}
+
+    try:
+        index['movies'] = [
+            (movie.get('title', '').lower(), movie.get('year', 0), movie.get('title', ''))
+            for movie in radarr.get_movies()
+            if movie.get('hasFile')
+        ]
+        index['movie_titles'] = build_title_index([movie[0] for movie in index['movies']])
+    except Exception as e:
+        logger.warning(f"Could not fetch Radarr movies for fallback detection: {e}")
+
+    try:
+        index['series'] = [
+            (series.get('title', '').lower(), series['id'], series.get('title', ''))
+            for series in sonarr.get_series()
+        ]
+        index['series_titles'] = build_title_index([series[0] for series in index['series']])
+    except Exception as e:
+        logger.warning(f"Could not fetch Sonarr series for fallback detection: {e}")
+
+    return index
+
+
+def check_episode_in_library(library: dict, sonarr: SonarrAPI, filepath: Path, logger) -> bool:
     """Check if a file's episode/movie exists in library with a file attached.
 
     This function provides fallback detection for files that were manually imported
@@ -1077,8 +1327,9 @@ def check_episode_in_library(radarr: RadarrAPI, sonarr: SonarrAPI, filepath: Pat
     checks if that content exists in the library with hasFile=true.
 
     Args:
-        radarr: Radarr API client
-        sonarr: Sonarr API client
+        library: Catalog index from load_library_index (episode lists are
+            cached into it as series are matched)
+        sonarr: Sonarr API client (for episode lists of matched series)
         filepath: Path to file in _done
         logger: Logger instance
 
@@ -1092,59 +1343,56 @@ def check_episode_in_library(radarr: RadarrAPI, sonarr: SonarrAPI, filepath: Pat
             return False
 
         title, year, content_type = parsed
+        title_lower = title.lower()
 
         if content_type == 'movie':
-            # Search Radarr for movie
-            try:
-                movies = radarr._request('GET', '/api/v3/movie')
-                for movie in movies:
-                    movie_title = movie.get('title', '').lower()
-                    movie_year = movie.get('year', 0)
-
-                    # Match by title (fuzzy) and year (if available)
-                    if title.lower() in movie_title or movie_title in title.lower():
-                        if year is None or movie_year == year:
-                            if movie.get('hasFile'):
-                                logger.debug(f"Found movie in library: {movie['title']} ({movie_year})")
-                                return True
-                return False
-            except Exception as e:
-                logger.debug(f"Error checking Radarr for {title}: {e}")
+            if library['movies'] is None:
                 return False
 
-        else:  # series
-            # Parse season/episode from filename
-            match = re.search(r'[Ss](\d{1,2})[Ee](\d{1,2})', filepath.name)
-            if not match:
-                # Try alternative format: 1x01
-                match = re.search(r'(\d{1,2})x(\d{1,2})', filepath.name)
+            # Match by title (fuzzy) and year (if available)
+            for position in match_titles(library['movie_titles'], title_lower):
+                _, movie_year, display_title = library['movies'][position]
+                if year is None or movie_year == year:
+                    logger.debug(f"Found movie in library: {display_title} ({movie_year})")
+                    return True
+            return False
 
+        else:  # series
+            # Parse season/episode from filename (S01E01, or 1x01)
+            match = EPISODE_NUMBER_RE.match(filepath.name)
             if not match:
                 return False
 
-            season = int(match.group(1))
-            episode = int(match.group(2))
+            s_num, e_num, alt_s_num, alt_e_num = match.groups()
+            season = int(s_num or alt_s_num)
+            episode = int(e_num or alt_e_num)
 
-            # Search Sonarr for series
-            try:
-                series_list = sonarr._request('GET', '/api/v3/series')
-                for series in series_list:
-                    series_title = series.get('title', '').lower()
-
-                    # Match by title (fuzzy)
-                    if title.lower() in series_title or series_title in title.lower():
-                        # Found series, check if episode has file
-                        episodes = sonarr._request('GET', f"/api/v3/episode?seriesId={series['id']}")
-                        for ep in episodes:
-                            if ep.get('seasonNumber') == season and ep.get('episodeNumber') == episode:
-                                if ep.get('hasFile'):
-                                    logger.debug(f"Found episode in library: {series['title']} S{season:02d}E{episode:02d}")
-                                    return True
-                return False
-            except Exception as e:
-                logger.debug(f"Error checking Sonarr for {title} S{season:02d}E{episode:02d}: {e}")
+            if library['series'] is None:
                 return False
 
+            episodes_cache = library['episodes']
+            # Match by title (fuzzy)
+            for position in match_titles(library['series_titles'], title_lower):
+                _, series_id, display_title = library['series'][position]
+
+                # Found series, check if episode has file (episode list
+                # fetched once per series)
+                if series_id not in episodes_cache:
+                    try:
+                        episodes_cache[series_id] = {
+                            (ep.get('seasonNumber'), ep.get('episodeNumber'))
+                            for ep in sonarr.get_episodes(series_id)
+                            if ep.get('hasFile')
+                        }
+                    except Exception as e:
+                        logger.debug(f"Error checking Sonarr for {title} S{season:02d}E{episode:02d}: {e}")
+                        continue
+
+                if (season, episode) in episodes_cache[series_id]:
+                    logger.debug(f"Found episode in library: {display_title} S{season:02d}E{episode:02d}")
+                    return True
+            return False
+
     except Exception as e:
         logger.debug(f"Error in check_episode_in_library for {filepath.name}: {e}")
         return False
@@ -1213,13 +1461,29 @@ def purge_local_done(
 
     logger.info(f"Scanning {downloads_done}...")
 
-    # Walk through all files in _done
-    for item in downloads_done.rglob('*'):
-        if not item.is_file():
+    # Radarr/Sonarr catalogs for fallback detection, fetched on first use
+    library = None
+
+    # (path, size, reason) of files to delete once the walk is done
+    to_delete = []
+
+    # Walk through all files in _done (one scandir pass; the size comes
+    # from a single stat per file, reused for classification and deletion)
+    for entry in scan_files(str(downloads_done)):
+        item = Path(entry.path)
+        try:
+            size_bytes = entry.stat().st_size
+        except FileNotFoundError:
+            # Deleted since the scan (likely imported by Radarr/Sonarr)
+            if verbose:
+                logger.info(f"Already deleted (likely imported by Radarr/Sonarr): {item}")
+            continue
+        except OSError as e:
+            logger.warning(f"Failed to stat {item}: {e}")
             continue
 
         # Classify file
-        classification = classify_file(item)
+        classification = classify_file(item, size_bytes)
 
         # Check if this file was imported from _done (via history)
         filename = item.name
@@ -1228,7 +1492,9 @@ def purge_local_done(
         # Fallback: Check if episode/movie exists in library (for manual imports)
         was_imported_library = False
         if not was_imported_history and classification in ('video', 'subtitle'):
-            was_imported_library = check_episode_in_library(radarr, sonarr, item, logger)
+            if library is None:
+                library = load_library_index(radarr, sonarr, logger)
+            was_imported_library = check_episode_in_library(library, sonarr, item, logger)
 
         was_imported = was_imported_history or was_imported_library
 
@@ -1253,45 +1519,60 @@ def purge_local_done(
                 logger.info(f"KEEP (not imported yet): {item} [{classification}]")
             continue
 
-        # Delete the file
-        try:
-            # Check if file still exists (may have been deleted by Radarr/Sonarr during import)
-            if not item.exists():
-                if verbose:
-                    logger.info(f"Already deleted (likely imported by Radarr/Sonarr): {item}")
-                continue
-
-            size_bytes = item.stat().st_size
+        if dry_run:
             size_gb = size_bytes / (1024 ** 3)
+            logger.info(f"🗑️  [DRY-RUN] Would delete local: {item} ({size_gb:.2f} GB) - {reason}")
+        else:
+            to_delete.append((item, size_bytes, reason))
 
-            if dry_run:
-                logger.info(f"🗑️  [DRY-RUN] Would delete local: {item} ({size_gb:.2f} GB) - {reason}")
-            else:
-                logger.info(f"🗑️  Deleting local: {item} ({size_gb:.2f} GB) - {reason}")
-                item.unlink()
-                logger.info("    ✅ Deleted successfully")
-                total_size_deleted += size_bytes
-                deleted_count += 1
+    def delete_local(item: Path, size_bytes: int, reason: str) -> Optional[int]:
+        """Delete one local file; returns bytes freed, or None if not deleted."""
+        size_gb = size_bytes / (1024 ** 3)
+        logger.info(f"🗑️  Deleting local: {item} ({size_gb:.2f} GB) - {reason}")
+        try:
+            item.unlink()
+            logger.info(f"    ✅ Deleted successfully: {item.name}")
+            return size_bytes
         except FileNotFoundError:
-            # File was deleted between our check and deletion attempt
+            # Removed by Radarr/Sonarr between the scan and the deletion attempt
             if verbose:
                 logger.info(f"Already deleted (race condition): {item}")
         except PermissionError as e:
             logger.error(f"    ❌ Permission denied: {item}: {e}")
         except Exception as e:
             logger.error(f"    ❌ Failed to delete {item}: {e}")
+        return None
+
+    # Unlink concurrently: each call blocks on the filesystem (slow on
+    # network mounts), so the waits overlap instead of adding up
+    if to_delete:
+        with ThreadPoolExecutor(max_workers=min(LOCAL_DELETE_WORKERS, len(to_delete))) as executor:
+            futures = [executor.submit(delete_local, *args) for args in to_delete]
+            for future in as_completed(futures):
+                size_freed = future.result()
+                if size_freed is not None:
+                    total_size_deleted += size_freed
+                    deleted_count += 1
 
     # Clean up empty directories
     if not dry_run and deleted_count > 0:
         logger.info("Cleaning up empty directories...")
-        for dirpath in sorted(downloads_done.rglob('*'), reverse=True):
+        # Bottom-up walk: children come before their parent, so a directory
+        # is empty once it has no files and all its subdirectories were removed
+        done_root = str(downloads_done)
+        removed_dirs = set()
+        for dirpath, dirnames, filenames in os.walk(done_root, topdown=False):
             # CRITICAL: NEVER delete the _done folder itself, only subdirectories within it
-            if dirpath != downloads_done and dirpath.is_dir() and not any(dirpath.iterdir()):
-                try:
-                    dirpath.rmdir()
-                    logger.info(f"Removed empty directory: {dirpath}")
-                except Exception as e:
-                    logger.debug(f"Could not remove {dirpath}: {e}")
+            if dirpath == done_root or filenames:
+                continue
+            if any(os.path.join(dirpath, d) not in removed_dirs for d in dirnames):
+                continue
+            try:
+                os.rmdir(dirpath)
+                removed_dirs.add(dirpath)
+                logger.info(f"Removed empty directory: {dirpath}")
+            except OSError as e:
+                logger.debug(f"Could not remove {dirpath}: {e}")
 
     logger.info("")
     logger.info(f"Phase 3 Summary:")
@@ -1342,23 +1623,40 @@ def comprehensive_purge(config: dict, args) -> bool:
                 config['radarr']['api_key']
             )
 
+            # Sonarr serves the per-series file fetches plus both history
+            # reads at the same time (see collect_arr_state)
             sonarr = SonarrAPI(
                 config['sonarr']['url'],
-                config['sonarr']['api_key']
+                config['sonarr']['api_key'],
+                pool_maxsize=SERIES_FETCH_WORKERS + 2
             )
 
             # Initialize TMDB client (optional, for auto-import)
             tmdb = create_tmdb_client(config)
 
-            # Get imported hashes (for Phase 1)
-            imported_hashes = get_imported_hashes(radarr, sonarr, logger)
-
-            # Get library files (for Phase 2)
-            library_files = get_imported_paths(radarr, sonarr, logger)
-
-            # Get imported filenames from _done (for Phase 3)
+            # Get imported hashes (Phase 1), library files (Phase 2) and
+            # filenames imported from _done (Phase 3) in one wave
             downloads_done = Path(config['paths']['downloads_done'])
-            imported_done_files = get_imported_done_files(radarr, sonarr, downloads_done, logger)
+            arr_state_ttl = config['thresholds'].get('arr_cache_ttl', ARR_STATE_TTL)
+            arr_state_key = f"{radarr.url}|{sonarr.url}|{downloads_done.resolve()}"
+
+            arr_state = None
+            if arr_state_ttl > 0:
+                arr_state = load_arr_state_cache(ARR_STATE_CACHE_FILE, arr_state_key, arr_state_ttl, downloads_done)
+                if arr_state:
+                    logger.info(f"Using Radarr/Sonarr state cached less than {arr_state_ttl}s ago")
+
+            if arr_state is None:
+                arr_state = collect_arr_state(radarr, sonarr, downloads_done, logger)
+                if arr_state_ttl > 0:
+                    try:
+                        save_arr_state_cache(ARR_STATE_CACHE_FILE, arr_state_key, arr_state)
+                    except OSError as e:
+                        logger.debug(f"Could not save Radarr/Sonarr state cache: {e}")
+
+            imported_hashes = arr_state['imported_hashes']
+            library_files = arr_state['library_files']
+            imported_done_files = arr_state['imported_done_files']
 
             logger.info("")
 
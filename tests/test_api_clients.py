@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Tests for the Radarr/Sonarr API clients (no network access needed).
+
+Server responses are replaced with mocks on the client instances.
+
+Usage:
+    python3 -m pytest tests/test_api_clients.py
+"""
+
+import sys
+import json
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.api_clients import APIError, RadarrAPI, SonarrAPI
+
+
+def test_radarr_add_tag_already_tagged_returns_movie():
+    """add_tag returns the movie unchanged when it already has the tag."""
+    radarr = RadarrAPI('http://localhost:7878', 'key')
+    movie = {'id': 1, 'title': 'The Lion King', 'tags': [5]}
+
+    with mock.patch.object(radarr, 'get_tags', return_value=[{'id': 5, 'label': 'kids'}]), \
+            mock.patch.object(radarr, 'get_movie', return_value=movie), \
+            mock.patch.object(radarr, '_request') as request:
+        assert radarr.add_tag(1, 'kids') == movie
+        request.assert_not_called()
+
+
+def test_radarr_add_tag_new_tag_updates_movie():
+    """add_tag PUTs the movie with the tag appended when it is missing."""
+    radarr = RadarrAPI('http://localhost:7878', 'key')
+    movie = {'id': 1, 'title': 'The Lion King', 'tags': []}
+
+    with mock.patch.object(radarr, 'get_tags', return_value=[{'id': 5, 'label': 'kids'}]), \
+            mock.patch.object(radarr, 'get_movie', return_value=movie), \
+            mock.patch.object(radarr, '_request', return_value={'id': 1, 'tags': [5]}) as request:
+        assert radarr.add_tag(1, 'kids') == {'id': 1, 'tags': [5]}
+        request.assert_called_once_with('PUT', '/api/v3/movie/1', json={**movie, 'tags': [5]})
+
+
+def test_sonarr_add_tag_already_tagged_returns_series():
+    """add_tag returns the series unchanged when it already has the tag."""
+    sonarr = SonarrAPI('http://localhost:8989', 'key')
+    series = {'id': 3, 'title': 'Bluey', 'tags': [5]}
+
+    with mock.patch.object(sonarr, 'get_tags', return_value=[{'id': 5, 'label': 'kids'}]), \
+            mock.patch.object(sonarr, 'get_series_by_id', return_value=series), \
+            mock.patch.object(sonarr, '_request') as request:
+        assert sonarr.add_tag(3, 'kids') == series
+        request.assert_not_called()
+
+
+class FakeStreamResponse:
+    """Streamed response delivering a body in fixed chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=None):
+        yield from self.chunks
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def stream_chunks(chunks):
+    """Run _stream_array over a body delivered as the given byte chunks."""
+    radarr = RadarrAPI('http://localhost:7878', 'key')
+    radarr.session = mock.Mock()
+    radarr.session.get.return_value = FakeStreamResponse(chunks)
+    return list(radarr._stream_array('/api/v3/movie'))
+
+
+STREAM_BODY = (
+    '[{"id": 1, "title": "The Lion King", "year": 1994},'
+    ' {"id": 2, "title": "Am\\u00e9lie \\"Le fabuleux\\" [2001]", "tags": [1, 2]},'
+    ' {"id": 3, "title": "Crème, brûlée", "ratio": 12.75}, 12345, "x,y", null'
+    '  \n ]'
+).encode('utf-8')
+
+
+def test_stream_array_matches_json_loads_at_every_split():
+    """Splitting the body anywhere (inside strings, numbers, multi-byte
+    characters, between a value and its comma, in the whitespace before
+    the closing bracket) yields the same items as json.loads."""
+    expected = json.loads(STREAM_BODY)
+
+    for split in range(1, len(STREAM_BODY)):
+        chunks = [STREAM_BODY[:split], STREAM_BODY[split:]]
+        assert stream_chunks(chunks) == expected, split
+
+
+def test_stream_array_byte_by_byte():
+    """One-byte chunks yield the same items as json.loads."""
+    chunks = [STREAM_BODY[i:i + 1] for i in range(len(STREAM_BODY))]
+    assert stream_chunks(chunks) == json.loads(STREAM_BODY)
+
+
+def test_stream_array_number_split_before_comma():
+    """A number cut at a chunk boundary is not emitted early."""
+    assert stream_chunks([b'[12', b'3', b', 4', b'5]']) == [123, 45]
+
+
+def test_stream_array_empty():
+    """Empty arrays yield nothing, however they are chunked."""
+    assert stream_chunks([b'[]']) == []
+    assert stream_chunks([b' [', b' \n', b' ]']) == []
+
+
+def test_stream_array_truncated_raises():
+    """A body missing its closing bracket is an error, not a short list."""
+    with pytest.raises(APIError):
+        stream_chunks([b'[{"id": 1}, {"id": 2}'])
+
+
+def test_stream_array_not_an_array_raises():
+    """Non-array bodies are rejected."""
+    with pytest.raises(APIError):
+        stream_chunks([b'{"id": 1}'])
+
+
+if __name__ == '__main__':
+    test_radarr_add_tag_already_tagged_returns_movie()
+    test_radarr_add_tag_new_tag_updates_movie()
+    test_sonarr_add_tag_already_tagged_returns_series()
+    test_stream_array_matches_json_loads_at_every_split()
+    test_stream_array_byte_by_byte()
+    test_stream_array_number_split_before_comma()
+    test_stream_array_empty()
+    test_stream_array_truncated_raises()
+    test_stream_array_not_an_array_raises()
+    print("✅ ALL TESTS PASSED")
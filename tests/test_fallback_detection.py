@@ -16,7 +16,10 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.seedbox_purge import parse_media_filename, check_episode_in_library
+from scripts.seedbox_purge import (
+    parse_media_filename, load_library_index, check_episode_in_library,
+    build_title_index, match_titles
+)
 from utils.api_clients import RadarrAPI, SonarrAPI
 from utils.config_loader import load_config
 from utils.logger import setup_logging
@@ -48,6 +51,47 @@ def test_filename_parsing():
             print(f"\n❌ Failed to parse: {filename}")
 
 
+def test_title_index_matches_brute_force():
+    """match_titles must agree with the substring scan it replaces."""
+    titles = [
+        'the lion king',
+        'lion',
+        'the office',
+        'office',
+        'up',
+        'it',
+        '',
+        'my hero academia',
+        'avatar the last airbender',
+        'avatar',
+        'the the',
+    ]
+    queries = [
+        '',
+        'u',
+        'up',
+        'it',
+        'lio',
+        'lion king',
+        'the lion king 2019',
+        'office',
+        'the office us',
+        'hero',
+        'avatar the last airbender',
+        'avatar 2',
+        'the',
+        'the the the',
+        'zz',
+        'xyz',
+    ]
+
+    index = build_title_index(titles)
+
+    for query in queries:
+        expected = [i for i, title in enumerate(titles) if query in title or title in query]
+        assert match_titles(index, query) == expected, query
+
+
 def test_fallback_detection():
     """Test fallback detection with actual API clients."""
     print("\n")
@@ -77,6 +121,7 @@ def test_fallback_detection():
             config['sonarr']['api_key']
         )
         print("\n✅ Connected to Radarr and Sonarr")
+        library = load_library_index(radarr, sonarr, logger)
     except Exception as e:
         print(f"\n❌ Failed to connect to APIs: {e}")
         return
@@ -103,7 +148,7 @@ def test_fallback_detection():
         print(f"   Type: {content_type}")
 
         # Check if exists in library
-        exists = check_episode_in_library(radarr, sonarr, filepath, logger)
+        exists = check_episode_in_library(library, sonarr, filepath, logger)
 
         if exists:
             print(f"   ✅ FOUND in library (would be deleted)")
@@ -160,7 +205,10 @@ if __name__ == '__main__':
     # Test 2: Season/episode parsing
     test_episode_parsing()
 
-    # Test 3: Fallback detection (requires API access)
+    # Test 3: Title index against brute-force matching
+    test_title_index_matches_brute_force()
+
+    # Test 4: Fallback detection (requires API access)
     print("\n\n⚠️  The next test requires valid API credentials in config.yaml")
     input("Press Enter to continue or Ctrl+C to exit...")
     test_fallback_detection()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for seedbox_purge helpers (no network or seedbox access needed).
+
+Usage:
+    python3 -m pytest tests/test_seedbox_purge.py
+"""
+
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.seedbox_purge import iter_import_history
+
+
+class FakeHistoryAPI:
+    """Serves fixed history pages and records which pages were requested."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+
+    def get_history(self, event_type=None, page=1, page_size=50):
+        self.requested.append(page)
+        return self.pages[page - 1] if page <= len(self.pages) else []
+
+
+def test_iter_import_history_stops_at_cutoff_with_dotnet_dates():
+    """7-digit .NET fractions are parsed, so paging stops at the cutoff."""
+    since = datetime(2024, 1, 10, tzinfo=timezone.utc).timestamp()
+    api = FakeHistoryAPI([
+        [
+            {'id': 3, 'date': '2024-01-15T10:30:00.1234567Z'},
+            {'id': 2, 'date': '2024-01-12T08:00:00.7654321Z'},
+        ],
+        [
+            {'id': 1, 'date': '2024-01-05T23:59:59.0000001Z'},
+            {'id': 0, 'date': '2024-01-01T00:00:00.0000000Z'},
+        ],
+        [
+            {'id': -1, 'date': '2023-12-31T00:00:00.0000000Z'},
+        ],
+    ])
+
+    records = list(iter_import_history(api, since, page_size=2))
+
+    assert [r['id'] for r in records] == [3, 2]
+    assert api.requested == [1, 2]
+
+
+def test_iter_import_history_cutoff_is_utc():
+    """Dates are compared as UTC, to the second."""
+    since = datetime(2024, 1, 10, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+    api = FakeHistoryAPI([[
+        {'id': 2, 'date': '2024-01-10T12:00:00.5000000Z'},
+        {'id': 1, 'date': '2024-01-10T11:59:59.9999999Z'},
+    ]])
+
+    assert [r['id'] for r in iter_import_history(api, since, page_size=2)] == [2]
+
+
+def test_iter_import_history_keeps_undated_records():
+    """Records without a usable date are kept and never end paging."""
+    since = datetime(2024, 1, 10, tzinfo=timezone.utc).timestamp()
+    api = FakeHistoryAPI([
+        [{'id': 2}, {'id': 1, 'date': None}],
+        [{'id': 0, 'date': '2024-01-01T00:00:00Z'}],
+    ])
+
+    assert [r['id'] for r in iter_import_history(api, since, page_size=2)] == [2, 1]
+    assert api.requested == [1, 2]
+
+
+if __name__ == '__main__':
+    test_iter_import_history_stops_at_cutoff_with_dotnet_dates()
+    test_iter_import_history_cutoff_is_utc()
+    test_iter_import_history_keeps_undated_records()
+    print("✅ ALL TESTS PASSED")
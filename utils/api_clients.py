@@ -11,10 +11,36 @@ Example:
 """
 
 import requests
-from typing import List, Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Union, Iterator
+import codecs
+import json as _stdlib_json
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import logging
 import time
 
+from utils.http_cache import cached_get, lookup, store_raw
+
+# Optional faster JSON parser for large responses (e.g. history pages)
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json as _json
+    _json_loads = _json.loads
+
+
+# Read size for streamed array responses (see BaseAPI._stream_array)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Status codes that mean "slow down": honour the server's Retry-After
+THROTTLE_STATUS_CODES = (429, 503)
+MAX_RETRY_AFTER = 60  # Cap on a server-requested wait (seconds)
+
+# Movie IDs per /api/v3/moviefile request (keeps the query string short)
+MOVIE_FILE_BATCH_SIZE = 200
+
 
 class APIError(Exception):
     """Raised when API request fails."""
@@ -74,6 +100,71 @@ def parse_validation_errors(response_json: Any) -> str:
     return "; ".join(messages) if messages else str(response_json)
 
 
+def retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+    """Seconds to wait before retrying a failed request.
+
+    Throttled responses (429/503) carrying a Retry-After header (seconds or
+    HTTP date) wait as long as the server asks, capped at MAX_RETRY_AFTER.
+    Everything else uses exponential backoff.
+
+    Args:
+        response: Failed response, if one was received
+        attempt: Zero-based attempt number
+
+    Returns:
+        Delay in seconds
+
+    Example:
+        >>> retry_delay(None, 2)
+        4
+    """
+    backoff = 2 ** attempt
+
+    if response is None or response.status_code not in THROTTLE_STATUS_CODES:
+        return backoff
+
+    retry_after = response.headers.get('Retry-After')
+    if not retry_after:
+        return backoff
+
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+        except (TypeError, ValueError):
+            return backoff
+
+    return min(max(delay, 0), MAX_RETRY_AFTER)
+
+
+def create_session(pool_connections: int = 4, pool_maxsize: int = 8) -> requests.Session:
+    """Create a requests session with a keep-alive connection pool.
+
+    All requests made through the session reuse pooled TCP connections,
+    so only the first call to a host pays the connect/TLS handshake.
+
+    Args:
+        pool_connections: Number of per-host pools to cache
+        pool_maxsize: Maximum connections kept alive per host
+
+    Returns:
+        Configured requests session
+
+    Example:
+        >>> session = create_session()
+        >>> session.get('http://localhost:7878/api/v3/system/status')
+    """
+    session = requests.Session()
+
+    # Retries are handled by the clients' _request loops, not the adapter
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    return session
+
+
 class BaseAPI:
     """Base class for *arr API clients.
 
@@ -81,18 +172,20 @@ class BaseAPI:
     authentication, error handling, and retries.
     """
 
-    def __init__(self, url: str, api_key: str, timeout: int = 30):
+    def __init__(self, url: str, api_key: str, timeout: int = 30, pool_maxsize: int = 8):
         """Initialize API client.
 
         Args:
             url: Base URL of the service (e.g., 'http://localhost:7878')
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            pool_maxsize: Keep-alive connections per host; set this to the
+                number of threads sharing the client
         """
         self.url = url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session(pool_maxsize=pool_maxsize)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _get_headers(self) -> Dict[str, str]:
@@ -105,7 +198,8 @@ class BaseAPI:
         endpoint: str,
         params: Optional[Dict] = None,
         json: Optional[Dict] = None,
-        retries: int = 3
+        retries: int = 3,
+        ttl: Optional[int] = None
     ) -> Any:
         """Make API request with retries.
 
@@ -115,6 +209,8 @@ class BaseAPI:
             params: Query parameters
             json: JSON body for POST/PUT requests
             retries: Number of retry attempts
+            ttl: For GET requests, serve from the on-disk cache if a
+                response younger than this many seconds exists
 
         Returns:
             Response JSON data
@@ -122,6 +218,9 @@ class BaseAPI:
         Raises:
             APIError: If request fails after all retries
         """
+        if ttl and method == 'GET':
+            return cached_get(self, endpoint, params, ttl=ttl)
+
         url = f"{self.url}{endpoint}"
 
         for attempt in range(retries):
@@ -148,7 +247,10 @@ class BaseAPI:
                 if not response.content:
                     return {}
 
-                return response.json()
+                try:
+                    return _json_loads(response.content)
+                except ValueError as e:
+                    raise APIError(f"Invalid JSON response from {endpoint}: {e}")
 
             except requests.exceptions.Timeout:
                 self.logger.warning(f"Request timeout (attempt {attempt + 1}/{retries})")
@@ -184,7 +286,7 @@ class BaseAPI:
                         self.logger.warning(f"HTTP error: {e}")
 
                     if attempt < retries - 1:
-                        time.sleep(2 ** attempt)
+                        time.sleep(retry_delay(e.response, attempt))
                     else:
                         raise APIError(f"HTTP error: {e}")
 
@@ -199,6 +301,109 @@ class BaseAPI:
         raise APIError("Unexpected error in request retry loop")
 
 
+    def _stream_array(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        ttl: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """GET an endpoint returning a JSON array and yield its elements.
+
+        Elements are decoded as the body arrives, so callers can start
+        working before the download finishes and never hold the whole
+        decoded list. With ``ttl``, a fresh cached response is used
+        instead, and a streamed response is written back to the cache.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            ttl: Serve from / store to the on-disk cache (seconds)
+
+        Yields:
+            Array elements (e.g., movie dictionaries)
+
+        Raises:
+            APIError: If the request fails or the body is not a JSON array
+        """
+        if ttl:
+            hit, body = lookup(self, endpoint, params, ttl)
+            if hit:
+                yield from body
+                return
+
+        url = f"{self.url}{endpoint}"
+        self.logger.debug(f"GET {url} (streamed)")
+
+        try:
+            response = self.session.get(
+                url,
+                headers=self._get_headers(),
+                params=params,
+                timeout=self.timeout,
+                stream=True
+            )
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {e}")
+
+        decoder = _stdlib_json.JSONDecoder()
+        text_decoder = codecs.getincrementaldecoder('utf-8')()
+        raw_chunks = [] if ttl else None
+        buf = ''
+        started = False
+        finished = False
+
+        with response:
+            try:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    if raw_chunks is not None:
+                        raw_chunks.append(chunk)
+                    buf += text_decoder.decode(chunk)
+                    pos = 0
+
+                    while not finished:
+                        # Skip separators between elements
+                        while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                            pos += 1
+                        if pos >= len(buf):
+                            break
+
+                        if not started:
+                            if buf[pos] != '[':
+                                raise APIError(f"Expected a JSON array from {endpoint}")
+                            started = True
+                            pos += 1
+                            continue
+
+                        if buf[pos] == ']':
+                            finished = True
+                            break
+
+                        try:
+                            element, end = decoder.raw_decode(buf, pos)
+                        except ValueError:
+                            break  # Element incomplete, wait for more data
+
+                        # A value running to the end of the buffer may be cut
+                        # short (a number split across chunks); wait for the
+                        # separator that must follow it
+                        if end == len(buf):
+                            break
+
+                        pos = end
+                        yield element
+
+                    buf = buf[pos:]
+            except requests.exceptions.RequestException as e:
+                raise APIError(f"Request failed while streaming {endpoint}: {e}")
+
+        if not finished:
+            raise APIError(f"Invalid JSON response from {endpoint}: truncated array")
+
+        if raw_chunks is not None:
+            store_raw(self, endpoint, params, b''.join(raw_chunks))
+
+
 class RadarrAPI(BaseAPI):
     """Radarr API v3 client.
 
@@ -208,13 +413,32 @@ class RadarrAPI(BaseAPI):
         >>> radarr.add_tag(movie_id=1, tag='delete-candidate')
     """
 
-    def get_movies(self) -> List[Dict[str, Any]]:
+    def get_movies(self, ttl: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all movies.
 
+        Args:
+            ttl: Reuse a cached catalog younger than this many seconds
+                (e.g., CATALOG_TTL for scripts run back-to-back)
+
         Returns:
             List of movie dictionaries
         """
-        return self._request('GET', '/api/v3/movie')
+        return self._request('GET', '/api/v3/movie', ttl=ttl)
+
+    def iter_movies(self, ttl: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all movies as the response is received.
+
+        Args:
+            ttl: Reuse / refresh a cached catalog (see get_movies)
+
+        Yields:
+            Movie dictionaries
+
+        Example:
+            >>> for movie in radarr.iter_movies():
+            ...     print(movie['title'])
+        """
+        return self._stream_array('/api/v3/movie', ttl=ttl)
 
     def get_movie(self, movie_id: int) -> Dict[str, Any]:
         """Get movie by ID.
@@ -227,6 +451,28 @@ class RadarrAPI(BaseAPI):
         """
         return self._request('GET', f'/api/v3/movie/{movie_id}')
 
+    def get_movie_files(self, movie_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get movie files for many movies with as few requests as possible.
+
+        IDs are sent in batches of MOVIE_FILE_BATCH_SIZE as repeated
+        ``movieId`` parameters, instead of one request per file.
+
+        Args:
+            movie_ids: Movie IDs
+
+        Returns:
+            List of movie file dictionaries (path, size, quality, ...)
+
+        Example:
+            >>> ids = [m['id'] for m in radarr.get_movies() if m.get('hasFile')]
+            >>> paths = {f['path'] for f in radarr.get_movie_files(ids)}
+        """
+        movie_files = []
+        for start in range(0, len(movie_ids), MOVIE_FILE_BATCH_SIZE):
+            batch = movie_ids[start:start + MOVIE_FILE_BATCH_SIZE]
+            movie_files.extend(self._request('GET', '/api/v3/moviefile', params={'movieId': batch}) or [])
+        return movie_files
+
     def delete_movie(self, movie_id: int, delete_files: bool = True) -> Dict:
         """Delete a movie.
 
@@ -291,6 +537,34 @@ class RadarrAPI(BaseAPI):
 
         return movie
 
+    def bulk_edit_movies(
+        self,
+        movie_ids: List[int],
+        root_folder_path: str,
+        move_files: bool = True
+    ) -> Any:
+        """Move several movies to a root folder in one request.
+
+        Uses the movie editor endpoint; Radarr recomputes each movie path
+        under the new root folder and queues the file moves itself.
+
+        Args:
+            movie_ids: Movie IDs to update
+            root_folder_path: Destination root folder path
+            move_files: If True, move files on disk as well
+
+        Returns:
+            Updated movies
+
+        Example:
+            >>> radarr.bulk_edit_movies([1, 2, 3], '/data/media/kids_movies')
+        """
+        return self._request('PUT', '/api/v3/movie/editor', json={
+            'movieIds': list(movie_ids),
+            'rootFolderPath': root_folder_path,
+            'moveFiles': move_files
+        })
+
     def search_movie(self, title: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for a movie by title.
 
@@ -442,16 +716,42 @@ class RadarrAPI(BaseAPI):
         """
         return self._request('GET', '/api/v3/rootfolder')
 
-    def get_history(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get history events.
+    def get_history(
+        self,
+        event_type: Optional[Union[str, int]] = None,
+        page: int = 1,
+        page_size: Optional[int] = None,
+        sort_key: str = 'date',
+        sort_direction: str = 'descending',
+        include_details: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get history events (newest first by default).
+
+        Filtering and sorting are done server-side, so only matching
+        records are transferred and parsed. Embedded objects are requested
+        explicitly (includeMovie), so records stay small unless
+        ``include_details`` is set.
 
         Args:
-            event_type: Filter by event type (e.g., 'grabbed', 'downloadFolderImported')
+            event_type: Filter by event type (e.g., 3 or 'downloadFolderImported')
+            page: Page number (1-based)
+            page_size: Number of records per page (server default if None)
+            sort_key: Field to sort by
+            sort_direction: 'ascending' or 'descending'
+            include_details: Embed the movie in each record (e.g., for titles)
 
         Returns:
             List of history events
+
+        Example:
+            >>> imports = radarr.get_history(event_type=3, page_size=200)
         """
-        params = {'eventType': event_type} if event_type else {}
+        params = {'page': page, 'sortKey': sort_key, 'sortDirection': sort_direction}
+        params['includeMovie'] = 'true' if include_details else 'false'
+        if event_type is not None:
+            params['eventType'] = event_type
+        if page_size:
+            params['pageSize'] = page_size
         response = self._request('GET', '/api/v3/history', params=params)
         return response.get('records', [])
 
@@ -474,13 +774,32 @@ class SonarrAPI(BaseAPI):
         >>> sonarr.add_tag(series_id=1, tag='delete-candidate')
     """
 
-    def get_series(self) -> List[Dict[str, Any]]:
+    def get_series(self, ttl: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get all series.
 
+        Args:
+            ttl: Reuse a cached catalog younger than this many seconds
+                (e.g., CATALOG_TTL for scripts run back-to-back)
+
         Returns:
             List of series dictionaries
         """
-        return self._request('GET', '/api/v3/series')
+        return self._request('GET', '/api/v3/series', ttl=ttl)
+
+    def iter_series(self, ttl: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all series as the response is received.
+
+        Args:
+            ttl: Reuse / refresh a cached catalog (see get_series)
+
+        Yields:
+            Series dictionaries
+
+        Example:
+            >>> for show in sonarr.iter_series():
+            ...     print(show['title'])
+        """
+        return self._stream_array('/api/v3/series', ttl=ttl)
 
     def get_series_by_id(self, series_id: int) -> Dict[str, Any]:
         """Get series by ID.
@@ -504,6 +823,17 @@ class SonarrAPI(BaseAPI):
         """
         return self._request('GET', '/api/v3/episode', params={'seriesId': series_id})
 
+    def get_episode_files(self, series_id: int) -> List[Dict[str, Any]]:
+        """Get all episode files for a series in one request.
+
+        Args:
+            series_id: Series ID
+
+        Returns:
+            List of episode file dictionaries (path, size, quality, ...)
+        """
+        return self._request('GET', '/api/v3/episodefile', params={'seriesId': series_id})
+
     def delete_series(self, series_id: int, delete_files: bool = True) -> Dict:
         """Delete a series.
 
@@ -568,6 +898,34 @@ class SonarrAPI(BaseAPI):
 
         return series
 
+    def bulk_edit_series(
+        self,
+        series_ids: List[int],
+        root_folder_path: str,
+        move_files: bool = True
+    ) -> Any:
+        """Move several series to a root folder in one request.
+
+        Uses the series editor endpoint; Sonarr recomputes each series path
+        under the new root folder and queues the file moves itself.
+
+        Args:
+            series_ids: Series IDs to update
+            root_folder_path: Destination root folder path
+            move_files: If True, move files on disk as well
+
+        Returns:
+            Updated series
+
+        Example:
+            >>> sonarr.bulk_edit_series([1, 2, 3], '/data/media/kids_series')
+        """
+        return self._request('PUT', '/api/v3/series/editor', json={
+            'seriesIds': list(series_ids),
+            'rootFolderPath': root_folder_path,
+            'moveFiles': move_files
+        })
+
     def search_series(self, title: str, year: Optional[int] = None) -> List[Dict[str, Any]]:
         """Search for a TV series by title.
 
@@ -722,16 +1080,42 @@ class SonarrAPI(BaseAPI):
         """
         return self._request('GET', '/api/v3/rootfolder')
 
-    def get_history(self, event_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get history events.
+    def get_history(
+        self,
+        event_type: Optional[Union[str, int]] = None,
+        page: int = 1,
+        page_size: Optional[int] = None,
+        sort_key: str = 'date',
+        sort_direction: str = 'descending',
+        include_details: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get history events (newest first by default).
+
+        Filtering and sorting are done server-side, so only matching
+        records are transferred and parsed. Embedded objects are requested
+        explicitly (includeSeries/includeEpisode), so records stay small unless
+        ``include_details`` is set.
 
         Args:
-            event_type: Filter by event type (e.g., 'grabbed', 'downloadFolderImported')
+            event_type: Filter by event type (e.g., 3 or 'downloadFolderImported')
+            page: Page number (1-based)
+            page_size: Number of records per page (server default if None)
+            sort_key: Field to sort by
+            sort_direction: 'ascending' or 'descending'
+            include_details: Embed the series and episode in each record (e.g., for titles)
 
         Returns:
             List of history events
+
+        Example:
+            >>> imports = sonarr.get_history(event_type=3, page_size=200)
         """
-        params = {'eventType': event_type} if event_type else {}
+        params = {'page': page, 'sortKey': sort_key, 'sortDirection': sort_direction}
+        params['includeSeries'] = params['includeEpisode'] = 'true' if include_details else 'false'
+        if event_type is not None:
+            params['eventType'] = event_type
+        if page_size:
+            params['pageSize'] = page_size
         response = self._request('GET', '/api/v3/history', params=params)
         return response.get('records', [])
 
@@ -746,18 +1130,20 @@ class JellyfinAPI:
         >>> jellyfin.refresh_library()
     """
 
-    def __init__(self, url: str, api_key: str, timeout: int = 30):
+    def __init__(self, url: str, api_key: str, timeout: int = 30, pool_maxsize: int = 8):
         """Initialize Jellyfin API client.
 
         Args:
             url: Base URL of Jellyfin server
             api_key: API key for authentication
             timeout: Request timeout in seconds
+            pool_maxsize: Keep-alive connections per host; set this to the
+                number of threads sharing the client
         """
         self.url = url.rstrip('/')
         self.api_key = api_key
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = create_session(pool_maxsize=pool_maxsize)
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def _get_headers(self) -> Dict[str, str]:
@@ -823,7 +1209,8 @@ class JellyfinAPI:
         self,
         user_id: Optional[str] = None,
         include_item_types: Optional[str] = None,
-        filters: Optional[str] = None
+        filters: Optional[str] = None,
+        fields: str = 'Path,MediaStreams,ProviderIds,CommunityRating'
     ) -> List[Dict[str, Any]]:
         """Get library items.
 
@@ -831,6 +1218,8 @@ class JellyfinAPI:
             user_id: User ID (optional for basic queries)
             include_item_types: Item types (e.g., 'Movie,Series')
             filters: Filters (e.g., 'IsUnplayed')
+            fields: Extra fields to include (request only what you need;
+                MediaStreams in particular makes responses much larger)
 
         Returns:
             List of items
@@ -840,7 +1229,7 @@ class JellyfinAPI:
 
         params = {
             'Recursive': 'true',
-            'Fields': 'Path,MediaStreams,ProviderIds,CommunityRating'
+            'Fields': fields
         }
 
         if include_item_types:
@@ -0,0 +1,198 @@
+"""Small on-disk cache for *arr API GET responses.
+
+Responses are stored as JSON files keyed by a hash of the service URL,
+endpoint and query parameters, and reused until their TTL expires. This
+lets scripts that are re-run repeatedly (debugging, cron chains) skip
+identical API calls.
+
+Example:
+    >>> from utils.http_cache import cached_get, LONG_TTL
+    >>> series = cached_get(sonarr, '/api/v3/series/lookup', {'term': 'Bluey'}, ttl=LONG_TTL)
+    >>> # Or through the client directly:
+    >>> episodes = sonarr._request('GET', '/api/v3/episode', params={'seriesId': 1}, ttl=600)
+"""
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+# Cache location (~/.cache/cc-media-automation, honours XDG_CACHE_HOME)
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache'))) / 'cc-media-automation'
+
+# Suggested TTLs (seconds)
+CATALOG_TTL = 120           # 2 minutes: full movie/series catalogs (chained runs)
+SHORT_TTL = 600             # 10 minutes: history, episode lists (new imports arrive)
+LONG_TTL = 7 * 24 * 3600    # 7 days: static series/movie metadata
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_path(base_url: str, endpoint: str, params: Optional[Dict]) -> Path:
+    """Build the cache file path for a request.
+
+    Args:
+        base_url: Service base URL (e.g., 'http://localhost:8989')
+        endpoint: API endpoint path
+        params: Query parameters
+
+    Returns:
+        Path to the cache file
+    """
+    key = json.dumps([base_url, endpoint, params or {}], sort_keys=True, default=str)
+    digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def write_atomic(path: Path, chunks: Iterable[bytes]) -> None:
+    """Atomically write a cache file.
+
+    Each writer gets its own temporary file next to the target, so
+    concurrent refreshes of the same file (e.g., cron overlapping a
+    manual run) never write into each other's file; the last os.replace
+    wins with a complete file.
+
+    Args:
+        path: Cache file path (parent directories are created)
+        chunks: File content, written in order
+
+    Raises:
+        OSError: If the file cannot be written
+
+    Example:
+        >>> write_atomic(CACHE_DIR / 'state.json', (json.dumps(state).encode('utf-8'),))
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f"{path.stem}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def lookup(api, endpoint: str, params: Optional[Dict] = None, ttl: int = SHORT_TTL) -> Tuple[bool, Any]:
+    """Read a cached response without making a request.
+
+    Args:
+        api: API client with ``url`` (e.g., SonarrAPI)
+        endpoint: API endpoint path
+        params: Query parameters
+        ttl: Maximum age of a cached response in seconds
+
+    Returns:
+        Tuple of (hit, body); body is None on a miss
+    """
+    path = _cache_path(api.url, endpoint, params)
+
+    try:
+        with open(path, 'r') as f:
+            entry = json.load(f)
+        if time.time() - entry['ts'] < ttl:
+            logger.debug(f"Cache hit: {endpoint} {params or ''}")
+            return True, entry['body']
+    except (FileNotFoundError, json.JSONDecodeError, KeyError, TypeError):
+        pass
+
+    return False, None
+
+
+def store_raw(api, endpoint: str, params: Optional[Dict], raw: bytes) -> None:
+    """Store an already-serialized JSON response body.
+
+    Used by streaming readers, which never hold the decoded body: the raw
+    bytes are wrapped into a cache entry as-is.
+
+    Args:
+        api: API client with ``url`` (e.g., RadarrAPI)
+        endpoint: API endpoint path
+        params: Query parameters
+        raw: Response body as received (UTF-8 JSON)
+    """
+    path = _cache_path(api.url, endpoint, params)
+
+    try:
+        write_atomic(path, (b'{"ts": %f, "body": ' % time.time(), raw, b'}'))
+    except OSError as e:
+        logger.debug(f"Could not write cache entry for {endpoint}: {e}")
+
+
+def cached_get(api, endpoint: str, params: Optional[Dict] = None, ttl: int = SHORT_TTL) -> Any:
+    """GET an endpoint through the on-disk cache.
+
+    Returns the cached body if it is younger than ``ttl`` seconds,
+    otherwise performs the request and stores the response.
+
+    Args:
+        api: API client with ``url`` and ``_request`` (e.g., SonarrAPI)
+        endpoint: API endpoint path
+        params: Query parameters
+        ttl: Maximum age of a cached response in seconds
+
+    Returns:
+        Response JSON data
+    """
+    hit, body = lookup(api, endpoint, params, ttl)
+    if hit:
+        return body
+
+    body = api._request('GET', endpoint, params=params)
+
+    path = _cache_path(api.url, endpoint, params)
+    try:
+        write_atomic(path, (json.dumps({'ts': time.time(), 'body': body}).encode('utf-8'),))
+    except OSError as e:
+        logger.debug(f"Could not write cache entry for {endpoint}: {e}")
+
+    return body
+
+
+def invalidate(api, endpoint: str, params: Optional[Dict] = None) -> None:
+    """Drop the cached response for one request.
+
+    Call this after modifying data on the server so the next cached read
+    fetches fresh data.
+
+    Args:
+        api: API client with ``url`` (e.g., RadarrAPI)
+        endpoint: API endpoint path
+        params: Query parameters
+    """
+    try:
+        _cache_path(api.url, endpoint, params).unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.debug(f"Could not remove cache entry for {endpoint}: {e}")
+
+
+def clear_cache() -> int:
+    """Remove all cached responses.
+
+    Returns:
+        Number of cache files deleted
+    """
+    deleted_count = 0
+
+    if not CACHE_DIR.exists():
+        return 0
+
+    for cache_file in CACHE_DIR.glob('*.json'):
+        try:
+            cache_file.unlink()
+            deleted_count += 1
+        except OSError as e:
+            logger.warning(f"Failed to delete {cache_file}: {e}")
+
+    return deleted_count
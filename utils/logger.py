@@ -169,6 +169,22 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+class PrefixAdapter(logging.LoggerAdapter):
+    """Logger adapter that tags every message with a prefix.
+
+    Useful when several tasks log through the same logger from different
+    threads, so interleaved lines stay attributable.
+
+    Example:
+        >>> movies_logger = PrefixAdapter(logger, {'prefix': 'movies'})
+        >>> movies_logger.info('Found 10 movies')  # "[movies] Found 10 movies"
+    """
+
+    def process(self, msg, kwargs):
+        """Prepend the prefix to the message."""
+        return f"[{self.extra['prefix']}] {msg}", kwargs
+
+
 class LogContext:
     """Context manager for temporary log level changes.
 
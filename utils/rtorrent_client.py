@@ -16,6 +16,23 @@ import logging
 from typing import List, Dict, Any, Optional
 
 
+# Per-torrent fields fetched in one d.multicall2 round-trip (see
+# get_all_torrents_info); rtorrent returns the values in this order
+TORRENT_INFO_FIELDS = (
+    ('hash', 'd.hash='),
+    ('name', 'd.name='),
+    ('size_bytes', 'd.size_bytes='),
+    ('completed_bytes', 'd.completed_bytes='),
+    ('ratio_raw', 'd.ratio='),
+    ('is_active', 'd.is_active='),
+    ('is_complete', 'd.complete='),
+    ('directory', 'd.directory='),
+    ('timestamp_finished', 'd.timestamp.finished='),
+    ('timestamp_started', 'd.timestamp.started='),
+    ('label', 'd.custom1='),
+)
+
+
 class DigestTransport(xmlrpc.client.Transport):
     """Custom XMLRPC transport with HTTP Digest authentication.
 
@@ -245,21 +262,38 @@ class RTorrentClient:
     def get_all_torrents_info(self, view: str = 'main') -> List[Dict[str, Any]]:
         """Get information about all torrents in a view.
 
+        Fetches every torrent's details with a single d.multicall2 call
+        instead of one call per field per torrent. Falls back to per-torrent
+        queries if the server rejects d.multicall2.
+
         Args:
             view: View name
 
         Returns:
-            List of torrent info dicts
+            List of torrent info dicts (same keys as get_torrent_info)
         """
-        hashes = self.get_torrents(view)
-        torrents = []
+        commands = [command for _, command in TORRENT_INFO_FIELDS]
 
-        for hash_id in hashes:
-            try:
-                info = self.get_torrent_info(hash_id)
-                torrents.append(info)
-            except Exception as e:
-                self.logger.warning(f"Could not get info for {hash_id}: {e}")
+        try:
+            # CRITICAL: Empty string required as first parameter
+            rows = self._call('d.multicall2', '', view, *commands)
+        except Exception as e:
+            self.logger.warning(f"d.multicall2 failed, querying torrents one by one: {e}")
+            torrents = []
+            for hash_id in self.get_torrents(view):
+                try:
+                    torrents.append(self.get_torrent_info(hash_id))
+                except Exception as e:
+                    self.logger.warning(f"Could not get info for {hash_id}: {e}")
+            return torrents
+
+        torrents = []
+        for row in rows:
+            info = dict(zip((key for key, _ in TORRENT_INFO_FIELDS), row))
+            info['ratio'] = info['ratio_raw'] / 1000.0  # CRITICAL: Divide by 1000!
+            info['is_active'] = bool(info['is_active'])
+            info['is_complete'] = bool(info['is_complete'])
+            torrents.append(info)
 
         return torrents
 
@@ -12,10 +12,22 @@ Example:
 """
 
 import paramiko
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterable
 import logging
 from datetime import datetime, timedelta
 import os
+import shlex
+import socket
+
+
+# Marker between df and find output in list_files_and_usage()
+USAGE_SEPARATOR = '---CC-MEDIA-USAGE-END---'
+
+# Flow-control window for new channels (paramiko default: 2 MiB); a larger
+# window keeps long outputs (e.g. big find listings) streaming on
+# high-latency links instead of stalling every window per round-trip
+CHANNEL_WINDOW_SIZE = 2 ** 27
+CONNECT_TIMEOUT = 30
 
 
 class SeedboxError(Exception):
@@ -71,16 +83,25 @@ class SeedboxSSH:
 
             self.logger.info(f"Connecting to {self.host}:{self.port} as {self.username}")
 
+            # Own socket so Nagle can be disabled: commands and their small
+            # replies are sent immediately instead of waiting for ACKs
+            sock = socket.create_connection((self.host, self.port), timeout=CONNECT_TIMEOUT)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             self.client.connect(
                 hostname=self.host,
                 port=self.port,
                 username=self.username,
                 password=self.password,
-                timeout=30,
+                timeout=CONNECT_TIMEOUT,
+                sock=sock,
                 look_for_keys=False,  # Don't look for SSH keys
                 allow_agent=False     # Don't use SSH agent
             )
 
+            # Applies to every channel opened from here on (SFTP, exec)
+            self.client.get_transport().default_window_size = CHANNEL_WINDOW_SIZE
+
             self.sftp = self.client.open_sftp()
             self.logger.info("SSH connection established")
 
@@ -163,7 +184,85 @@ class SeedboxSSH:
         if not self.client:
             raise SeedboxError("Not connected to seedbox")
 
-        # Build find command
+        # Parse lines as they arrive instead of buffering the whole listing
+        try:
+            _, stdout, stderr = self.client.exec_command(
+                self._build_find_command(path, older_than_days, pattern)
+            )
+            files = self._parse_find_output(stdout)
+            exit_code = stdout.channel.recv_exit_status()
+            stderr_text = stderr.read().decode('utf-8')
+        except Exception as e:
+            raise SeedboxError(f"Command execution failed: {e}")
+
+        if exit_code != 0:
+            self.logger.warning(f"find command failed: {stderr_text}")
+            return []
+
+        return files
+
+    def list_files_and_usage(
+        self,
+        path: str,
+        older_than_days: Optional[int] = None,
+        pattern: Optional[str] = None
+    ) -> Tuple[List[Dict[str, any]], Dict[str, float]]:
+        """List files and get disk usage with a single remote command.
+
+        Combines get_disk_usage() and list_files() into one exec, saving an
+        SSH round-trip.
+
+        Args:
+            path: Directory path on seedbox
+            older_than_days: Only include files older than this many days
+            pattern: Optional filename pattern (e.g., '*.mkv')
+
+        Returns:
+            Tuple of (files, usage) in the same formats as list_files() and
+            get_disk_usage()
+
+        Raises:
+            SeedboxError: If not connected or disk usage can't be read
+
+        Example:
+            >>> files, usage = ssh.list_files_and_usage('/downloads', older_than_days=2)
+        """
+        if not self.client:
+            raise SeedboxError("Not connected to seedbox")
+
+        find_cmd = self._build_find_command(path, older_than_days, pattern)
+        stdout, stderr, exit_code = self.execute_command(
+            f'df -BG / && echo {USAGE_SEPARATOR} && {find_cmd}'
+        )
+
+        df_output, separator, find_output = stdout.partition(f'{USAGE_SEPARATOR}\n')
+        if not separator:
+            raise SeedboxError(f"Failed to get disk usage: {stderr}")
+
+        usage = self._parse_df_output(df_output)
+
+        if exit_code != 0:
+            self.logger.warning(f"find command failed: {stderr}")
+            return [], usage
+
+        return self._parse_find_output(find_output), usage
+
+    def _build_find_command(
+        self,
+        path: str,
+        older_than_days: Optional[int] = None,
+        pattern: Optional[str] = None
+    ) -> str:
+        """Build the find command used to list files.
+
+        Args:
+            path: Directory path on seedbox
+            older_than_days: Only include files older than this many days
+            pattern: Optional filename pattern
+
+        Returns:
+            Shell command printing path, size and mtime per file
+        """
         find_cmd = f'find "{path}" -type f'
 
         if older_than_days is not None:
@@ -172,24 +271,35 @@ class SeedboxSSH:
         if pattern:
             find_cmd += f' -name "{pattern}"'
 
-        find_cmd += ' -printf "%p\\t%s\\t%T@\\n"'
+        # Path last: it is the only field that can itself contain a tab
+        find_cmd += ' -printf "%s\\t%T@\\t%p\\n"'
 
-        stdout, stderr, exit_code = self.execute_command(find_cmd)
+        return find_cmd
 
-        if exit_code != 0:
-            self.logger.warning(f"find command failed: {stderr}")
-            return []
+    def _parse_find_output(self, lines: Iterable[str]) -> List[Dict[str, any]]:
+        """Parse find output into file dictionaries.
+
+        Args:
+            lines: Output lines of the command from _build_find_command
+                (a string or any iterable of lines, e.g. a channel file)
+
+        Returns:
+            List of file dictionaries with keys: path, size, mtime
+        """
+        if isinstance(lines, str):
+            lines = lines.split('\n')
 
         files = []
-        for line in stdout.strip().split('\n'):
+        for line in lines:
+            line = line.rstrip('\n')
             if not line:
                 continue
 
-            parts = line.split('\t')
+            parts = line.split('\t', 2)
             if len(parts) != 3:
                 continue
 
-            file_path, size_str, mtime_str = parts
+            size_str, mtime_str, file_path = parts
 
             try:
                 files.append({
@@ -250,9 +360,68 @@ class SeedboxSSH:
         self.logger.debug(f"Deleted: {path}")
         return True
 
+    def delete_files(self, paths: List[str], chunk: int = 500) -> Dict[str, str]:
+        """Delete many files on the seedbox with batched rm commands.
+
+        Paths are shell-quoted and removed by one remote shell loop per chunk
+        instead of one remote command per file. Chunks keep the command line
+        well below ARG_MAX.
+
+        Args:
+            paths: File paths on seedbox
+            chunk: Maximum number of paths per rm command
+
+        Returns:
+            Dictionary of {path: error message} for files that could not be
+            deleted (empty if all deletions succeeded)
+
+        Raises:
+            SeedboxError: If not connected
+
+        Example:
+            >>> failed = ssh.delete_files(['/downloads/a.mkv', '/downloads/b.mkv'])
+            >>> print(f"{len(failed)} files could not be deleted")
+        """
+        if not self.client:
+            raise SeedboxError("Not connected to seedbox")
+
+        failed = {}
+
+        # rm runs per path inside one remote shell loop; each failure is
+        # reported as a NUL-terminated (path, error) pair, so failures map
+        # back to exact paths whatever characters the names contain
+        script = (
+            'for p in {}; do '
+            'err=$(rm -f -- "$p" 2>&1) || printf \'%s\\0%s\\0\' "$p" "$err"; '
+            'done'
+        )
+
+        for i in range(0, len(paths), chunk):
+            batch = paths[i:i + chunk]
+            quoted = ' '.join(shlex.quote(p) for p in batch)
+
+            try:
+                stdout, _, exit_code = self.execute_command(script.format(quoted))
+            except SeedboxError as e:
+                for path in batch:
+                    failed[path] = str(e)
+                continue
+
+            fields = stdout.split('\0')
+            for path, error in zip(fields[0:-1:2], fields[1::2]):
+                failed[path] = error.strip() or 'rm failed'
+
+            self.logger.debug(f"Deleted batch of {len(batch)} files (exit code {exit_code})")
+
+        return failed
+
     def delete_empty_directories(self, path: str, exclude_paths: Optional[List[str]] = None) -> int:
         """Delete empty directories recursively, respecting protected folders.
 
+        Runs a single ``find -mindepth 1 -depth -empty -delete`` on the seedbox: the
+        directories are removed remotely in one round-trip, deepest first,
+        so directories that only contained empty directories go too.
+
         Args:
             path: Base directory path
             exclude_paths: List of protected folder paths (e.g., ["/_ready", "/.recycle"])
@@ -271,61 +440,27 @@ class SeedboxSSH:
         if exclude_paths is None:
             exclude_paths = []
 
-        # Find all empty directories
-        find_cmd = f'find "{path}" -type d -empty -print'
+        # Protected: directory path ends with a protected path
+        # e.g., "/downloads/_ready" matches "/_ready"
+        # -mindepth 1: never the base directory itself, even once emptied
+        find_cmd = f'find {shlex.quote(path)} -mindepth 1 -depth -type d -empty'
+        for protected in exclude_paths:
+            find_cmd += f' ! -path {shlex.quote("*" + protected)} ! -path {shlex.quote(protected)}'
+
+        # -delete uses rmdir semantics (only removes empty directories);
+        # -print after it lists only those actually removed
+        find_cmd += ' -delete -print'
+
         stdout, stderr, exit_code = self.execute_command(find_cmd)
 
         if exit_code != 0:
             self.logger.warning(f"find command failed: {stderr}")
-            return 0
-
-        # Parse found directories
-        empty_dirs = [d.strip() for d in stdout.strip().split('\n') if d.strip()]
-
-        if not empty_dirs:
-            return 0
-
-        # Filter out protected directories
-        dirs_to_delete = []
-        protected_count = 0
-
-        for dir_path in empty_dirs:
-            # Check if this directory is protected
-            is_protected = False
-            for protected in exclude_paths:
-                # Match if directory path ends with protected path
-                # e.g., "/downloads/_ready" matches "/_ready"
-                if dir_path.endswith(protected) or dir_path == protected:
-                    is_protected = True
-                    protected_count += 1
-                    self.logger.debug(f"Skipping protected folder: {dir_path} (matches {protected})")
-                    break
-
-            if not is_protected:
-                dirs_to_delete.append(dir_path)
-
-        # Log protection summary
-        if protected_count > 0:
-            self.logger.info(f"Protected {protected_count} folder(s) from deletion")
-
-        # Delete non-protected directories
-        deleted_count = 0
-        for dir_path in dirs_to_delete:
-            try:
-                # Use rmdir (only removes if empty, safer than rm -rf)
-                cmd = f'rmdir "{dir_path}"'
-                _, stderr, exit_code = self.execute_command(cmd)
-
-                if exit_code == 0:
-                    deleted_count += 1
-                    self.logger.debug(f"Deleted empty directory: {dir_path}")
-                else:
-                    self.logger.debug(f"Could not delete {dir_path}: {stderr}")
 
-            except Exception as e:
-                self.logger.debug(f"Error deleting {dir_path}: {e}")
+        deleted_dirs = [d for d in stdout.split('\n') if d.strip()]
+        for dir_path in deleted_dirs:
+            self.logger.debug(f"Deleted empty directory: {dir_path}")
 
-        return deleted_count
+        return len(deleted_dirs)
 
     def get_disk_usage(self) -> Dict[str, float]:
         """Get disk usage statistics for the seedbox.
@@ -346,6 +481,20 @@ class SeedboxSSH:
         if exit_code != 0:
             raise SeedboxError(f"Failed to get disk usage: {stderr}")
 
+        return self._parse_df_output(stdout)
+
+    def _parse_df_output(self, stdout: str) -> Dict[str, float]:
+        """Parse ``df -BG`` output into usage statistics.
+
+        Args:
+            stdout: Output of df -BG
+
+        Returns:
+            Dictionary with keys: total_gb, used_gb, available_gb, percent_used
+
+        Raises:
+            SeedboxError: If the output can't be parsed
+        """
         lines = stdout.strip().split('\n')
         if len(lines) < 2:
             raise SeedboxError("Unexpected df output")
@@ -19,6 +19,8 @@ import requests
 from typing import Optional, Dict, Any, List
 import logging
 
+from utils.api_clients import create_session
+
 
 class TMDBClient:
     """TMDB API client for movie and TV show metadata.
@@ -48,6 +50,7 @@ class TMDBClient:
         self.base_url = "https://api.themoviedb.org/3"
         self.language = language
         self.include_adult = include_adult
+        self.session = create_session()
         self.logger = logging.getLogger(__name__)
 
     def _request(self, method: str, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
@@ -72,7 +75,7 @@ class TMDBClient:
         params['language'] = self.language
 
         try:
-            response = requests.request(method, url, params=params, timeout=10)
+            response = self.session.request(method, url, params=params, timeout=10)
             response.raise_for_status()
             return response.json()
 
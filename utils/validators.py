@@ -15,7 +15,7 @@ import os
 import fcntl
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Dict, Callable, Iterable, Iterator
 from contextlib import contextmanager
 import logging
 
@@ -131,27 +131,109 @@ def verify_file_size_match(
 
     try:
         local_size = os.path.getsize(local_path)
+        return sizes_match(local_size, remote_size, tolerance)
 
-        # Check if sizes match within tolerance
-        if remote_size == 0:
-            return local_size == 0
+    except OSError as e:
+        logger.error(f"Failed to get file size for {local_path}: {e}")
+        return False
 
-        size_diff = abs(local_size - remote_size)
-        relative_diff = size_diff / remote_size
 
-        if relative_diff > tolerance:
-            logger.warning(
-                f"Size mismatch: local={local_size} remote={remote_size} "
-                f"diff={relative_diff*100:.2f}%"
-            )
-            return False
+def scan_files(root: str, extensions: Optional[Iterable[str]] = None) -> Iterator[os.DirEntry]:
+    """Walk a directory tree once with os.scandir and yield its files.
 
-        return True
+    A single pass replaces per-extension ``rglob`` walks, and the returned
+    ``DirEntry`` objects carry cached metadata so callers can read sizes
+    without a separate ``stat`` per file. Symlinked directories are not
+    descended into.
 
-    except OSError as e:
-        logger.error(f"Failed to get file size for {local_path}: {e}")
+    Args:
+        root: Directory to walk
+        extensions: Only yield files with one of these suffixes
+            (e.g., {'.mkv', '.mp4'}; matched case-sensitively)
+
+    Yields:
+        ``os.DirEntry`` for each regular file (symlinks to files included)
+
+    Example:
+        >>> for entry in scan_files('/mnt/media/downloads/_done', {'.mkv'}):
+        ...     print(entry.path, entry.stat().st_size)
+    """
+    if extensions is not None:
+        extensions = frozenset(extensions)
+
+    stack = [root]
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            if extensions is None or os.path.splitext(entry.name)[1] in extensions:
+                                yield entry
+                    except OSError as e:
+                        logger.warning(f"Failed to stat {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to scan {directory}: {e}")
+
+
+def index_local_files(root: str) -> Dict[str, int]:
+    """Walk a directory tree once and record every file's size.
+
+    One ``os.scandir`` pass replaces separate exists/size ``stat`` calls per
+    file, which matters on network filesystems where each stat is a
+    round-trip.
+
+    Args:
+        root: Directory to index
+
+    Returns:
+        Dictionary of {path relative to root: size in bytes}
+
+    Example:
+        >>> index = index_local_files('/mnt/media/downloads/_done')
+        >>> index.get('Movie (2020)/movie.mkv')
+        4294967296
+    """
+    index = {}
+
+    for entry in scan_files(root):
+        try:
+            index[os.path.relpath(entry.path, root)] = entry.stat().st_size
+        except OSError as e:
+            logger.warning(f"Failed to stat {entry.path}: {e}")
+
+    return index
+
+
+def sizes_match(local_size: int, remote_size: int, tolerance: float = 0.01) -> bool:
+    """Check that two file sizes match within tolerance.
+
+    Args:
+        local_size: Size of local file in bytes
+        remote_size: Size of remote file in bytes
+        tolerance: Acceptable size difference as fraction (default: 0.01 = 1%)
+
+    Returns:
+        True if sizes match within tolerance
+    """
+    if remote_size == 0:
+        return local_size == 0
+
+    relative_diff = abs(local_size - remote_size) / remote_size
+
+    if relative_diff > tolerance:
+        logger.warning(
+            f"Size mismatch: local={local_size} remote={remote_size} "
+            f"diff={relative_diff*100:.2f}%"
+        )
         return False
 
+    return True
+
 
 def is_video_file(filename: str) -> bool:
     """Check if a file is a video file based on extension.
@@ -275,6 +357,31 @@ def is_protected_folder(path: str, protected_folders: List[str]) -> bool:
     return False
 
 
+def compile_protected_folders(protected_folders: List[str]) -> Callable[[str], bool]:
+    """Build a fast protected-folder check for use inside loops.
+
+    All patterns are folded into one regex alternation, so each path is
+    scanned once in C instead of once per pattern in Python. Matching is
+    the same as is_protected_folder (pattern anywhere in the path).
+
+    Args:
+        protected_folders: List of protected folder patterns
+
+    Returns:
+        Function taking a path and returning True if it is protected
+
+    Example:
+        >>> is_protected = compile_protected_folders(['/_ready', '/.recycle'])
+        >>> is_protected('/downloads/_ready/file.mkv')
+        True
+    """
+    if not protected_folders:
+        return lambda path: False
+
+    pattern = re.compile('|'.join(re.escape(p) for p in protected_folders))
+    return lambda path: pattern.search(path) is not None
+
+
 def get_video_files(directory: str) -> List[str]:
     """Get all video files in a directory (non-recursive).
 